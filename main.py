@@ -26,6 +26,13 @@ if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
 from contextlib import suppress
+
+try:
+    import uvloop
+except ImportError:
+    # Windows ou uvloop absent : boucle asyncio standard
+    uvloop = None
+
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
@@ -194,6 +201,9 @@ async def shutdown():
         logger.error(f"❌ Erreur lors de l'arrêt: {e}")
 
 if __name__ == "__main__":
+    # Boucle libuv, plus rapide pour le polling et les I/O réseau
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -18,7 +18,7 @@ import logging
 import os
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 import openai
@@ -45,6 +45,11 @@ CACHE_DURATION = 300  # 5 minutes
 RATE_LIMIT_PER_USER = 20  # 20 requêtes par heure
 MAX_RETRIES = 3
 
+# Réponse envoyée quand un utilisateur dépasse son quota
+# Ajouté quand le streaming s'interrompt après une réponse partielle
+STREAM_INTERRUPTED_NOTICE = "\n\n⚠️ Réponse interrompue, renvoie ton message pour la suite."
+RATE_LIMIT_MESSAGE = "🇬🇳 Frère/sœur, tu es trop enthousiaste ❤️\n\nLaisse-moi une petite seconde pour souffler...\n\nReviens dans quelques instants, la famille ChicoBot t'attend ! 🔥🇬🇳"
+
 @dataclass
 class AIResponse:
     """Structure pour les réponses de l'IA."""
@@ -143,6 +148,12 @@ Expliques que la famille ChicoBot travaille pour résoudre le problème.
 Donnes confiance et montre que tout va s'arranger rapidement.
 """
         }
+        
+        # Prompts système complets précalculés une seule fois par contexte
+        self.system_prompt_by_context = {
+            context: self.system_prompt + "\n\n" + context_prompt
+            for context, context_prompt in self.context_prompts.items()
+        }
     
     def _initialize_clients(self):
         """Initialise les clients IA de manière sécurisée."""
@@ -253,6 +264,23 @@ Donnes confiance et montre que tout va s'arranger rapidement.
             logger.error(f"❌ Erreur OpenAI: {e}")
             raise
     
+    async def _stream_openai(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Appelle OpenAI GPT-4o en streaming et produit les morceaux de texte."""
+        stream = await self.openai_client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=messages,
+            max_tokens=1500,
+            temperature=0.9,
+            top_p=0.95,
+            frequency_penalty=0.1,
+            presence_penalty=0.1,
+            stream=True
+        )
+        
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
     async def _call_gemini(self, messages: List[Dict[str, str]]) -> Tuple[str, float]:
         """Appelle Gemini 1.5-flash en fallback."""
         start_time = time.time()
@@ -305,7 +333,7 @@ Donnes confiance et montre que tout va s'arranger rapidement.
             # Vérifier le rate limiting
             if not self._check_rate_limit(user_id):
                 return AIResponse(
-                    content="🇬🇳 Frère/sœur, tu es trop enthousiaste ❤️\n\nLaisse-moi une petite seconde pour souffler...\n\nReviens dans quelques instants, la famille ChicoBot t'attend ! 🔥🇬🇳",
+                    content=RATE_LIMIT_MESSAGE,
                     model_used="rate_limit",
                     response_time=0.1,
                     confidence=0.0
@@ -388,6 +416,100 @@ Donnes confiance et montre que tout va s'arranger rapidement.
                 confidence=0.0
             )
     
+    async def stream_response(
+        self, 
+        user_id: int, 
+        message: str, 
+        context: str = "general",
+        user_info: Optional[Dict] = None
+    ) -> AsyncIterator[str]:
+        """
+        Génère une réponse IA en streaming, morceau par morceau.
+        
+        OpenAI est streamé token par token, avec MAX_RETRIES tentatives tant
+        qu'aucun morceau n'a été envoyé ; une coupure après une réponse partielle
+        se termine par STREAM_INTERRUPTED_NOTICE. Le cache, le rate limiting,
+        Gemini et la réponse par défaut produisent la réponse complète en un seul morceau.
+        
+        Args:
+            user_id: ID de l'utilisateur
+            message: Message de l'utilisateur
+            context: Contexte de la conversation (start, classement, etc.)
+            user_info: Informations sur l'utilisateur (username, gains, etc.)
+        
+        Yields:
+            str: Morceaux successifs de la réponse
+        """
+        start_time = time.time()
+        
+        # Vérifier le rate limiting
+        if not self._check_rate_limit(user_id):
+            yield RATE_LIMIT_MESSAGE
+            return
+        
+        # Vérifier le cache
+        cache_key = self._get_cache_key(user_id, context, message)
+        cached_response = self._get_from_cache(cache_key)
+        if cached_response:
+            yield cached_response.content
+            return
+        
+        messages = self._prepare_messages(user_id, message, context, user_info)
+        
+        # Streaming OpenAI en premier, mêmes tentatives que generate_response
+        last_error = None
+        content = ""
+        for attempt in range(MAX_RETRIES if self.openai_client else 0):
+            parts: List[str] = []
+            try:
+                async for part in self._stream_openai(messages):
+                    parts.append(part)
+                    yield part
+            except Exception as e:
+                last_error = e
+                logger.warning(f"⚠️ Tentative {attempt + 1} streaming OpenAI échouée: {e}")
+                if parts:
+                    # Une partie de la réponse est déjà chez l'utilisateur : on le prévient
+                    # (réponse tronquée, non mise en cache)
+                    yield STREAM_INTERRUPTED_NOTICE
+                    return
+                if attempt < MAX_RETRIES - 1:
+                    await asyncio.sleep(0.5)  # Petite pause entre les tentatives
+                continue
+            
+            content = "".join(parts).strip()
+            break
+        
+        if content:
+            response_time = time.time() - start_time
+            self._store_in_cache(cache_key, AIResponse(
+                content=content,
+                model_used="openai-gpt-4o",
+                response_time=response_time,
+                confidence=0.8
+            ))
+            logger.info(f"🇬🇳 Réponse IA streamée: openai-gpt-4o - {response_time:.2f}s")
+            return
+        
+        # Fallback sur Gemini puis sur la réponse par défaut
+        try:
+            if not self.gemini_client:
+                raise Exception("Client Gemini non disponible")
+            content, _ = await self._call_gemini(messages)
+            model_used = "gemini-1.5-flash"
+        except Exception as e:
+            logger.error(f"❌ Tous les modèles IA échoués: {last_error or e}")
+            content = self._get_fallback_response(context, last_error or e)
+            model_used = "fallback"
+        
+        self._store_in_cache(cache_key, AIResponse(
+            content=content,
+            model_used=model_used,
+            response_time=time.time() - start_time,
+            confidence=0.8 if model_used != "fallback" else 0.3
+        ))
+        yield content
+    
     def _prepare_messages(
         self, 
         user_id: int, 
@@ -397,12 +519,8 @@ Donnes confiance et montre que tout va s'arranger rapidement.
     ) -> List[Dict[str, str]]:
         """Prépare les messages pour l'IA."""
         
-        # Construire le prompt système avec contexte
-        system_prompt = self.system_prompt
-        
-        # Ajouter le contexte spécialisé
-        if context in self.context_prompts:
-            system_prompt += "\n\n" + self.context_prompts[context]
+        # Prompt système précalculé pour le contexte (prompt de base sinon)
+        system_prompt = self.system_prompt_by_context.get(context, self.system_prompt)
         
         # Ajouter les informations utilisateur si disponibles
         if user_info:
@@ -562,6 +680,15 @@ async def generate_ai_response(
     """Fonction utilitaire pour générer une réponse IA."""
     return await ai_manager.generate_response(user_id, message, context, user_info)
 
+def stream_ai_response(
+    user_id: int, 
+    message: str, 
+    context: str = "general",
+    user_info: Optional[Dict] = None
+) -> AsyncIterator[str]:
+    """Fonction utilitaire pour générer une réponse IA en streaming."""
+    return ai_manager.stream_response(user_id, message, context, user_info)
+
 def get_ai_stats() -> Dict[str, Any]:
     """Retourne les statistiques du système IA."""
     return ai_manager.get_stats()
@@ -9,7 +9,7 @@ import asyncio
 import logging
 import json
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import aiohttp
 from dataclasses import dataclass
 import hashlib
@@ -41,9 +41,14 @@ class ChicoPersonalityEngine:
         self.openai_key = os.getenv("OPENAI_PROJECT_API_KEY")
         self.gemini_key = os.getenv("GEMINI_API_KEY")
         
-        # Sessions HTTP
+        # Sessions HTTP (fermées par cleanup() seulement si créées ici)
         self.openai_session = None
         self.gemini_session = None
+        self._owns_sessions = False
+        self._openai_headers = {
+            "Authorization": f"Bearer {self.openai_key}",
+            "Content-Type": "application/json"
+        }
         
         # Cache pour optimiser
         self.response_cache = {}
@@ -118,16 +123,23 @@ La Guinée se soulève ! 🔥🇬🇳
 Pour la Guinée. Pour la famille. Pour l'avenir. ❤️🇬🇳"""
         }
         
-    async def initialize(self):
-        """Initialisation des sessions HTTP"""
+    async def initialize(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialisation des sessions HTTP
+        Si une session est fournie, OpenAI et Gemini la partagent (connexions réutilisées)
+        """
+        
+        if session is not None:
+            self.openai_session = session if self.openai_key else None
+            self.gemini_session = session if self.gemini_key else None
+            self.logger.info("🇬🇳 Moteur Chico initialisé avec la session HTTP partagée")
+            return
+            
+        self._owns_sessions = True
         
         # Session OpenAI
         if self.openai_key:
             self.openai_session = aiohttp.ClientSession(
-                headers={
-                    "Authorization": f"Bearer {self.openai_key}",
-                    "Content-Type": "application/json"
-                },
                 timeout=aiohttp.ClientTimeout(total=30)
             )
             
@@ -256,7 +268,11 @@ Pour la Guinée. Pour la famille. Pour l'avenir. ❤️🇬🇳"""
             "top_p": 0.9
         }
         
-        async with self.openai_session.post("https://api.openai.com/v1/chat/completions", json=payload) as response:
+        async with self.openai_session.post(
+            "https://api.openai.com/v1/chat/completions",
+            json=payload,
+            headers=self._openai_headers
+        ) as response:
             if response.status == 200:
                 data = await response.json()
                 return data["choices"][0]["message"]["content"]
@@ -296,6 +312,14 @@ Pour la Guinée. Pour la famille. Pour l'avenir. ❤️🇬🇳"""
                 self.logger.error(f"Gemini API error: {response.status} - {error_text}")
                 return None
                 
+    def is_cacheable(self, response: ChicoResponse) -> bool:
+        """Vraie réponse IA (ni limitation de débit, ni secours) : peut être resservie"""
+        
+        return (
+            response.model_used not in ("rate_limit", "fallback")
+            and response.text not in self.fallback_responses.values()
+        )
+        
     def _get_fallback_response(self, user_message: str) -> str:
         """Réponse fallback si IA indisponible"""
         
@@ -407,6 +431,11 @@ Pour la Guinée. Pour la famille. Pour l'avenir. ❤️🇬🇳"""
     async def cleanup(self):
         """Nettoyage des ressources"""
         
+        # Session partagée : fermée par son propriétaire
+        if not self._owns_sessions:
+            self.logger.info("🇬🇳 Moteur Chico arrêté proprement")
+            return
+            
         if self.openai_session:
             await self.openai_session.close()
             
@@ -431,6 +460,17 @@ async def chico_respond(user_message: str, user_id: str = "default", context: Di
     Fonction principale - TOUTES les réponses du bot passent par ici
     """
     
+    text, _ = await chico_respond_cacheable(user_message, user_id, context)
+    return text
+
+async def chico_respond_cacheable(
+    user_message: str, user_id: str = "default", context: Dict[str, Any] = None
+) -> Tuple[str, bool]:
+    """
+    Comme chico_respond, avec en plus l'indication que la réponse peut être mise
+    en cache (False pour la limitation de débit et les réponses de secours)
+    """
+    
     # Récupérer le database (nécessaire pour le contexte)
     from .database import DatabaseManager
     database = DatabaseManager()
@@ -445,11 +485,12 @@ async def chico_respond(user_message: str, user_id: str = "default", context: Di
     # Générer la réponse
     response = await engine.generate_response(user_message, user_id, context)
     
-    return response.text
+    return response.text, engine.is_cacheable(response)
 
 # Export pour usage externe
 __all__ = [
     'ChicoPersonalityEngine',
     'get_chico_engine',
-    'chico_respond'
+    'chico_respond',
+    'chico_respond_cacheable'
 ]
@@ -35,6 +35,7 @@ from sqlalchemy import (
     String,
     Table,
     Text,
+    bindparam,
     create_engine,
     delete,
     event,
@@ -167,6 +168,19 @@ class Database:
         self._initialized = True
         logger.info("Base de données initialisée avec succès")
     
+    async def close(self):
+        """Arrête la sauvegarde automatique et libère le pool de connexions."""
+        if not self._initialized:
+            return
+            
+        if self._backup_task:
+            self._backup_task.cancel()
+            self._backup_task = None
+            
+        await self._engine.dispose()
+        self._initialized = False
+        logger.info("Connexions à la base de données fermées")
+    
     async def _create_tables(self):
         """Crée les tables si elles n'existent pas."""
         async with self._engine.begin() as conn:
@@ -379,6 +393,38 @@ class Database:
                 FOREIGN KEY (target_user_id) REFERENCES users (telegram_id)
             )
         """))
+        
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS admins (
+                user_id INTEGER PRIMARY KEY,
+                username VARCHAR(255),
+                joined_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                is_active BOOLEAN DEFAULT TRUE
+            )
+        """))
+        
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS admin_commissions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                admin_id INTEGER NOT NULL,
+                amount DECIMAL(20, 8) NOT NULL,
+                period DATETIME NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (admin_id) REFERENCES users (telegram_id)
+            )
+        """))
+        
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS bounty_submissions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                content TEXT,
+                status VARCHAR(20) NOT NULL,
+                amount DECIMAL(20, 8),
+                submitted_at REAL NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """))
     
     async def _run_migrations(self, conn):
         """Exécute les migrations de base de données si nécessaire."""
@@ -618,6 +664,109 @@ class Database:
                 "updated_at": task.updated_at.isoformat() if task.updated_at else None
             } for task in tasks]
     
+    # Méthodes pour les admins
+    async def add_admin(self, admin_data: Dict[str, Any]) -> None:
+        """
+        Enregistre un admin (ou le réactive s'il existe déjà, sans toucher à joined_at).
+        joined_at est lié en DateTime : même format que celui relu par get_all_admins_with_stats.
+        """
+        async with self.session_scope() as session:
+            await session.execute(
+                text("""
+                    INSERT INTO admins (user_id, username, joined_at, is_active)
+                    VALUES (:user_id, :username, :joined_at, :is_active)
+                    ON CONFLICT (user_id) DO UPDATE SET
+                        username = excluded.username,
+                        is_active = excluded.is_active
+                """).bindparams(bindparam("joined_at", type_=DateTime)),
+                {
+                    "user_id": admin_data["user_id"],
+                    "username": admin_data["username"],
+                    "joined_at": admin_data.get("joined_at") or datetime.datetime.now(),
+                    "is_active": admin_data.get("is_active", True)
+                }
+            )
+    
+    async def add_admin_commissions_bulk(self, rows: List[Tuple[int, float, datetime.datetime]]) -> int:
+        """
+        Enregistre les commissions de plusieurs admins en une seule transaction.
+        rows : liste de (admin_id, amount, period), insérée via executemany.
+        """
+        if not rows:
+            return 0
+            
+        async with self.session_scope() as session:
+            await session.execute(
+                text("""
+                    INSERT INTO admin_commissions (admin_id, amount, period)
+                    VALUES (:admin_id, :amount, :period)
+                """),
+                [
+                    {"admin_id": admin_id, "amount": amount, "period": period}
+                    for admin_id, amount, period in rows
+                ]
+            )
+        
+        return len(rows)
+    
+    async def log_bounty_submissions_bulk(
+        self, rows: List[Tuple[str, str, str, Optional[float], float]]
+    ) -> int:
+        """
+        Enregistre plusieurs soumissions de bounty en une seule transaction.
+        rows : liste de (url, content, status, amount, submitted_at epoch), insérée via executemany.
+        """
+        if not rows:
+            return 0
+            
+        async with self.session_scope() as session:
+            await session.execute(
+                text("""
+                    INSERT INTO bounty_submissions (url, content, status, amount, submitted_at)
+                    VALUES (:url, :content, :status, :amount, :submitted_at)
+                """),
+                [
+                    {
+                        "url": url,
+                        "content": content,
+                        "status": status,
+                        "amount": amount,
+                        "submitted_at": submitted_at
+                    }
+                    for url, content, status, amount, submitted_at in rows
+                ]
+            )
+        
+        return len(rows)
+    
+    async def get_all_admins_with_stats(self) -> List[Dict[str, Any]]:
+        """
+        Récupère les admins actifs et leurs statistiques de commissions en une seule requête.
+        Les types des colonnes sont déclarés : SQLite renvoie sinon les dates en chaînes.
+        last_commission_date est la date d'enregistrement de la dernière commission
+        (created_at), pas la période à laquelle elle se rapporte.
+        """
+        async with self.session_scope() as session:
+            result = await session.execute(text("""
+                SELECT
+                    a.user_id,
+                    a.username,
+                    a.joined_at,
+                    COALESCE(SUM(c.amount), 0) AS total_commissions,
+                    MAX(c.created_at) AS last_commission_date
+                FROM admins a
+                LEFT JOIN admin_commissions c ON c.admin_id = a.user_id
+                WHERE a.is_active
+                GROUP BY a.user_id, a.username, a.joined_at
+            """).columns(
+                user_id=Integer,
+                username=String,
+                joined_at=DateTime,
+                total_commissions=Float,
+                last_commission_date=DateTime
+            ))
+            return [dict(row) for row in result.mappings().all()]
+    
     # Méthodes de sauvegarde
     async def _backup_scheduler(self):
         """Planifie les sauvegardes automatiques de la base de données."""
@@ -632,8 +781,8 @@ class Database:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = os.path.join(DB_BACKUP_DIR, f"chicobot_backup_{timestamp}.db")
             
-            # Copier le fichier de base de données
-            shutil.copy2(DB_FILE, backup_file)
+            # Copier le fichier de base de données hors de la boucle d'événements
+            await asyncio.to_thread(shutil.copy2, DB_FILE, backup_file)
             
             logger.info(f"Sauvegarde créée: {backup_file}")
             return backup_file
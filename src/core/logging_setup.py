@@ -1,14 +1,16 @@
-""
+"""
 Logging setup for ChicoBot.
 
 This module configures logging for the application with appropriate handlers,
 formatters, and log levels. It provides a consistent way to log messages
 throughout the application.
 """
+import atexit
 import logging
+import queue
 import sys
 import os
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional, Dict, Any
 
 from config import get_settings, LogMessages
@@ -34,6 +36,17 @@ LOG_LEVELS = {
     'CRITICAL': logging.CRITICAL,
 }
 
+# Active listeners per logger name: formatting and I/O run in a background thread
+_queue_listeners: Dict[str, QueueListener] = {}
+
+def _stop_queue_listeners() -> None:
+    """Stop every background listener, flushing pending records."""
+    for listener in _queue_listeners.values():
+        listener.stop()
+    _queue_listeners.clear()
+
+atexit.register(_stop_queue_listeners)
+
 def get_log_level() -> int:
     """Get the logging level from settings.
     
@@ -49,9 +62,13 @@ def setup_logging(
     max_bytes: int = 10 * 1024 * 1024,  # 10 MB
     backup_count: int = 5,
     json_format: bool = False
-) -> None:
+) -> logging.Logger:
     """Set up logging configuration.
     
+    Records are pushed onto a queue by a ``QueueHandler`` and the real
+    console/file handlers run in a ``QueueListener`` background thread, so
+    formatting and I/O stay off the event loop.
+    
     Args:
         name: The name of the logger.
         log_level: The logging level. If None, uses the level from settings.
@@ -59,12 +76,18 @@ def setup_logging(
         max_bytes: Maximum size of the log file before rotation.
         backup_count: Number of backup log files to keep.
         json_format: Whether to use JSON format for logs.
+        
+    Returns:
+        logging.Logger: The configured logger instance.
     """
     # Get the root logger
     logger = logging.getLogger(name)
     
     # Clear any existing handlers
     logger.handlers = []
+    previous_listener = _queue_listeners.pop(name, None)
+    if previous_listener is not None:
+        previous_listener.stop()
     
     # Set the log level
     if log_level is None:
@@ -81,7 +104,7 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # Create file handler if log file is specified
     if log_file:
@@ -97,7 +120,14 @@ def setup_logging(
         file_handler.setLevel(log_level)
         file_formatter = logging.Formatter(FILE_FORMAT)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Route records through a queue consumed by a background thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listeners[name] = listener
     
     # Configure third-party loggers
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -108,6 +138,8 @@ def setup_logging(
     
     # Log the configuration
     logger.info("Logging configured at level %s", logging.getLevelName(log_level))
+    
+    return logger
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get a logger with the given name.
@@ -0,0 +1,215 @@
+"""
+Cache de réponses Chico - Évite un aller-retour IA pour les messages répétés
+Clé exacte : hash blake2b du texte normalisé et de l'utilisateur, avec expiration
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Tuple
+
+from .logging_setup import setup_logging
+
+logger = setup_logging("response_cache")
+
+# Durée de vie d'une réponse en cache et taille maximale du cache
+CACHE_TTL_SECONDS = 300
+CACHE_MAX_ENTRIES = 1024
+
+class ResponseCache:
+    """
+    Cache LRU (texte normalisé, utilisateur) -> réponse avec TTL
+    Les réponses dépendent du contexte de l'utilisateur (solde, niveau),
+    la clé inclut donc toujours l'identifiant utilisateur
+    """
+    
+    def __init__(self, ttl: float = CACHE_TTL_SECONDS, max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+        
+        # Statistiques
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(text: str, user_id: str) -> bytes:
+        """Clé de cache : blake2b du texte normalisé et de l'utilisateur"""
+        
+        normalized = text.strip().lower()
+        return hashlib.blake2b(f"{user_id}:{normalized}".encode(), digest_size=16).digest()
+    
+    def get(self, key: bytes) -> Optional[str]:
+        """Récupérer une réponse encore valide"""
+        
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, response = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+    
+    def set(self, key: bytes, response: str):
+        """Mettre une réponse en cache en évinçant la plus ancienne si plein"""
+        
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Vider le cache"""
+        
+        self._entries.clear()
+        logger.info("🧹 Cache de réponses vidé")
+    
+    def get_stats(self) -> dict:
+        """Statistiques du cache"""
+        
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "ttl_seconds": self.ttl
+        }
+
+# Instance globale
+response_cache = ResponseCache()
+
+async def cached_respond(text: str, user_id: str, generator: Callable[[], Awaitable[Tuple[str, bool]]]) -> str:
+    """
+    Retourne la réponse en cache pour (text, user_id), sinon appelle
+    generator() -> (réponse, mémorisable) ; seules les réponses mémorisables
+    sont mises en cache (pas la limitation de débit ni les réponses de secours)
+    """
+    
+    if not text:
+        response, _ = await generator()
+        return response
+    
+    key = ResponseCache.make_key(text, user_id)
+    response = response_cache.get(key)
+    if response is not None:
+        return response
+    
+    response, cacheable = await generator()
+    if cacheable:
+        response_cache.set(key, response)
+    return response
+
+# Export pour usage externe
+__all__ = [
+    'ResponseCache',
+    'response_cache',
+    'cached_respond'
+]
+
+# Tests unitaires
+if __name__ == "__main__":
+    import unittest
+    from unittest import IsolatedAsyncioTestCase
+    from unittest.mock import patch
+    
+    class TestResponseCache(unittest.TestCase):
+        """Tests du cache LRU avec expiration."""
+        
+        def test_hit_and_miss(self):
+            """Une réponse en cache est retrouvée, une clé inconnue ne l'est pas."""
+            cache = ResponseCache()
+            key = ResponseCache.make_key("salut", "1")
+            
+            self.assertIsNone(cache.get(key))
+            cache.set(key, "réponse")
+            self.assertEqual(cache.get(key), "réponse")
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+        
+        def test_expiry(self):
+            """Une réponse expirée n'est plus servie et quitte le cache."""
+            cache = ResponseCache(ttl=10)
+            key = ResponseCache.make_key("salut", "1")
+            
+            with patch("time.monotonic", return_value=1000.0):
+                cache.set(key, "réponse")
+            with patch("time.monotonic", return_value=1009.9):
+                self.assertEqual(cache.get(key), "réponse")
+            with patch("time.monotonic", return_value=1010.0):
+                self.assertIsNone(cache.get(key))
+            self.assertEqual(cache.get_stats()["size"], 0)
+        
+        def test_lru_eviction(self):
+            """Plein, le cache évince l'entrée la moins récemment utilisée."""
+            cache = ResponseCache(max_entries=2)
+            key_a, key_b, key_c = (ResponseCache.make_key(t, "1") for t in ("a", "b", "c"))
+            
+            cache.set(key_a, "A")
+            cache.set(key_b, "B")
+            cache.get(key_a)  # a devient la plus récente
+            cache.set(key_c, "C")
+            
+            self.assertEqual(cache.get(key_a), "A")
+            self.assertIsNone(cache.get(key_b))
+            self.assertEqual(cache.get(key_c), "C")
+        
+        def test_key_normalization_and_user_isolation(self):
+            """Casse et espaces ignorés ; deux utilisateurs n'ont jamais la même clé."""
+            self.assertEqual(
+                ResponseCache.make_key("  Salut ", "1"),
+                ResponseCache.make_key("salut", "1")
+            )
+            self.assertNotEqual(
+                ResponseCache.make_key("salut", "1"),
+                ResponseCache.make_key("salut", "2")
+            )
+    
+    class TestCachedRespond(IsolatedAsyncioTestCase):
+        """Tests de cached_respond."""
+        
+        def setUp(self):
+            response_cache.clear()
+        
+        async def test_generator_called_once_per_user(self):
+            """Le générateur n'est rappelé que pour un autre utilisateur."""
+            calls = []
+            
+            async def generator(user_id):
+                calls.append(user_id)
+                return f"réponse {user_id}", True
+            
+            self.assertEqual(await cached_respond("salut", "1", lambda: generator("1")), "réponse 1")
+            self.assertEqual(await cached_respond("Salut", "1", lambda: generator("1")), "réponse 1")
+            self.assertEqual(await cached_respond("salut", "2", lambda: generator("2")), "réponse 2")
+            self.assertEqual(calls, ["1", "2"])
+        
+        async def test_empty_text_not_cached(self):
+            """Un message vide passe toujours par le générateur."""
+            calls = []
+            
+            async def generator():
+                calls.append(None)
+                return "réponse", True
+            
+            await cached_respond("", "1", generator)
+            await cached_respond("", "1", generator)
+            self.assertEqual(len(calls), 2)
+        
+        async def test_non_cacheable_not_stored(self):
+            """Une réponse de secours ou de limitation de débit n'est pas resservie."""
+            replies = iter([("Doucement frère", False), ("vraie réponse", True)])
+            
+            async def generator():
+                return next(replies)
+            
+            self.assertEqual(await cached_respond("salut", "1", generator), "Doucement frère")
+            self.assertEqual(await cached_respond("salut", "1", generator), "vraie réponse")
+            self.assertEqual(await cached_respond("salut", "1", generator), "vraie réponse")
+    
+    unittest.main()
@@ -13,13 +13,16 @@ Fonctionnement :
 
 import asyncio
 import logging
-from typing import Dict, Optional
+import re
+import time
+from typing import AsyncIterator, Dict, List, Optional
 
 from aiogram import Router, F, types
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.filters import Command
 from aiogram.types import Message, CallbackQuery
 
-from core.ai_response import generate_ai_response
+from core.ai_response import generate_ai_response, stream_ai_response
 from core.database import database
 from core.logging_setup import get_logger
 
@@ -43,6 +46,32 @@ EXCLUDED_COMMANDS = {
     "/help"
 }
 
+# Réponses de secours statiques : aucun appel IA supplémentaire quand le système est dégradé
+FALLBACK_MSG = (
+    "🇬🇳 Frère/sœur, j'ai un petit problème technique ❤️\n\n"
+    "🔄 Donne-moi une seconde et je reviens mieux que jamais !\n\n"
+    "🚀 La famille ChicoBot est toujours là pour toi 🔥🇬🇳"
+)
+FALLBACK_CB_MSG = (
+    "🇬🇳 Frère/sœur, j'ai un petit problème technique ❤️\n\n"
+    "🔄 Réessaie dans quelques instants !\n\n"
+    "🚀 La famille ChicoBot t'attend ! 🔥🇬🇳"
+)
+
+# Contextes dont la réponse IA s'appuie sur les gains/classement de l'utilisateur
+_NEEDS_STATS = frozenset({"trading", "bounty", "investment", "money", "classement", "stats"})
+
+# Lectures de stats en cours par utilisateur (coalescence des requêtes)
+_inflight_user_stats: Dict[int, asyncio.Future] = {}
+
+# Streaming : curseur affiché pendant la génération et délai minimal entre
+# deux éditions (Telegram limite à ~1 édition par seconde et par chat)
+STREAM_CURSOR = "▍"
+STREAM_EDIT_INTERVAL = 1.0
+
+# Longueur maximale d'un message Telegram (caractères)
+TELEGRAM_MESSAGE_LIMIT = 4096
+
 @ai_router.message()
 async def handle_general_messages(message: types.Message):
     """
@@ -50,53 +79,46 @@ async def handle_general_messages(message: types.Message):
     Génère des réponses IA avec ton guinéen fraternel.
     """
     try:
-        user_id = message.from_user.id
-        username = message.from_user.username or "ami"
+        from_user = message.from_user
+        user_id = from_user.id
+        username = from_user.username or "ami"
         message_text = message.text or message.caption or ""
         
-        logger.info(f"🇬🇳 Message de @{username}: {message_text[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"🇬🇳 Message de @{username}: {message_text[:50]}...")
         
         # Ignorer les commandes déjà gérées spécifiquement
         if message_text.startswith('/') and message_text.split()[0] in EXCLUDED_COMMANDS:
             return
         
-        # Récupérer les infos utilisateur pour personnalisation
-        user_info = await get_user_info_for_ai(user_id, username)
-        
         # Déterminer le contexte en fonction du message
         context = determine_message_context(message_text)
         
-        # Générer la réponse IA avec ton guinéen
-        ai_response = await generate_ai_response(
-            user_id=user_id,
-            message=message_text,
-            context=context,
-            user_info=user_info
-        )
+        # Récupérer les stats utilisateur seulement si le contexte les utilise
+        if context in _NEEDS_STATS:
+            user_info = await get_user_info_for_ai(user_id, username)
+        else:
+            user_info = {"username": username, "country": "GN"}
         
-        # Envoyer la réponse IA
-        await message.answer(ai_response.content, parse_mode="Markdown")
+        # Générer et envoyer la réponse IA en streaming
+        await answer_streaming(
+            message,
+            stream_ai_response(
+                user_id=user_id,
+                message=message_text,
+                context=context,
+                user_info=user_info
+            )
+        )
         
-        logger.info(f"🇬🇳 Réponse IA envoyée à @{username} ({ai_response.model_used})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"🇬🇳 Réponse IA streamée à @{username}")
         
     except Exception as e:
         logger.error(f"🇬🇳 Erreur handler message général: {e}")
         
-        # Réponse IA d'erreur
-        try:
-            error_response = await generate_ai_response(
-                user_id=message.from_user.id,
-                message=message_text,
-                context="error"
-            )
-            await message.answer(error_response.content, parse_mode="Markdown")
-        except:
-            # Fallback ultime
-            await message.answer(
-                "🇬🇳 Frère/sœur, j'ai un petit problème technique ❤️\n\n"
-                "🔄 Donne-moi une seconde et je reviens mieux que jamais !\n\n"
-                "🚀 La famille ChicoBot est toujours là pour toi 🔥🇬🇳"
-            )
+        # Fallback statique, sans nouvel appel IA
+        await message.answer(FALLBACK_MSG, parse_mode="Markdown")
 
 @ai_router.callback_query()
 async def handle_general_callbacks(callback: CallbackQuery):
@@ -105,11 +127,13 @@ async def handle_general_callbacks(callback: CallbackQuery):
     Génère des réponses IA avec ton guinéen fraternel.
     """
     try:
-        user_id = callback.from_user.id
-        username = callback.from_user.username or "ami"
+        from_user = callback.from_user
+        user_id = from_user.id
+        username = from_user.username or "ami"
         callback_data = callback.data
         
-        logger.info(f"🇬🇳 Callback de @{username}: {callback_data}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"🇬🇳 Callback de @{username}: {callback_data}")
         
         # Callbacks déjà gérés spécifiquement - ignorer
         excluded_callbacks = {
@@ -153,28 +177,86 @@ async def handle_general_callbacks(callback: CallbackQuery):
         await callback.message.answer(ai_response.content, parse_mode="Markdown")
         await callback.answer()
         
-        logger.info(f"🇬🇳 Réponse IA callback envoyée à @{username}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"🇬🇳 Réponse IA callback envoyée à @{username}")
         
     except Exception as e:
         logger.error(f"🇬🇳 Erreur handler callback général: {e}")
         
-        # Réponse IA d'erreur
+        # Fallback statique, sans nouvel appel IA
+        await callback.answer("⚠️ Erreur technique", show_alert=True)
+        await callback.message.answer(FALLBACK_CB_MSG, parse_mode="Markdown")
+
+async def answer_streaming(message: types.Message, chunks: AsyncIterator[str]) -> None:
+    """
+    Envoie une réponse IA au fil de sa génération.
+    
+    Un message avec curseur est envoyé tout de suite puis édité au plus une
+    fois par STREAM_EDIT_INTERVAL ; l'édition finale retire le curseur et
+    applique le Markdown. Au-delà de TELEGRAM_MESSAGE_LIMIT caractères, la
+    suite part dans des messages supplémentaires.
+    """
+    sent = await message.answer(STREAM_CURSOR)
+    parts: List[str] = []
+    last_edit = time.monotonic()
+    
+    try:
+        async for chunk in chunks:
+            parts.append(chunk)
+            now = time.monotonic()
+            if now - last_edit >= STREAM_EDIT_INTERVAL:
+                last_edit = now
+                try:
+                    # Sans Markdown : le texte partiel peut contenir des balises non fermées.
+                    # parse_mode=None explicite, sinon le parse_mode par défaut du Bot s'applique.
+                    # Au-delà d'un message, seul le début est affiché jusqu'à la fin
+                    partial = "".join(parts)[:TELEGRAM_MESSAGE_LIMIT - len(STREAM_CURSOR)]
+                    await sent.edit_text(partial + STREAM_CURSOR, parse_mode=None)
+                except TelegramBadRequest:
+                    pass
+    except Exception as e:
+        # Le message curseur est finalisé avec ce qui a été reçu (ou le secours)
+        logger.error(f"🇬🇳 Erreur streaming réponse IA: {e}")
+    
+    content = "".join(parts) or FALLBACK_MSG
+    pieces = [
+        content[start:start + TELEGRAM_MESSAGE_LIMIT]
+        for start in range(0, len(content), TELEGRAM_MESSAGE_LIMIT)
+    ]
+    
+    # Premier morceau : édition du message curseur, jamais laissé en l'état
+    try:
+        await sent.edit_text(pieces[0], parse_mode="Markdown")
+    except TelegramBadRequest:
         try:
-            error_response = await generate_ai_response(
-                user_id=callback.from_user.id,
-                message=f"Callback: {callback.data}",
-                context="error"
-            )
-            await callback.message.answer(error_response.content, parse_mode="Markdown")
-            await callback.answer()
-        except:
-            # Fallback ultime
-            await callback.answer("⚠️ Erreur technique", show_alert=True)
-            await callback.message.answer(
-                "🇬🇳 Frère/sœur, j'ai un petit problème technique ❤️\n\n"
-                "🔄 Réessaie dans quelques instants !\n\n"
-                "🚀 La famille ChicoBot t'attend ! 🔥🇬🇳"
-            )
+            await sent.edit_text(pieces[0], parse_mode=None)
+        except TelegramBadRequest as e:
+            logger.error(f"🇬🇳 Édition finale impossible: {e}")
+            await sent.edit_text(FALLBACK_MSG, parse_mode=None)
+            return
+    
+    # Suite d'une réponse trop longue : messages supplémentaires
+    for piece in pieces[1:]:
+        try:
+            await message.answer(piece, parse_mode="Markdown")
+        except TelegramBadRequest:
+            await message.answer(piece, parse_mode=None)
+
+async def _get_user_stats_coalesced(user_id: int) -> Optional[Dict]:
+    """
+    Récupère les stats d'un utilisateur en partageant la lecture déjà en cours.
+    
+    Plusieurs messages simultanés du même utilisateur attendent la même tâche
+    au lieu de lancer chacun leur requête en base de données.
+    """
+    task = _inflight_user_stats.get(user_id)
+    if task is None:
+        task = asyncio.ensure_future(database.get_user_stats(user_id))
+        _inflight_user_stats[user_id] = task
+        task.add_done_callback(lambda _: _inflight_user_stats.pop(user_id, None))
+    
+    # shield : l'annulation d'un appelant n'annule pas la lecture des autres
+    return await asyncio.shield(task)
 
 async def get_user_info_for_ai(user_id: int, username: str) -> Dict:
     """
@@ -182,7 +264,7 @@ async def get_user_info_for_ai(user_id: int, username: str) -> Dict:
     """
     try:
         # Récupérer les stats utilisateur depuis la base de données
-        user_stats = await database.get_user_stats(user_id)
+        user_stats = await _get_user_stats_coalesced(user_id)
         
         if user_stats:
             return {
@@ -220,43 +302,39 @@ async def get_user_info_for_ai(user_id: int, username: str) -> Dict:
             "next_milestone": 500
         }
 
+# Mots-clés par contexte, dans l'ordre de priorité de détection
+MESSAGE_CONTEXT_KEYWORDS = (
+    ("trading", ("trading", "trade", "xauusd", "or", "marché")),
+    ("bounty", ("bounty", "bounties", "tâche", "task", "job")),
+    ("investment", ("invest", "investissement", "portfolio", "rendement")),
+    ("concours", ("concours", "compétition", "gagner", "prix")),
+    ("support", ("aide", "help", "support", "problème", "erreur")),
+    ("classement", ("classement", "top", "rang", "meilleur")),
+    ("greeting", ("salut", "bonjour", "yo", "wsh", "cc")),
+    ("gratitude", ("merci", "thank", "cool", "génial", "super")),
+    ("creators", ("chico", "oumar", "sow", "problematique", "ibrahima", "barry")),
+    ("guinea", ("kamsar", "conakry", "guinée", "guinea")),
+    ("money", ("argent", "money", "gains", "revenus", "richesse")),
+    ("tutorial", ("comment", "comment marche", "comment faire", "how to")),
+    ("explanation", ("pourquoi", "why", "raison")),
+    ("information", ("qui", "who", "quel", "quelle")),
+)
+
+# Une regex insensible à la casse par contexte, compilée une seule fois :
+# le message est parcouru tel quel, sans copie en minuscules
+_MESSAGE_CONTEXT_PATTERNS = tuple(
+    (context, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for context, keywords in MESSAGE_CONTEXT_KEYWORDS
+)
+
 def determine_message_context(message_text: str) -> str:
     """
     Détermine le contexte du message pour l'IA.
     """
-    message_lower = message_text.lower()
-    
-    # Contextes spécifiques selon le contenu
-    if any(word in message_lower for word in ["trading", "trade", "xauusd", "or", "marché"]):
-        return "trading"
-    elif any(word in message_lower for word in ["bounty", "bounties", "tâche", "task", "job"]):
-        return "bounty"
-    elif any(word in message_lower for word in ["invest", "investissement", "portfolio", "rendement"]):
-        return "investment"
-    elif any(word in message_lower for word in ["concours", "compétition", "gagner", "prix"]):
-        return "concours"
-    elif any(word in message_lower for word in ["aide", "help", "support", "problème", "erreur"]):
-        return "support"
-    elif any(word in message_lower for word in ["classement", "top", "rang", "meilleur"]):
-        return "classement"
-    elif any(word in message_lower for word in ["salut", "bonjour", "yo", "wsh", "cc"]):
-        return "greeting"
-    elif any(word in message_lower for word in ["merci", "thank", "cool", "génial", "super"]):
-        return "gratitude"
-    elif any(word in message_lower for word in ["chico", "oumar", "sow", "problematique", "ibrahima", "barry"]):
-        return "creators"
-    elif any(word in message_lower for word in ["kamsar", "conakry", "guinée", "guinea"]):
-        return "guinea"
-    elif any(word in message_lower for word in ["argent", "money", "gains", "revenus", "richesse"]):
-        return "money"
-    elif any(word in message_lower for word in ["comment", "comment marche", "comment faire", "how to"]):
-        return "tutorial"
-    elif any(word in message_lower for word in ["pourquoi", "why", "raison"]):
-        return "explanation"
-    elif any(word in message_lower for word in ["qui", "who", "quel", "quelle"]):
-        return "information"
-    else:
-        return "general"
+    for context, pattern in _MESSAGE_CONTEXT_PATTERNS:
+        if pattern.search(message_text):
+            return context
+    return "general"
 
 def determine_callback_context(callback_data: str) -> str:
     """
@@ -289,137 +367,51 @@ def determine_callback_context(callback_data: str) -> str:
 
 # Handlers pour les commandes restantes avec IA
 
-@ai_router.message(Command("trading"))
-async def handle_trading_command(message: types.Message):
-    """Gère la commande /trading avec IA."""
-    try:
-        user_id = message.from_user.id
-        username = message.from_user.username or "ami"
-        
-        # Récupérer les infos utilisateur
-        user_info = await get_user_info_for_ai(user_id, username)
-        
-        # Générer la réponse IA spécialisée trading
-        ai_response = await generate_ai_response(
-            user_id=user_id,
-            message="/trading",
-            context="trading",
-            user_info=user_info
-        )
-        
-        await message.answer(ai_response.content, parse_mode="Markdown")
-        
-        logger.info(f"🇬🇳 Commande /trading pour @{username}")
-        
-    except Exception as e:
-        logger.error(f"🇬🇳 Erreur commande /trading: {e}")
-        
-        error_response = await generate_ai_response(
-            user_id=message.from_user.id,
-            message="/trading",
-            context="error"
-        )
-        
-        await message.answer(error_response.content, parse_mode="Markdown")
-
-@ai_router.message(Command("invest"))
-async def handle_invest_command(message: types.Message):
-    """Gère la commande /invest avec IA."""
-    try:
-        user_id = message.from_user.id
-        username = message.from_user.username or "ami"
-        
-        # Récupérer les infos utilisateur
-        user_info = await get_user_info_for_ai(user_id, username)
-        
-        # Générer la réponse IA spécialisée investissement
-        ai_response = await generate_ai_response(
-            user_id=user_id,
-            message="/invest",
-            context="investment",
-            user_info=user_info
-        )
-        
-        await message.answer(ai_response.content, parse_mode="Markdown")
-        
-        logger.info(f"🇬🇳 Commande /invest pour @{username}")
-        
-    except Exception as e:
-        logger.error(f"🇬🇳 Erreur commande /invest: {e}")
-        
-        error_response = await generate_ai_response(
-            user_id=message.from_user.id,
-            message="/invest",
-            context="error"
-        )
-        
-        await message.answer(error_response.content, parse_mode="Markdown")
+# Commandes gérées par l'IA : (commande, contexte)
+AI_COMMANDS = (
+    ("trading", "trading"),
+    ("invest", "investment"),
+    ("stats", "stats"),
+    ("help", "help"),
+)
 
-@ai_router.message(Command("stats"))
-async def handle_stats_command(message: types.Message):
-    """Gère la commande /stats avec IA."""
-    try:
-        user_id = message.from_user.id
-        username = message.from_user.username or "ami"
-        
-        # Récupérer les infos utilisateur
-        user_info = await get_user_info_for_ai(user_id, username)
-        
-        # Générer la réponse IA spécialisée stats
-        ai_response = await generate_ai_response(
-            user_id=user_id,
-            message="/stats",
-            context="stats",
-            user_info=user_info
-        )
-        
-        await message.answer(ai_response.content, parse_mode="Markdown")
-        
-        logger.info(f"🇬🇳 Commande /stats pour @{username}")
-        
-    except Exception as e:
-        logger.error(f"🇬🇳 Erreur commande /stats: {e}")
-        
-        error_response = await generate_ai_response(
-            user_id=message.from_user.id,
-            message="/stats",
-            context="error"
-        )
-        
-        await message.answer(error_response.content, parse_mode="Markdown")
+def _make_command_handler(command: str, context: str):
+    """Crée le handler IA d'une commande pour un contexte donné."""
+    command_text = f"/{command}"
+    
+    async def handle_command(message: types.Message):
+        try:
+            from_user = message.from_user
+            user_id = from_user.id
+            username = from_user.username or "ami"
+            
+            # Récupérer les infos utilisateur
+            user_info = await get_user_info_for_ai(user_id, username)
+            
+            # Générer la réponse IA spécialisée
+            ai_response = await generate_ai_response(
+                user_id=user_id,
+                message=command_text,
+                context=context,
+                user_info=user_info
+            )
+            
+            await message.answer(ai_response.content, parse_mode="Markdown")
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"🇬🇳 Commande {command_text} pour @{username}")
+            
+        except Exception as e:
+            logger.error(f"🇬🇳 Erreur commande {command_text}: {e}")
+            
+            await message.answer(FALLBACK_MSG, parse_mode="Markdown")
+    
+    handle_command.__name__ = f"handle_{command}_command"
+    handle_command.__doc__ = f"Gère la commande {command_text} avec IA."
+    return handle_command
 
-@ai_router.message(Command("help"))
-async def handle_help_command(message: types.Message):
-    """Gère la commande /help avec IA."""
-    try:
-        user_id = message.from_user.id
-        username = message.from_user.username or "ami"
-        
-        # Récupérer les infos utilisateur
-        user_info = await get_user_info_for_ai(user_id, username)
-        
-        # Générer la réponse IA spécialisée aide
-        ai_response = await generate_ai_response(
-            user_id=user_id,
-            message="/help",
-            context="help",
-            user_info=user_info
-        )
-        
-        await message.answer(ai_response.content, parse_mode="Markdown")
-        
-        logger.info(f"🇬🇳 Commande /help pour @{username}")
-        
-    except Exception as e:
-        logger.error(f"🇬🇳 Erreur commande /help: {e}")
-        
-        error_response = await generate_ai_response(
-            user_id=message.from_user.id,
-            message="/help",
-            context="error"
-        )
-        
-        await message.answer(error_response.content, parse_mode="Markdown")
+for _command, _context in AI_COMMANDS:
+    ai_router.message(Command(_command))(_make_command_handler(_command, _context))
 
 # Fonctions utilitaires
 
@@ -434,6 +426,7 @@ async def register_ai_handlers(dispatcher):
 if __name__ == "__main__":
     import unittest
     from unittest import IsolatedAsyncioTestCase
+    from unittest.mock import patch
     
     class TestAIHandler(IsolatedAsyncioTestCase):
         """Tests pour le handler IA."""
@@ -481,6 +474,116 @@ if __name__ == "__main__":
             self.assertEqual(user_info["country"], "GN")
             
             print("\n👤 Récupération infos utilisateur fonctionne")
+        
+        async def test_user_stats_coalesced(self):
+            """Teste le partage d'une lecture de stats entre appels simultanés."""
+            
+            calls = []
+            release = asyncio.Event()
+            
+            async def slow_stats(user_id):
+                calls.append(user_id)
+                await release.wait()
+                return {"user_id": user_id}
+            
+            with patch.object(database, "get_user_stats", slow_stats):
+                first = asyncio.create_task(_get_user_stats_coalesced(1))
+                second = asyncio.create_task(_get_user_stats_coalesced(1))
+                other = asyncio.create_task(_get_user_stats_coalesced(2))
+                await asyncio.sleep(0)
+                release.set()
+                results = await asyncio.gather(first, second, other)
+                
+                # Une seule lecture par utilisateur, même résultat partagé
+                self.assertEqual(sorted(calls), [1, 2])
+                self.assertIs(results[0], results[1])
+                self.assertEqual(results[2], {"user_id": 2})
+                
+                # Lecture terminée : l'appel suivant relit la base
+                self.assertNotIn(1, _inflight_user_stats)
+                await _get_user_stats_coalesced(1)
+                self.assertEqual(calls.count(1), 2)
+            
+            print("\n🔗 Partage des lectures de stats fonctionne")
+        
+        async def test_user_stats_cancel_does_not_cancel_others(self):
+            """Teste qu'un appelant annulé n'annule pas la lecture partagée."""
+            
+            release = asyncio.Event()
+            
+            async def slow_stats(user_id):
+                await release.wait()
+                return {"user_id": user_id}
+            
+            with patch.object(database, "get_user_stats", slow_stats):
+                cancelled = asyncio.create_task(_get_user_stats_coalesced(3))
+                waiting = asyncio.create_task(_get_user_stats_coalesced(3))
+                await asyncio.sleep(0)
+                cancelled.cancel()
+                release.set()
+                
+                self.assertEqual(await waiting, {"user_id": 3})
+                with self.assertRaises(asyncio.CancelledError):
+                    await cancelled
+    
+    class _FakeSent:
+        """Message curseur factice : enregistre les éditions, refuse celles en erreur."""
+        
+        def __init__(self, reject=lambda text, parse_mode: False):
+            self.reject = reject
+            self.edits: List[tuple] = []
+        
+        async def edit_text(self, text, parse_mode=None):
+            if self.reject(text, parse_mode):
+                raise TelegramBadRequest(method=None, message="can't parse entities")
+            self.edits.append((text, parse_mode))
+    
+    class _FakeMessage:
+        """Message utilisateur factice : answer() renvoie le message curseur."""
+        
+        def __init__(self, sent):
+            self.sent = sent
+            self.answers: List[tuple] = []
+        
+        async def answer(self, text, parse_mode=None):
+            if text == STREAM_CURSOR:
+                return self.sent
+            self.answers.append((text, parse_mode))
+    
+    async def _chunks(*parts):
+        for part in parts:
+            yield part
+    
+    class TestAnswerStreaming(IsolatedAsyncioTestCase):
+        """Tests de la finalisation du message streamé."""
+        
+        async def test_long_answer_is_split(self):
+            """Une réponse trop longue continue dans un second message."""
+            sent = _FakeSent()
+            message = _FakeMessage(sent)
+            
+            await answer_streaming(message, _chunks("a" * TELEGRAM_MESSAGE_LIMIT, "b" * 10))
+            
+            self.assertEqual(sent.edits[-1], ("a" * TELEGRAM_MESSAGE_LIMIT, "Markdown"))
+            self.assertEqual(message.answers, [("b" * 10, "Markdown")])
+        
+        async def test_plain_text_fallback(self):
+            """Un Markdown invalide est renvoyé en texte brut."""
+            sent = _FakeSent(reject=lambda text, parse_mode: parse_mode == "Markdown")
+            
+            await answer_streaming(_FakeMessage(sent), _chunks("*non fermé"))
+            
+            self.assertEqual(sent.edits[-1], ("*non fermé", None))
+        
+        async def test_failed_final_edit_shows_fallback(self):
+            """Si le texte est refusé, le message curseur affiche le secours."""
+            sent = _FakeSent(reject=lambda text, parse_mode: text != FALLBACK_MSG)
+            message = _FakeMessage(sent)
+            
+            await answer_streaming(message, _chunks("refusé"))
+            
+            self.assertEqual(sent.edits, [(FALLBACK_MSG, None)])
+            self.assertEqual(message.answers, [])
     
     # Lancer les tests
     unittest.main(verbosity=2)
@@ -6,14 +6,58 @@ Chaque réponse passe par le moteur de personnalité Chico
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
-from ..core.chico_personality import chico_respond
+from ..core.chico_personality import chico_respond, chico_respond_cacheable, get_chico_engine
 from ..core.database import DatabaseManager
 from ..core.logging_setup import setup_logging
 
 logger = setup_logging("chico_handlers")
 
+# Délai maximal d'une réponse IA pour un message général (secondes)
+LLM_TIMEOUT_SECONDS = 20
+
+# Réponses directes (sans IA) pour les commandes purement factuelles
+BALANCE_DIRECT_TEMPLATE = "💰 Ton solde : *{balance:.2f} USDT*\n🏅 Niveau : {level}"
+STATS_DIRECT_TEMPLATE = (
+    "📊 Tes stats\n"
+    "• Trades : {total_trades}\n"
+    "• Win rate : {win_rate:.1f}%\n"
+    "• Profit total : {total_profit:.2f} USDT"
+)
+STATS_EMPTY_MESSAGE = "📊 Pas encore de stats, frère ! Lance-toi avec /deposit 🇬🇳"
+CLASSEMENT_LINE_TEMPLATE = "{rank}. {username} - {earnings:.2f} USDT"
+CLASSEMENT_DIRECT_TEMPLATE = "🏆 Top 10\n{lines}\n\n📍 Ta position : {user_rank}"
+MULTITASK_DIRECT_TEMPLATE = "⚙️ Tâches actives : {active_tasks}/{total_tasks}\n⏱️ Uptime : {uptime}"
+MULTITASK_STOPPED_MESSAGE = "⚙️ Les tâches automatiques ne tournent pas pour le moment."
+
+# /start et /help ne dépendent que de la langue : réponse Chico mémorisée par (commande, langue)
+INTRO_CACHE_MAX = 64
+DEFAULT_LOCALE = "fr"
+
+# Salutation personnalisée placée devant le corps /start mémorisé, substituée à chaque appel
+START_GREETINGS = {
+    "fr": "Salut {username} ! 👋\n\n",
+    "en": "Hi {username}! 👋\n\n",
+}
+DEFAULT_USERNAME = "ami"
+
+def _normalize_locale(locale: Optional[str]) -> str:
+    """Code langue Telegram ("fr-FR", "en", None) -> code à 2 lettres"""
+    
+    return (locale or DEFAULT_LOCALE)[:2].lower()
+
+def _user_level(balance: float) -> str:
+    """Niveau de l'utilisateur selon son solde"""
+    
+    if balance >= 2000:
+        return "Légendaire 🔥"
+    if balance >= 1000:
+        return "Avancé 🚀"
+    if balance >= 500:
+        return "Intermédiaire ⚡"
+    return "Débutant 🌱"
+
 class ChicoHandlers:
     """
     Handlers pour toutes les commandes du bot
@@ -21,34 +65,73 @@ class ChicoHandlers:
     """
     
     def __init__(self):
-        self.database = DatabaseManager()
-        self.logger = setup_logging("chico_handlers")
+        # Base de données créée dans initialize(), au démarrage du bot
+        self.database: Optional[DatabaseManager] = None
+        
+        # Gabarits /start et /help déjà générés, par (commande, langue)
+        self._intro_cache: Dict[Tuple[str, str], str] = {}
+        
+    async def initialize(self, database: Optional[DatabaseManager] = None):
+        """
+        Initialisation asynchrone - prépare la base de données avant le premier message
+        Si une base déjà initialisée est fournie, son pool de connexions est partagé
+        """
+        
+        if self.database is not None:
+            return
+            
+        if database is None:
+            database = DatabaseManager()
+            await database.initialize()
+        self.database = database
         
-    async def handle_start(self, user_id: str, username: str = None) -> str:
+    async def handle_start(self, user_id: str, username: str = None, locale: str = None) -> str:
         """Handler pour /start"""
         
         # Enregistrer l'utilisateur
         await self.database.register_user(user_id, username)
         
-        # Contexte pour personnalisation
+        # Contexte commun à tous les nouveaux venus de cette langue
         context = {
             "first_time": True,
-            "username": username,
             "user_level": "Débutant 🌱"
         }
         
-        # Générer la réponse avec la voix de Chico
-        response = await chico_respond("/start", user_id, context)
-        
-        return response
+        # Corps généré avec la voix de Chico une fois par langue, salutation au nom de l'utilisateur
+        locale = _normalize_locale(locale)
+        greeting = START_GREETINGS.get(locale, START_GREETINGS[DEFAULT_LOCALE])
+        template = await self._intro_template("/start", user_id, locale, context, greeting)
+        return template.format(username=username or DEFAULT_USERNAME)
         
-    async def handle_help(self, user_id: str) -> str:
+    async def handle_help(self, user_id: str, locale: str = None) -> str:
         """Handler pour /help"""
         
-        context = await self._get_user_context(user_id)
-        response = await chico_respond("/help", user_id, context)
-        
-        return response
+        template = await self._intro_template("/help", user_id, _normalize_locale(locale), {})
+        return template.format()
+        
+    async def _intro_template(
+        self, command: str, user_id: str, locale: str, context: Dict[str, Any], greeting: str = ""
+    ) -> str:
+        """
+        Gabarit str.format de /start ou /help, mémorisé par (commande, langue) :
+        salutation (avec {username}) + réponse Chico, accolades de la réponse échappées
+        """
+        
+        key = (command, locale)
+        template = self._intro_cache.get(key)
+        if template is not None:
+            return template
+            
+        context["locale"] = locale
+        engine = get_chico_engine(self.database)
+        result = await engine.generate_response(command, user_id, context)
+        template = greeting + result.text.replace("{", "{{").replace("}", "}}")
+        
+        # Ne mémoriser que de vraies réponses IA (ni limitation de débit, ni secours)
+        if engine.is_cacheable(result) and len(self._intro_cache) < INTRO_CACHE_MAX:
+            self._intro_cache[key] = template
+            
+        return template
         
     async def handle_balance(self, user_id: str) -> str:
         """Handler pour /balance"""
@@ -228,26 +311,86 @@ class ChicoHandlers:
                 user_message = "Pourquoi les tâches automatiques ne tournent pas ?"
                 
         except Exception as e:
-            self.logger.error(f"Erreur multitâche status: {e}")
+            logger.error(f"Erreur multitâche status: {e}")
             user_message = "Je veux comprendre comment marchent les tâches automatiques"
             
         response = await chico_respond(user_message, user_id, context)
         
         return response
         
+    async def handle_balance_direct(self, user_id: str) -> str:
+        """/balance sans IA - réponse déterministe formatée"""
+        
+        balance = await self.database.get_user_balance(user_id)
+        return BALANCE_DIRECT_TEMPLATE.format(balance=balance, level=_user_level(balance))
+        
+    async def handle_stats_direct(self, user_id: str) -> str:
+        """/stats sans IA - réponse déterministe formatée"""
+        
+        stats = await self.database.get_user_stats(user_id) or {}
+        
+        if not stats.get("total_trades", 0):
+            return STATS_EMPTY_MESSAGE
+            
+        return STATS_DIRECT_TEMPLATE.format(
+            total_trades=stats.get("total_trades", 0),
+            win_rate=stats.get("win_rate", 0),
+            total_profit=stats.get("total_profit", 0)
+        )
+        
+    async def handle_classement_direct(self, user_id: str) -> str:
+        """/classement sans IA - réponse déterministe formatée"""
+        
+        rankings = await self.database.get_top_users(10)
+        user_rank = await self.database.get_user_rank(user_id)
+        
+        lines = "\n".join(
+            CLASSEMENT_LINE_TEMPLATE.format(
+                rank=rank,
+                username=user.get("username") or "Anonyme",
+                earnings=user.get("total_earnings", 0)
+            )
+            for rank, user in enumerate(rankings, 1)
+        )
+        
+        return CLASSEMENT_DIRECT_TEMPLATE.format(lines=lines, user_rank=user_rank)
+        
+    async def handle_multitask_status_direct(self, user_id: str) -> str:
+        """Statut multitâche sans IA - réponse déterministe formatée"""
+        
+        from ..core.multitask_integration import get_orchestrator
+        orchestrator = get_orchestrator(self.database)
+        
+        if not (orchestrator and orchestrator.running):
+            return MULTITASK_STOPPED_MESSAGE
+            
+        dashboard = await orchestrator.get_dashboard_data()
+        uptime = int(dashboard.get("orchestrator_uptime", 0))
+        
+        return MULTITASK_DIRECT_TEMPLATE.format(
+            active_tasks=dashboard.get("active_tasks", 0),
+            total_tasks=dashboard.get("total_tasks", 0),
+            uptime=f"{uptime // 3600}h{uptime % 3600 // 60:02d}"
+        )
+        
     async def handle_general_message(self, user_id: str, message: str) -> str:
         """Handler pour les messages généraux (non commandes)"""
         
+        response, _ = await self.handle_general_message_cacheable(user_id, message)
+        return response
+        
+    async def handle_general_message_cacheable(self, user_id: str, message: str) -> Tuple[str, bool]:
+        """Message général : (réponse, réponse mémorisable) pour cached_respond"""
+        
         context = await self._get_user_context(user_id)
         
         # Ajouter des informations contextuelles
         context["is_general_message"] = True
         context["message_length"] = len(message)
         
-        # Générer la réponse avec la voix de Chico
-        response = await chico_respond(message, user_id, context)
-        
-        return response
+        # Générer la réponse avec la voix de Chico (asyncio.timeout : pas de tâche supplémentaire)
+        async with asyncio.timeout(LLM_TIMEOUT_SECONDS):
+            return await chico_respond_cacheable(message, user_id, context)
         
     async def _get_user_context(self, user_id: str) -> Dict[str, Any]:
         """Récupérer le contexte complet de l'utilisateur"""
@@ -260,14 +403,7 @@ class ChicoHandlers:
             stats = await self.database.get_user_stats(user_id)
             
             # Niveau selon solde
-            if balance >= 2000:
-                level = "Légendaire 🔥"
-            elif balance >= 1000:
-                level = "Avancé 🚀"
-            elif balance >= 500:
-                level = "Intermédiaire ⚡"
-            else:
-                level = "Débutant 🌱"
+            level = _user_level(balance)
                 
             # Tâches actives (si disponible)
             active_tasks = 0
@@ -291,7 +427,7 @@ class ChicoHandlers:
             }
             
         except Exception as e:
-            self.logger.error(f"Erreur contexte utilisateur: {e}")
+            logger.error(f"Erreur contexte utilisateur: {e}")
             return {"user_id": user_id}
 
 # Singleton global
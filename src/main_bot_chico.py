@@ -7,22 +7,106 @@ TOUTES les réponses passent par le moteur de personnalité Chico
 import asyncio
 import logging
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Awaitable, Callable, Dict, Optional
 
+try:
+    import uvloop
+except ImportError:
+    # Windows ou uvloop absent : boucle asyncio standard
+    uvloop = None
+
+import aiohttp
 from aiogram import Bot, Dispatcher, types
-from aiogram.filters import Command
+from aiolimiter import AsyncLimiter
+from aiogram.filters import Command, CommandObject
 from aiogram.types import Message, CallbackQuery
 
 # Imports Chico
-from src.core.chico_personality import get_chico_engine, chico_respond
+from src.core.chico_personality import get_chico_engine, chico_respond, chico_respond_cacheable
 from src.core.database import DatabaseManager
 from src.core.multitask_integration import start_multitask_system, check_balance_and_unlock
+from src.core.response_cache import cached_respond
 from src.handlers.chico_handlers import get_chico_handlers
 from src.core.logging_setup import setup_logging
 
 logger = setup_logging("main_bot_chico")
 
+# Expressions précompilées pour l'extraction des paramètres de commande
+_AMOUNT_RE = re.compile(r'\d+\.?\d*')
+# Sous-chaînes, sans \b : "restart" / "relancer" valent start ; start est testé avant stop
+_TRADING_START_RE = re.compile(r'start|lancer|commencer', re.IGNORECASE)
+_TRADING_STOP_RE = re.compile(r'stop|arrêter|pause', re.IGNORECASE)
+
+# Commandes Telegram -> type de handler
+_COMMAND_TO_HANDLER = {
+    "start": "start",
+    "help": "help",
+    "balance": "balance",
+    "deposit": "deposit",
+    "trading": "trading",
+    "withdraw": "withdraw",
+    "stats": "stats",
+    "classement": "classement",
+    "support": "support",
+    "tasks": "multitask_status",
+}
+
+# Commandes factuelles servies sans IA si CHICO_FAST_COMMANDS=1 (évaluation partielle)
+_DIRECT_HANDLERS = frozenset({"balance", "stats", "classement", "multitask_status"})
+
+# Types de handler suivis d'une vérification des paliers
+_POST_TX = frozenset({"deposit"})
+
+# Envois Telegram : ~1 message/s par chat, 30 messages/s au total ;
+# un expéditeur de chat inactif depuis _SENDER_IDLE_TIMEOUT secondes s'arrête
+_CHAT_SEND_INTERVAL = 1.0
+_GLOBAL_SEND_RATE = 30
+_SENDER_IDLE_TIMEOUT = 60
+
+# Marqueur de fin de file : l'expéditeur envoie tout ce qui précède puis s'arrête
+_SENDER_STOP = None
+
+# Réponse envoyée quand l'envoi d'une réponse échoue (même message que l'erreur de handler)
+_SEND_ERROR_MESSAGE = "Désolé frère, j'ai eu un petit problème... Réessaie dans un instant !"
+
+# Pool de connexions HTTP partagé par les appels IA (OpenAI, Gemini)
+_HTTP_LIMIT = 100
+_HTTP_LIMIT_PER_HOST = 20
+_HTTP_DNS_TTL = 300
+_HTTP_KEEPALIVE = 60
+_HTTP_TIMEOUT = 30
+
+# Long polling : types d'update traités par nos handlers et durée d'attente de getUpdates
+_ALLOWED_UPDATES = ["message"]
+_POLLING_TIMEOUT = 30
+
+# Délais maximaux (secondes) de la vérification des paliers et de l'arrêt des tâches
+_POST_TX_TIMEOUT = 20
+_SHUTDOWN_TIMEOUT = 20
+
+# Règle de concurrence pour le chemin par message (handlers, envois, paliers) :
+# pas d'asyncio.gather. Awaits séquentiels par défaut ; si un vrai parallélisme
+# est nécessaire, utiliser asyncio.TaskGroup (annule les tâches sœurs en cas d'erreur,
+# sans la machinerie _GatheringFuture de gather)
+
+# Bannière de démarrage, construite une seule fois
+_BANNER = "\n".join([
+    "🇬🇳 CHICOBOT - DÉMARRAGE",
+    "=" * 50,
+    "🔥 Mode Personality activé",
+    "💬 Toutes les réponses passent par Chico (17 ans, Kamsar)",
+    "🤖 IA: OpenAI GPT-4o + Gemini 1.5-flash",
+    "📊 Système multitâche: Actif",
+    "🇬🇳 La Guinée se soulève !",
+    "=" * 50,
+])
+
+# Variables d'environnement obligatoires
+_REQUIRED_VARS = frozenset({"TELEGRAM_BOT_TOKEN", "OPENAI_PROJECT_API_KEY", "GEMINI_API_KEY"})
+
 class ChicoBot:
     """
     ChicoBot - Le bot avec la voix de Chico
@@ -30,6 +114,28 @@ class ChicoBot:
     TOUTES les réponses passent par le moteur IA
     """
     
+    # Attributs figés : pas de __dict__, accès par descripteurs de slot
+    __slots__ = (
+        "bot_token",
+        "bot",
+        "dp",
+        "database",
+        "chico_engine",
+        "handlers",
+        "_http",
+        "orchestrator",
+        "_dispatch",
+        "_post_tx_queue",
+        "_post_tx_task",
+        "_send_queues",
+        "_send_tasks",
+        "_rate_limiter",
+        "_handler_sem",
+        "_db_pool",
+        "start_time",
+        "messages_processed",
+    )
+    
     def __init__(self):
         # Configuration
         self.bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -45,9 +151,33 @@ class ChicoBot:
         self.chico_engine = get_chico_engine(self.database)
         self.handlers = get_chico_handlers()
         
+        # Session HTTP partagée (créée dans initialize, dans la boucle)
+        self._http = None
+        
         # Système multitâche
         self.orchestrator = None
         
+        # Table de dispatch type de handler -> coroutine (construite dans initialize)
+        self._dispatch = {}
+        
+        # File des vérifications de paliers après transaction (créée dans initialize)
+        self._post_tx_queue = None
+        self._post_tx_task = None
+        
+        # Files d'envoi par chat et limite globale de débit Telegram
+        self._send_queues: Dict[int, asyncio.Queue] = {}
+        self._send_tasks: Dict[int, asyncio.Task] = {}
+        self._rate_limiter = AsyncLimiter(_GLOBAL_SEND_RATE, 1)
+        
+        # Limite de messages traités en parallèle (protège la boucle et la mémoire en rafale)
+        self._handler_sem = asyncio.Semaphore(int(os.getenv("CHICO_MAX_CONCURRENCY", "32")))
+        
+        # Pool de threads borné pour les appels bloquants (to_thread / run_in_executor)
+        self._db_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv("CHICO_DB_WORKERS", "8")),
+            thread_name_prefix="chico-db"
+        )
+        
         # Statistiques
         self.start_time = datetime.now()
         self.messages_processed = 0
@@ -57,8 +187,28 @@ class ChicoBot:
     async def initialize(self):
         """Initialisation complète du bot"""
         
+        # Les appels bloquants passent par notre pool borné
+        asyncio.get_running_loop().set_default_executor(self._db_pool)
+        
+        # Ouvrir le pool de connexions avant tout le reste
+        await self.database.initialize()
+        
+        # Session HTTP partagée : connexions TLS et DNS réutilisées entre appels IA
+        self._http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=_HTTP_LIMIT,
+                limit_per_host=_HTTP_LIMIT_PER_HOST,
+                ttl_dns_cache=_HTTP_DNS_TTL,
+                keepalive_timeout=_HTTP_KEEPALIVE
+            ),
+            timeout=aiohttp.ClientTimeout(total=_HTTP_TIMEOUT)
+        )
+        
         # Initialiser le moteur Chico
-        await self.chico_engine.initialize()
+        await self.chico_engine.initialize(session=self._http)
+        
+        # Initialiser les handlers en partageant le même pool
+        await self.handlers.initialize(self.database)
         
         # Démarrer le système multitâche
         try:
@@ -67,6 +217,13 @@ class ChicoBot:
         except Exception as e:
             logger.warning(f"Système multitâche indisponible: {e}")
             
+        # Table de dispatch des handlers
+        self._dispatch = self._build_dispatch()
+        
+        # Vérification des paliers en arrière-plan après chaque transaction
+        self._post_tx_queue = asyncio.Queue(maxsize=1000)
+        self._post_tx_task = asyncio.create_task(self._post_tx_worker())
+        
         # Enregistrer les handlers
         await self._register_handlers()
         
@@ -75,46 +232,10 @@ class ChicoBot:
     async def _register_handlers(self):
         """Enregistrement de TOUS les handlers - TOUT passe par Chico"""
         
-        # Commandes de base
-        @self.dp.message(Command("start"))
-        async def cmd_start(message: Message):
-            await self._handle_with_chico("start", message)
-            
-        @self.dp.message(Command("help"))
-        async def cmd_help(message: Message):
-            await self._handle_with_chico("help", message)
-            
-        @self.dp.message(Command("balance"))
-        async def cmd_balance(message: Message):
-            await self._handle_with_chico("balance", message)
-            
-        @self.dp.message(Command("deposit"))
-        async def cmd_deposit(message: Message):
-            await self._handle_with_chico("deposit", message)
-            
-        @self.dp.message(Command("trading"))
-        async def cmd_trading(message: Message):
-            await self._handle_with_chico("trading", message)
-            
-        @self.dp.message(Command("withdraw"))
-        async def cmd_withdraw(message: Message):
-            await self._handle_with_chico("withdraw", message)
-            
-        @self.dp.message(Command("stats"))
-        async def cmd_stats(message: Message):
-            await self._handle_with_chico("stats", message)
-            
-        @self.dp.message(Command("classement"))
-        async def cmd_classement(message: Message):
-            await self._handle_with_chico("classement", message)
-            
-        @self.dp.message(Command("support"))
-        async def cmd_support(message: Message):
-            await self._handle_with_chico("support", message)
-            
-        @self.dp.message(Command("tasks"))
-        async def cmd_tasks(message: Message):
-            await self._handle_with_chico("multitask_status", message)
+        # Commandes de base - un seul handler, type résolu depuis la commande
+        @self.dp.message(Command(*_COMMAND_TO_HANDLER))
+        async def handle_command(message: Message, command: CommandObject):
+            await self._handle_with_chico(_COMMAND_TO_HANDLER[command.command], message)
             
         # Messages généraux - TOUS passent par Chico
         @self.dp.message()
@@ -123,128 +244,200 @@ class ChicoBot:
             
         logger.info("📞 Handlers enregistrés - TOUT passe par la voix de Chico")
         
+    def _build_dispatch(self) -> Dict[str, Callable[[Message, str], Awaitable[str]]]:
+        """Table type de handler -> coroutine(message, user_id)"""
+        
+        handlers = self.handlers
+        
+        dispatch = {
+            "start": lambda m, u: handlers.handle_start(u, m.from_user.username, m.from_user.language_code),
+            "help": lambda m, u: handlers.handle_help(u, m.from_user.language_code),
+            "balance": lambda m, u: handlers.handle_balance(u),
+            "deposit": lambda m, u: handlers.handle_deposit(u, self._extract_amount(m.text)),
+            "trading": lambda m, u: handlers.handle_trading(u, self._extract_trading_action(m.text)),
+            "withdraw": lambda m, u: handlers.handle_withdraw(u, self._extract_amount(m.text)),
+            "stats": lambda m, u: handlers.handle_stats(u),
+            "classement": lambda m, u: handlers.handle_classement(u),
+            "support": lambda m, u: handlers.handle_support(u, self._extract_support_message(m.text)),
+            "multitask_status": lambda m, u: handlers.handle_multitask_status(u),
+            # Message général - passe par Chico, sauf réponse récente en cache
+            "general": lambda m, u: cached_respond(
+                m.text, u, lambda: handlers.handle_general_message_cacheable(u, m.text)
+            ),
+        }
+        
+        # Réponses directes : pas de passage par la personnalité Chico
+        if os.getenv("CHICO_FAST_COMMANDS") == "1":
+            for handler_type in _DIRECT_HANDLERS:
+                direct = getattr(handlers, f"handle_{handler_type}_direct")
+                dispatch[handler_type] = lambda m, u, direct=direct: direct(u)
+            logger.info("⚡ Commandes factuelles servies sans IA")
+            
+        return dispatch
+        
     async def _handle_with_chico(self, handler_type: str, message: Message):
         """
         Handler universel - TOUTES les réponses passent par Chico
         """
         
-        try:
-            user_id = str(message.from_user.id)
-            username = message.from_user.username
-            
-            # Statistiques
-            self.messages_processed += 1
-            
-            # Log du message original
-            logger.info(f"📩 Message {handler_type} de {username} ({user_id}): {message.text}")
-            
-            # Traitement selon le type
-            if handler_type == "start":
-                response = await self.handlers.handle_start(user_id, username)
-            elif handler_type == "help":
-                response = await self.handlers.handle_help(user_id)
-            elif handler_type == "balance":
-                response = await self.handlers.handle_balance(user_id)
-            elif handler_type == "deposit":
-                # Extraire le montant si spécifié
-                amount = self._extract_amount(message.text)
-                response = await self.handlers.handle_deposit(user_id, amount)
-            elif handler_type == "trading":
-                # Extraire l'action si spécifiée
-                action = self._extract_trading_action(message.text)
-                response = await self.handlers.handle_trading(user_id, action)
-            elif handler_type == "withdraw":
-                # Extraire le montant si spécifié
-                amount = self._extract_amount(message.text)
-                response = await self.handlers.handle_withdraw(user_id, amount)
-            elif handler_type == "stats":
-                response = await self.handlers.handle_stats(user_id)
-            elif handler_type == "classement":
-                response = await self.handlers.handle_classement(user_id)
-            elif handler_type == "support":
-                # Extraire le message de support
-                support_msg = self._extract_support_message(message.text)
-                response = await self.handlers.handle_support(user_id, support_msg)
-            elif handler_type == "multitask_status":
-                response = await self.handlers.handle_multitask_status(user_id)
-            elif handler_type == "general":
-                # Message général - passe directement par Chico
-                response = await self.handlers.handle_general_message(user_id, message.text)
-            else:
-                # Fallback
-                response = await chico_respond(message.text, user_id)
+        async with self._handler_sem:
+            try:
+                from_user = message.from_user
+                user_id = str(from_user.id)
+                username = from_user.username
+                text = message.text
                 
-            # Envoyer la réponse
-            await message.answer(response)
-            
-            # Si c'était une transaction, vérifier les paliers
-            if handler_type in ["deposit"] and self.orchestrator:
-                balance = await self.database.get_user_balance(user_id)
-                await check_balance_and_unlock(self.database, balance)
+                # Statistiques
+                self.messages_processed += 1
                 
-            # Log de la réponse
-            logger.info(f"📤 Réponse Chico envoyée à {username}: {len(response)} caractères")
-            
-        except Exception as e:
-            logger.error(f"Erreur handler {handler_type}: {e}")
+                # Log du message original
+                logger.info("📩 Message %s de %s (%s): %s", handler_type, username, user_id, text)
+                
+                # Traitement selon le type
+                handler = self._dispatch.get(handler_type)
+                if handler is not None:
+                    response = await handler(message, user_id)
+                else:
+                    # Fallback
+                    response = await cached_respond(
+                        text,
+                        user_id,
+                        lambda: chico_respond_cacheable(text, user_id)
+                    )
+                    
+                # Envoyer la réponse via la file du chat (débit Telegram respecté)
+                self._enqueue_reply(message.chat.id, response)
+                
+                # Si c'était une transaction, vérifier les paliers en arrière-plan
+                if handler_type in _POST_TX and self.orchestrator:
+                    try:
+                        self._post_tx_queue.put_nowait(user_id)
+                    except asyncio.QueueFull:
+                        logger.warning(f"File des paliers pleine, vérification ignorée pour {user_id}")
+                    
+                # Log de la réponse
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("📤 Réponse Chico envoyée à %s: %d caractères", username, len(response))
+                
+            except Exception as e:
+                logger.error(f"Erreur handler {handler_type}: {e}")
+                
+                # Message d'erreur avec la voix de Chico
+                error_response = await chico_respond(
+                    "Désolé frère, j'ai eu un petit problème... Réessaie dans un instant !",
+                    user_id
+                )
+                await message.answer(error_response)
             
-            # Message d'erreur avec la voix de Chico
-            error_response = await chico_respond(
-                "Désolé frère, j'ai eu un petit problème... Réessaie dans un instant !",
-                user_id
-            )
-            await message.answer(error_response)
+    def _enqueue_reply(self, chat_id: int, text: str):
+        """Mettre une réponse dans la file d'envoi du chat, en démarrant son expéditeur si besoin"""
+        
+        queue = self._send_queues.get(chat_id)
+        if queue is None:
+            queue = self._send_queues[chat_id] = asyncio.Queue()
+            self._send_tasks[chat_id] = asyncio.create_task(self._chat_sender(chat_id, queue))
+        queue.put_nowait(text)
+        
+    async def _chat_sender(self, chat_id: int, queue: asyncio.Queue):
+        """Expédie les réponses d'un chat dans l'ordre, au rythme autorisé par Telegram"""
+        
+        loop = asyncio.get_running_loop()
+        last_sent = 0.0
+        
+        while True:
+            try:
+                async with asyncio.timeout(_SENDER_IDLE_TIMEOUT):
+                    text = await queue.get()
+            except TimeoutError:
+                # Le timeout a pu annuler un get() déjà réveillé par put_nowait :
+                # l'élément est alors resté dans la file, on continue
+                if not queue.empty():
+                    continue
+                # Chat inactif : on libère la file (aucun await avant le retrait)
+                del self._send_queues[chat_id]
+                del self._send_tasks[chat_id]
+                return
+                
+            if text is _SENDER_STOP:
+                # Arrêt du bot : toutes les réponses précédentes sont parties
+                del self._send_queues[chat_id]
+                del self._send_tasks[chat_id]
+                return
+                
+            delay = _CHAT_SEND_INTERVAL - (loop.time() - last_sent)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                
+            try:
+                async with self._rate_limiter:
+                    await self.bot.send_message(chat_id, text)
+            except Exception as e:
+                logger.error(f"Erreur envoi réponse au chat {chat_id}: {e}")
+                
+                # Comme avant la file d'envoi : l'utilisateur est prévenu de l'échec
+                try:
+                    async with self._rate_limiter:
+                        await self.bot.send_message(chat_id, _SEND_ERROR_MESSAGE)
+                except Exception as e:
+                    logger.error(f"Erreur envoi message d'erreur au chat {chat_id}: {e}")
+            last_sent = loop.time()
             
+    async def _post_tx_worker(self):
+        """Vérifie les paliers après les transactions, hors du chemin de réponse"""
+        
+        while True:
+            user_id = await self._post_tx_queue.get()
+            try:
+                # Séquentiel : le palier dépend du solde lu juste avant
+                async with asyncio.timeout(_POST_TX_TIMEOUT):
+                    balance = await self.database.get_user_balance(user_id)
+                    await check_balance_and_unlock(self.database, balance)
+            except Exception as e:
+                logger.error(f"Erreur vérification paliers pour {user_id}: {e}")
+            finally:
+                self._post_tx_queue.task_done()
+                
     def _extract_amount(self, text: str) -> float:
         """Extraire un montant d'un message"""
-        import re
         
-        # Chercher des nombres dans le texte
-        numbers = re.findall(r'\d+\.?\d*', text)
-        if numbers:
-            try:
-                return float(numbers[0])
-            except:
-                pass
-        return None
+        # Premier nombre du texte
+        match = _AMOUNT_RE.search(text)
+        return float(match.group()) if match else None
         
     def _extract_trading_action(self, text: str) -> str:
         """Extraire l'action de trading"""
-        text_lower = text.lower()
         
-        if "start" in text_lower or "lancer" in text_lower or "commencer" in text_lower:
+        if _TRADING_START_RE.search(text):
             return "start"
-        elif "stop" in text_lower or "arrêter" in text_lower or "pause" in text_lower:
+        if _TRADING_STOP_RE.search(text):
             return "stop"
-        else:
-            return "status"
+        return "status"
             
-    def _extract_support_message(self, text: str) -> str:
-        """Extraire le message de support"""
-        # Enlever "/support" du début
-        if text.startswith("/support"):
-            return text[9:].strip()
-        return None
+    def _extract_support_message(self, text: str) -> Optional[str]:
+        """Extraire le message de support (gère aussi /support@NomDuBot)"""
+        if not text or not text.startswith("/support"):
+            return None
+        # Enlever "/support" puis l'éventuel "@NomDuBot"
+        body = text.removeprefix("/support")
+        if body.startswith("@"):
+            body = body.split(" ", 1)[1] if " " in body else ""
+        return body.strip() or None
         
     async def start_bot(self):
         """Démarrage du bot"""
         
         logger.info("🚀 Démarrage de ChicoBot - La voix de Kamsar !")
         
-        # Message de démarrage
-        print("🇬🇳 CHICOBOT - DÉMARRAGE")
-        print("="*50)
-        print("🔥 Mode Personality activé")
-        print("💬 Toutes les réponses passent par Chico (17 ans, Kamsar)")
-        print("🤖 IA: OpenAI GPT-4o + Gemini 1.5-flash")
-        print("📊 Système multitâche: Actif")
-        print("🇬🇳 La Guinée se soulève !")
-        print("="*50)
-        
-        # Démarrer le polling
+        # Message de démarrage - un seul print
+        print(_BANNER, flush=True)
+        
+        # Démarrer le polling - seuls les messages sont demandés à Telegram
         await self.dp.start_polling(
             self.bot,
-            skip_updates=True
+            skip_updates=True,
+            allowed_updates=_ALLOWED_UPDATES,
+            polling_timeout=_POLLING_TIMEOUT,
+            handle_as_tasks=True
         )
         
     async def stop_bot(self):
@@ -252,15 +445,42 @@ class ChicoBot:
         
         logger.info("🛑 Arrêt de ChicoBot")
         
+        # Vider les files d'envoi : chaque expéditeur envoie ses réponses puis s'arrête
+        sender_tasks = list(self._send_tasks.values())
+        for queue in list(self._send_queues.values()):
+            queue.put_nowait(_SENDER_STOP)
+        if sender_tasks:
+            _, pending = await asyncio.wait(sender_tasks, timeout=_SHUTDOWN_TIMEOUT)
+            if pending:
+                logger.warning(f"{len(pending)} files d'envoi non vidées à temps, réponses abandonnées")
+                for task in pending:
+                    task.cancel()
+            
+        # Arrêter la vérification des paliers
+        if self._post_tx_task:
+            self._post_tx_task.cancel()
+            
         # Arrêter le système multitâche
         if self.orchestrator:
-            await self.orchestrator.stop_all_tasks()
+            try:
+                async with asyncio.timeout(_SHUTDOWN_TIMEOUT):
+                    await self.orchestrator.stop_all_tasks()
+            except TimeoutError:
+                logger.warning("Arrêt des tâches multitâche trop long, on continue l'arrêt")
             
         # Nettoyer le moteur Chico
         await self.chico_engine.cleanup()
         
-        # Arrêter le bot
+        # Arrêter le bot et fermer la session HTTP partagée
         await self.bot.session.close()
+        if self._http:
+            await self._http.close()
+        
+        # Fermer le pool de connexions
+        await self.database.close()
+        
+        # Libérer le pool de threads
+        self._db_pool.shutdown(wait=True, cancel_futures=True)
         
         logger.info("🇬🇳 ChicoBot arrêté - À bientôt la famille !")
 
@@ -269,8 +489,7 @@ async def main():
     """Point d'entrée principal"""
     
     # Vérifier les variables d'environnement
-    required_vars = ["TELEGRAM_BOT_TOKEN", "OPENAI_PROJECT_API_KEY", "GEMINI_API_KEY"]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = sorted(var for var in _REQUIRED_VARS if not os.getenv(var))
     
     if missing_vars:
         print("❌ Variables d'environnement manquantes:")
@@ -294,4 +513,7 @@ async def main():
 
 # Démarrage
 if __name__ == "__main__":
+    # Boucle libuv, plus rapide pour le polling et les I/O réseau
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
@@ -13,27 +13,25 @@ Fonctionnalités principales :
 
 import asyncio
 import hashlib
-import json
-import logging
-import os
-import secrets
+import heapq
+import hmac
+import sys
 import time
+from collections import ChainMap, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, DefaultDict, Dict, Final, Iterator, List, Optional, Tuple, ValuesView
 
-import aiohttp
-import numpy as np
-from aiogram import Router, types
+from aiogram import Bot, Router
 from aiogram.enums import ParseMode
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.types import Message, ReplyKeyboardRemove
+from aiogram.types import Message
 
-from config.settings import settings
 from core.database import database
 from core.logging_setup import get_logger
-from core.security import WalletSecurityManager
 
 # Configuration du logger
 logger = get_logger(__name__)
@@ -47,38 +45,74 @@ ADMIN_COMMISSION_RATE = 0.02  # 2% des gains mensuels
 ADMIN_QUIZ_TIMEOUT = 300  # 5 minutes pour répondre au quiz
 ADMIN_SESSION_TIMEOUT = 3600  # 1 heure de session admin
 
-# 🇬🇳 Réponses du Quiz Admin (stockées hashées) 🇬🇳
+# Planificateur des tâches de fond (priorité : plus petit = plus urgent, unique par job)
+PRIORITY_HIGH = 1
+PRIORITY_NORMAL = 2
+EXPIRY_IDLE_INTERVAL = 3600  # Réveil de l'expiration sans échéance en attente
+SCHEDULER_RETRY_DELAY = 60  # Nouvel essai d'un job en erreur
+DASHBOARD_CACHE_TTL = 30  # Durée de vie d'un dashboard rendu (secondes)
+
+# Regroupement des réponses admin par chat (un seul sendMessage par fenêtre)
+BATCH_FLUSH_INTERVAL = 0.3  # Fenêtre de regroupement (secondes)
+BATCH_MAX_LENGTH = 4000  # Sous la limite Telegram de 4096 caractères
+BATCH_SEPARATOR = "\n\n---\n\n"
+
+# Hash des réponses : BLAKE2b 128 bits, séparé des autres usages par person=
+_BLAKE2B = hashlib.blake2b
+_ANSWER_HASH_PERSON = b"chico-admin"
+
+# Normalisation des réponses : casefold puis suppression des blancs en une passe
+# (pas d'expression régulière : translate est linéaire, sans retour arrière possible)
+_STRIP_WHITESPACE = str.maketrans("", "", " \t\r\n")
+
+def _answer_hash(answer: str) -> bytes:
+    """Empreinte d'une réponse normalisée (casse et espaces ignorés)."""
+    normalized = answer.casefold().translate(_STRIP_WHITESPACE)
+    return _BLAKE2B(normalized.encode(), digest_size=16, person=_ANSWER_HASH_PERSON).digest()
+
+def _seconds_until_next_month(now: datetime) -> float:
+    """Secondes entre now et le 1er du mois suivant à minuit."""
+    next_month = (now.replace(day=1) + timedelta(days=32)).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+    return (next_month - now).total_seconds()
+
+# 🇬🇳 Réponses du Quiz Admin (stockées hashées, empreintes brutes) 🇬🇳
 # Question 1: "Quel est le nom de ta mère ?"
-MOTHER_NAME_HASH = hashlib.sha256("Laouratou sow".lower().encode()).hexdigest()
+MOTHER_NAME_HASHES = frozenset({
+    _answer_hash("Laouratou sow")
+})
 
 # Question 2: "Quel est le nom de ton père ?" 
-FATHER_NAME_HASHES = [
-    hashlib.sha256("Ibrahime sorry sow".lower().encode()).hexdigest(),
-    hashlib.sha256("Oumar barry".lower().encode()).hexdigest()
-]
+FATHER_NAME_HASHES = frozenset({
+    _answer_hash("Ibrahime sorry sow"),
+    _answer_hash("Oumar barry")
+})
 
 # Question 3: "Quel est ton but dans la vie ?"
-LIFE_GOAL_HASH = hashlib.sha256("rendre fière la famille".lower().encode()).hexdigest()
+LIFE_GOAL_HASHES = frozenset({
+    _answer_hash("rendre fière la famille")
+})
+
+# Empreintes attendues, indexées par question_id - 1
+EXPECTED_ANSWER_HASHES = (MOTHER_NAME_HASHES, FATHER_NAME_HASHES, LIFE_GOAL_HASHES)
 
 # 🇬🇳 Questions du Quiz Admin 🇬🇳
 ADMIN_QUESTIONS = [
     {
         "id": 1,
         "question": "🇬🇳 *Question 1/3* 🇬🇳\n\nQuel est le nom de ta mère ?",
-        "hint": "Réponse sensible à la casse",
-        "expected_hash": MOTHER_NAME_HASH
+        "hint": "Réponse sensible à la casse"
     },
     {
         "id": 2,
         "question": "🇬🇳 *Question 2/3* 🇬🇳\n\nQuel est le nom de ton père ?",
-        "hint": "Plusieurs réponses possibles",
-        "expected_hashes": FATHER_NAME_HASHES
+        "hint": "Plusieurs réponses possibles"
     },
     {
         "id": 3,
         "question": "🇬🇳 *Question 3/3* 🇬🇳\n\nQuel est ton but dans la vie ?",
-        "hint": "Une phrase inspirante",
-        "expected_hash": LIFE_GOAL_HASH
+        "hint": "Une phrase inspirante"
     }
 ]
 
@@ -89,15 +123,254 @@ class AdminQuizStates(StatesGroup):
     answering_question_3 = State()
     quiz_completed = State()
 
+@dataclass(slots=True)
+class AdminRecord:
+    """Session et statistiques d'un admin, réunies dans un seul objet."""
+    user_id: int
+    username: str
+    joined_at: datetime
+    last_activity: float  # time.monotonic() de la dernière activité
+    session_active: bool = False
+    total_commissions: float = 0.0
+    monthly_commissions: float = 0.0
+    last_commission_date: Optional[datetime] = None
+    total_users_managed: int = 0
+    joined_at_str: str = field(init=False)  # joined_at formaté une fois, joined_at étant immuable
+    
+    def __post_init__(self):
+        self.joined_at_str = self.joined_at.strftime('%d/%m/%Y')
+
+@dataclass(slots=True)
+class QuizState:
+    """Quiz admin en cours pour un utilisateur."""
+    user_id: int
+    username: str
+    expires_at: float  # time.monotonic() de l'expiration
+    started_at: float = field(default_factory=time.monotonic)
+    current_question: int = 1
+    answers: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+@dataclass(slots=True)
+class DashboardView:
+    """Données d'un rendu /dashboard, lues par attribut dans DASHBOARD_TEMPLATE."""
+    user_id: int
+    username: str
+    joined_at_str: str
+    total_commissions: float
+    monthly_commissions: float
+    last_commission_date: Optional[datetime]
+    total_users: int
+    active_users: int
+    total_earnings: float
+    monthly_earnings: float
+    admin_count: int
+    commission_rate: float
+    all_admins: ValuesView[AdminRecord]
+
+class _AttrView:
+    """Adaptateur Mapping en lecture sur les attributs d'un objet à __slots__ (pour format_map)."""
+    __slots__ = ("_obj",)
+    
+    def __init__(self, obj: Any):
+        self._obj = obj
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self._obj, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+# Transitions du quiz : état courant -> (question_id, état suivant ; None après la dernière)
+QUIZ_TRANSITIONS = {
+    AdminQuizStates.answering_question_1: (1, AdminQuizStates.answering_question_2),
+    AdminQuizStates.answering_question_2: (2, AdminQuizStates.answering_question_3),
+    AdminQuizStates.answering_question_3: (3, None),
+}
+
+# Mode de rendu de tous les messages admin
+_PARSE_MD: Final = ParseMode.MARKDOWN
+
+# Échappement Markdown des champs dynamiques (hors entités), table calculée une fois
+_MD_ESCAPE: Final = str.maketrans({c: "\\" + c for c in "_*`["})
+
+def mde(value: Any) -> str:
+    """Échappe une valeur utilisateur pour l'insérer dans un message Markdown."""
+    return str(value).translate(_MD_ESCAPE)
+
+# Messages partagés entre handlers : une seule chaîne au niveau module
+ADMIN_ONLY_MESSAGE: Final[str] = "🇬🇳 *Commande réservée aux administrateurs !* 🇬🇳"
+ADMIN_ONLY_WITH_HINT_MESSAGE: Final[str] = (
+    ADMIN_ONLY_MESSAGE + "\n\n"
+    "Utilise /admin pour devenir administrateur."
+)
+ALREADY_ADMIN_MESSAGE: Final[str] = (
+    "🇬🇳 *Tu es déjà administrateur !* 🇬🇳\n\n"
+    "Utilise /dashboard pour voir ton tableau de bord admin."
+)
+NO_ADMINS_MESSAGE: Final[str] = "🇬🇳 *Aucun administrateur trouvé* 🇬🇳"
+SYSTEM_STATUS_ERROR_MESSAGE: Final[str] = "🇬🇳 *Erreur lors du chargement du statut* 🇬🇳"
+ERROR_TEMPLATE: Final[str] = "🇬🇳 *Erreur :* {} 🇬🇳"
+
+# Message envoyé quand le quiz est réussi
+ADMIN_CONFIRMED_MESSAGE: Final[str] = (
+    "🎉 **ADMIN CONFIRMÉ – BIENVENUE DANS LA FAMILLE DE CHICO** 🎉\n\n"
+    "🇬🇳 *Félicitations !* Tu es maintenant administrateur ChicoBot ! 🇬🇳\n\n"
+    "🔑 *Tes nouveaux pouvoirs :*\n"
+    "• Accès au dashboard admin\n"
+    "• Gestion des utilisateurs\n"
+    "• 2% des gains mensuels de tous les utilisateurs\n\n"
+    "🚀 *Utilise /dashboard pour commencer !*\n\n"
+    "🇬🇳 *Bienvenue dans la famille !* 🇬🇳"
+)
+
+# Gabarit /dashboard, rempli par format_map (champs de DashboardView, username échappé)
+DASHBOARD_TEMPLATE: Final[str] = (
+    "📊 **DASHBOARD ADMIN** 📊\n\n"
+    "🇬🇳 *Informations Admin* 🇬🇳\n"
+    "👤 *Nom :* {username}\n"
+    "📅 *Admin depuis :* {joined_at_str}\n"
+    "💰 *Commissions totales :* {total_commissions:.2f}$\n"
+    "📈 *Commissions mois :* {monthly_commissions:.2f}$\n\n"
+    "📊 *Statistiques Système* 📊\n"
+    "👥 *Total utilisateurs :* {total_users}\n"
+    "🔥 *Utilisateurs actifs :* {active_users}\n"
+    "💵 *Gains totaux :* {total_earnings:.2f}$\n"
+    "📅 *Gains mois :* {monthly_earnings:.2f}$\n"
+    "👑 *Nombre d'admins :* {admin_count}/{max_admins}\n"
+    "💸 *Taux commission :* {commission_rate:.1f}%\n\n"
+    "🇬🇳 *ChicoBot Admin System* 🇬🇳"
+)
+
+# Gabarit /system
+SYSTEM_HEADER_TEMPLATE: Final[str] = (
+    "🖥️ **STATUT SYSTÈME ADMIN** 🖥️\n\n"
+    "🇬🇳 *État du système* 🇬🇳\n"
+    "🟢 *Initialisé :* {initialized}\n"
+    "👑 *Admins actifs :* {total_admins}/{max_admins}\n"
+    "📝 *Quiz en cours :* {active_quizzes}\n"
+    "💸 *Taux commission :* {commission_rate:.1f}%\n\n"
+    "👥 *Liste des admins* 👥\n"
+)
+SYSTEM_ROW_TEMPLATE: Final[str] = "{icon} *{username}* (ID: {user_id})\n"
+SYSTEM_FOOTER: Final[str] = "\n🇬🇳 *Système admin ChicoBot opérationnel* 🇬🇳"
+
+# Gabarits de la liste /admins : une ligne par admin, assemblées par join
+ADMINS_HEADER: Final[str] = "👑 **LISTE DES ADMINISTRATEURS** 👑\n\n"
+ADMIN_ROW_TEMPLATE: Final[str] = (
+    "🇬🇳 *Admin {i}* 🇬🇳\n"
+    "👤 *Nom :* {username}\n"
+    "📅 *Admin depuis :* {joined_at_str}\n"
+    "💰 *Commissions :* {total_commissions:.2f}$\n\n"
+)
+ADMINS_FOOTER_TEMPLATE: Final[str] = "🇬🇳 *Total :* {count}/{max_admins} admins\n"
+
+class TelegramBatcher:
+    """
+    File d'envoi par chat : les réponses reçues pendant BATCH_FLUSH_INTERVAL
+    sont concaténées et envoyées en un minimum d'appels sendMessage.
+    """
+    
+    def __init__(self, flush_interval: float = BATCH_FLUSH_INTERVAL, max_length: int = BATCH_MAX_LENGTH):
+        self.flush_interval = flush_interval
+        self.max_length = max_length
+        self._pending: DefaultDict[int, List[str]] = defaultdict(list)
+        self._bot: Optional[Bot] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._closing = asyncio.Event()
+    
+    async def enqueue(self, bot: Bot, chat_id: int, text: str):
+        """Ajoute une réponse ; l'envoi a lieu à la fin de la fenêtre en cours."""
+        self._bot = bot
+        self._pending[chat_id].append(text)
+        
+        # Une seule tâche d'envoi, créée seulement quand il y a quelque chose à envoyer
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    def _pack(self, texts: List[str]) -> Iterator[str]:
+        """Regroupe les textes en messages de moins de max_length caractères."""
+        batch: List[str] = []
+        length = 0
+        for text in texts:
+            added = len(text) + (len(BATCH_SEPARATOR) if batch else 0)
+            if batch and length + added > self.max_length:
+                yield BATCH_SEPARATOR.join(batch)
+                batch, length = [], 0
+                added = len(text)
+            batch.append(text)
+            length += added
+        if batch:
+            yield BATCH_SEPARATOR.join(batch)
+    
+    async def _flush_later(self):
+        """
+        Envoie par fenêtres tant qu'il reste des réponses : celles ajoutées pendant
+        un envoi partent à la fenêtre suivante. À l'arrêt, plus d'attente.
+        """
+        while self._pending:
+            if not self._closing.is_set():
+                try:
+                    async with asyncio.timeout(self.flush_interval):
+                        await self._closing.wait()
+                except TimeoutError:
+                    pass
+            await self.flush()
+    
+    async def _send_chat(self, chat_id: int, texts: List[str]):
+        """Envoie les messages d'un chat l'un après l'autre (ordre conservé)."""
+        for payload in self._pack(texts):
+            try:
+                await self._bot.send_message(chat_id, payload, parse_mode=_PARSE_MD)
+            except Exception as e:
+                logger.error(f"🇬🇳 Erreur envoi groupé vers {chat_id}: {e}")
+    
+    async def flush(self):
+        """Envoie immédiatement les réponses en attente : chats en parallèle, séquentiel par chat."""
+        pending, self._pending = self._pending, defaultdict(list)
+        if len(pending) == 1:
+            chat_id, texts = pending.popitem()
+            await self._send_chat(chat_id, texts)
+            return
+        
+        # Erreurs interceptées par chat : une tâche en échec n'annule pas les autres
+        async with asyncio.TaskGroup() as group:
+            for chat_id, texts in pending.items():
+                group.create_task(self._send_chat(chat_id, texts))
+    
+    async def close(self):
+        """Vide la file avant l'arrêt : l'envoi en cours est attendu, pas annulé."""
+        self._closing.set()
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        if self._pending:
+            await self.flush()
+
 class AdminSystem:
     """Système de gestion des administrateurs ChicoBot."""
     
     def __init__(self):
-        self.current_admin_sessions = {}  # Sessions admin actives
-        self.pending_quizzes = {}  # Quiz en cours
-        self.admin_stats = {}  # Statistiques des admins
+        # État propre au processus : le long polling n'admet qu'un seul consommateur
+        # getUpdates, il n'y a donc pas d'autre worker à synchroniser
+        self.admins: Dict[int, AdminRecord] = {}  # Admins actifs (session + statistiques)
+        self._admins_view = MappingProxyType(self.admins)  # Vue en lecture seule, toujours à jour
+        self.pending_quizzes: Dict[int, QuizState] = {}  # Quiz en cours
         self.is_initialized = False
         
+        # Instantané immuable des ids admin, reconstruit à chaque modification de self.admins
+        self._admin_id_snapshot: frozenset = frozenset()
+        
+        # Échéances triées (tas min, time.monotonic()) : (expires_at, user_id) et (fin de session, admin_id)
+        # Les entrées périmées sont ignorées au dépilement (suppression paresseuse)
+        self._quiz_expiry: List[Tuple[float, int]] = []
+        self._session_expiry: List[Tuple[float, int]] = []
+        self._expiry_wakeup = asyncio.Event()
+        
+        # Dashboards déjà rendus : admin_id -> (expiration monotonic, message)
+        self._dashboard_cache: Dict[int, Tuple[float, str]] = {}
+        
+        # Tâche de fond unique (expiration + commissions)
+        self._scheduler_task: Optional[asyncio.Task] = None
+        
     async def initialize(self) -> bool:
         """Initialise le système admin."""
         try:
@@ -106,12 +379,9 @@ class AdminSystem:
             # Charger les admins existants depuis la base de données
             await self._load_existing_admins()
             
-            # Initialiser les statistiques
-            await self._initialize_stats()
-            
-            # Démarrer les tâches de fond
-            asyncio.create_task(self._admin_monitoring())
-            asyncio.create_task(self._commission_calculator())
+            # Démarrer la tâche de fond unique
+            self._scheduler_task = asyncio.create_task(self._scheduler())
+            self._scheduler_task.add_done_callback(self._on_scheduler_done)
             
             self.is_initialized = True
             logger.info("🇬🇳 Système admin initialisé avec succès ! 🇬🇳")
@@ -123,52 +393,28 @@ class AdminSystem:
             return False
     
     async def _load_existing_admins(self):
-        """Charge les administrateurs existants depuis la base de données."""
+        """Charge les administrateurs existants et leurs statistiques (une seule requête)."""
         try:
-            # Récupérer tous les admins depuis la base de données
-            admins_data = await database.get_all_admins()
-            
-            for admin_data in admins_data:
-                user_id = admin_data.get("user_id")
-                username = admin_data.get("username")
-                joined_at = admin_data.get("joined_at")
-                is_active = admin_data.get("is_active", True)
-                
-                if is_active:
-                    self.current_admin_sessions[user_id] = {
-                        "username": username,
-                        "joined_at": joined_at,
-                        "last_activity": datetime.now(),
-                        "session_active": False
-                    }
-            
-            logger.info(f"🇬🇳 {len(self.current_admin_sessions)} admins chargés")
+            # Admins actifs, commissions déjà agrégées par la base
+            records = await database.get_all_admins_with_stats()
+            now = time.monotonic()
             
-        except Exception as e:
-            logger.error(f"🇬🇳 Erreur chargement admins: {e}")
-    
-    async def _initialize_stats(self):
-        """Initialise les statistiques des admins."""
-        try:
-            for admin_id in self.current_admin_sessions:
-                self.admin_stats[admin_id] = {
-                    "total_commissions": 0.0,
-                    "monthly_commissions": 0.0,
-                    "last_commission_date": None,
-                    "total_users_managed": 0,
-                    "active_since": self.current_admin_sessions[admin_id]["joined_at"]
-                }
+            self.admins.update(
+                (row["user_id"], AdminRecord(last_activity=now, **row))
+                for row in records
+            )
             
-            logger.info("🇬🇳 Statistiques admin initialisées")
+            self._refresh_admin_snapshot()
+            logger.info(f"🇬🇳 {len(self.admins)} admins chargés")
             
         except Exception as e:
-            logger.error(f"🇬🇳 Erreur initialisation stats: {e}")
+            logger.error(f"🇬🇳 Erreur chargement admins: {e}")
     
     async def start_admin_quiz(self, user_id: int, username: str) -> Dict[str, Any]:
         """Démarre le quiz d'authentification admin."""
         try:
             # Vérifier si l'utilisateur n'est pas déjà admin
-            if user_id in self.current_admin_sessions:
+            if user_id in self.admins:
                 return {
                     "success": False,
                     "message": "Tu es déjà administrateur !",
@@ -176,7 +422,7 @@ class AdminSystem:
                 }
             
             # Vérifier si on a atteint la limite d'admins
-            if len(self.current_admin_sessions) >= MAX_ADMINS:
+            if len(self.admins) >= MAX_ADMINS:
                 return {
                     "success": False,
                     "message": f"Limite de {MAX_ADMINS} admins atteinte !",
@@ -192,16 +438,14 @@ class AdminSystem:
                 }
             
             # Initialiser le quiz
-            quiz_data = {
-                "user_id": user_id,
-                "username": username,
-                "started_at": datetime.now(),
-                "current_question": 1,
-                "answers": {},
-                "expires_at": datetime.now() + timedelta(seconds=ADMIN_QUIZ_TIMEOUT)
-            }
+            quiz_data = QuizState(
+                user_id=user_id,
+                username=username,
+                expires_at=time.monotonic() + ADMIN_QUIZ_TIMEOUT
+            )
             
             self.pending_quizzes[user_id] = quiz_data
+            self._schedule_expiry(self._quiz_expiry, quiz_data.expires_at, user_id)
             
             logger.info(f"🇬🇳 Quiz admin démarré pour {username} ({user_id})")
             
@@ -231,7 +475,7 @@ class AdminSystem:
             quiz_data = self.pending_quizzes[user_id]
             
             # Vérifier l'expiration
-            if datetime.now() > quiz_data["expires_at"]:
+            if time.monotonic() > quiz_data.expires_at:
                 del self.pending_quizzes[user_id]
                 return {
                     "success": False,
@@ -240,29 +484,26 @@ class AdminSystem:
                 }
             
             # Vérifier si c'est la bonne question
-            if quiz_data["current_question"] != question_id:
+            if quiz_data.current_question != question_id:
                 return {
                     "success": False,
                     "message": "Question non valide",
                     "invalid_question": True
                 }
             
-            # Valider la réponse
-            question_data = ADMIN_QUESTIONS[question_id - 1]
-            answer_hash = hashlib.sha256(answer.lower().strip().encode()).hexdigest()
-            
+            # Valider la réponse : comparaison à temps constant avec chaque empreinte attendue
+            # (pas de court-circuit, le temps ne dépend pas de la réponse)
+            answer_hash = _answer_hash(answer)
             is_correct = False
-            if "expected_hash" in question_data:
-                is_correct = answer_hash == question_data["expected_hash"]
-            elif "expected_hashes" in question_data:
-                is_correct = answer_hash in question_data["expected_hashes"]
+            for expected_hash in EXPECTED_ANSWER_HASHES[question_id - 1]:
+                is_correct |= hmac.compare_digest(answer_hash, expected_hash)
             
             # Enregistrer la réponse
-            quiz_data["answers"][question_id] = {
+            quiz_data.answers[question_id] = {
                 "answer": answer,  # Stocker la réponse en clair pour le logging
                 "answer_hash": answer_hash,  # Hash pour validation
                 "is_correct": is_correct,
-                "submitted_at": datetime.now()
+                "submitted_at": time.monotonic()
             }
             
             if not is_correct:
@@ -277,7 +518,7 @@ class AdminSystem:
             
             # Bonne réponse - passer à la question suivante
             if question_id < 3:
-                quiz_data["current_question"] = question_id + 1
+                quiz_data.current_question = question_id + 1
                 next_question = ADMIN_QUESTIONS[question_id]["question"]
                 
                 return {
@@ -306,7 +547,7 @@ class AdminSystem:
         """Traite la réussite du quiz admin."""
         try:
             quiz_data = self.pending_quizzes[user_id]
-            username = quiz_data["username"]
+            username = quiz_data.username
             
             # Ajouter l'utilisateur comme admin
             admin_data = {
@@ -319,22 +560,17 @@ class AdminSystem:
             # Sauvegarder en base de données
             await database.add_admin(admin_data)
             
-            # Ajouter aux sessions admin actives
-            self.current_admin_sessions[user_id] = {
-                "username": username,
-                "joined_at": datetime.now(),
-                "last_activity": datetime.now(),
-                "session_active": True
-            }
-            
-            # Initialiser les statistiques
-            self.admin_stats[user_id] = {
-                "total_commissions": 0.0,
-                "monthly_commissions": 0.0,
-                "last_commission_date": None,
-                "total_users_managed": 0,
-                "active_since": datetime.now()
-            }
+            # Ajouter aux admins actifs, session ouverte et statistiques à zéro
+            self.admins[user_id] = AdminRecord(
+                user_id=user_id,
+                username=username,
+                joined_at=admin_data["joined_at"],
+                last_activity=time.monotonic(),
+                session_active=True
+            )
+            self._refresh_admin_snapshot()
+            self._dashboard_cache.clear()
+            self._schedule_session_expiry(user_id)
             
             # Supprimer le quiz
             del self.pending_quizzes[user_id]
@@ -344,43 +580,37 @@ class AdminSystem:
         except Exception as e:
             logger.error(f"🇬🇳 Erreur complétion quiz: {e}")
     
-    async def is_admin(self, user_id: int) -> bool:
-        """Vérifie si un utilisateur est admin."""
-        return user_id in self.current_admin_sessions
+    def _refresh_admin_snapshot(self):
+        """Reconstruit l'instantané des ids admin après un ajout ou une suppression."""
+        self._admin_id_snapshot = frozenset(self.admins)
     
-    async def get_admin_info(self, user_id: int) -> Optional[Dict[str, Any]]:
-        """Récupère les informations d'un admin."""
-        if user_id not in self.current_admin_sessions:
-            return None
-        
-        admin_info = self.current_admin_sessions[user_id].copy()
-        admin_info.update(self.admin_stats.get(user_id, {}))
-        return admin_info
+    def is_admin(self, user_id: int) -> bool:
+        """
+        Vérifie si un utilisateur est admin (synchrone, sans accès base).
+        L'instantané est reconstruit à chaque ajout ou suppression : pas de TTL à gérer.
+        """
+        return bool(user_id) and user_id in self._admin_id_snapshot
     
-    async def get_all_admins(self) -> List[Dict[str, Any]]:
-        """Récupère tous les admins actifs."""
-        admins_list = []
-        
-        for admin_id, session_data in self.current_admin_sessions.items():
-            admin_info = session_data.copy()
-            admin_info.update(self.admin_stats.get(admin_id, {}))
-            admin_info["user_id"] = admin_id
-            admins_list.append(admin_info)
-        
-        return admins_list
+    async def get_admin_info(self, user_id: int) -> Optional[AdminRecord]:
+        """Récupère les informations d'un admin (sans copie)."""
+        return self.admins.get(user_id)
+    
+    async def get_all_admins(self) -> ValuesView[AdminRecord]:
+        """Récupère tous les admins actifs (vue en lecture seule, sans copie)."""
+        return self._admins_view.values()
     
     async def remove_admin(self, admin_id: int, removed_by: int) -> Dict[str, Any]:
         """Supprime un admin (uniquement par un autre admin)."""
         try:
             # Vérifier que celui qui supprime est admin
-            if removed_by not in self.current_admin_sessions:
+            if removed_by not in self.admins:
                 return {
                     "success": False,
                     "message": "Seul un admin peut supprimer un autre admin"
                 }
             
             # Vérifier que l'admin à supprimer existe
-            if admin_id not in self.current_admin_sessions:
+            if admin_id not in self.admins:
                 return {
                     "success": False,
                     "message": "Admin non trouvé"
@@ -394,17 +624,15 @@ class AdminSystem:
                 }
             
             # Supprimer l'admin
-            admin_username = self.current_admin_sessions[admin_id]["username"]
+            admin_username = self.admins[admin_id].username
             
             # Marquer comme inactif en base de données
             await database.update_admin_status(admin_id, False)
             
-            # Supprimer des sessions actives
-            del self.current_admin_sessions[admin_id]
-            
-            # Supprimer les statistiques
-            if admin_id in self.admin_stats:
-                del self.admin_stats[admin_id]
+            # Supprimer des admins actifs (session et statistiques)
+            del self.admins[admin_id]
+            self._refresh_admin_snapshot()
+            self._dashboard_cache.clear()
             
             logger.info(f"🇬🇳 Admin {admin_username} ({admin_id}) supprimé par {removed_by}")
             
@@ -431,7 +659,7 @@ class AdminSystem:
                 return {
                     "total_earnings": 0,
                     "commission_pool": 0,
-                    "admin_count": len(self.current_admin_sessions),
+                    "admin_count": len(self.admins),
                     "commissions": {}
                 }
             
@@ -439,7 +667,7 @@ class AdminSystem:
             commission_pool = total_monthly_earnings * ADMIN_COMMISSION_RATE
             
             # Répartir équitablement entre les admins actifs
-            active_admins = len(self.current_admin_sessions)
+            active_admins = len(self.admins)
             
             if active_admins == 0:
                 return {
@@ -451,19 +679,25 @@ class AdminSystem:
             
             commission_per_admin = commission_pool / active_admins
             
-            # Distribuer les commissions
-            commissions = {}
-            for admin_id in self.current_admin_sessions:
-                commissions[admin_id] = commission_per_admin
-                
-                # Mettre à jour les statistiques
-                if admin_id in self.admin_stats:
-                    self.admin_stats[admin_id]["monthly_commissions"] = commission_per_admin
-                    self.admin_stats[admin_id]["total_commissions"] += commission_per_admin
-                    self.admin_stats[admin_id]["last_commission_date"] = datetime.now()
-                
-                # Enregistrer la commission en base de données
-                await database.add_admin_commission(admin_id, commission_per_admin, previous_month)
+            # Vecteur des commissions (une diffusion numpy), converti une fois en floats Python
+            # Import local : numpy n'est chargé que pour ce calcul mensuel
+            import numpy as np
+            ids = np.fromiter(self.admins.keys(), dtype=np.int64, count=active_admins)
+            amounts = np.full(ids.size, commission_per_admin, dtype=np.float64)
+            commissions = dict(zip(ids.tolist(), amounts.tolist()))
+            
+            # Enregistrer toutes les commissions en base en un seul aller-retour
+            rows = [(admin_id, amount, previous_month) for admin_id, amount in commissions.items()]
+            await database.add_admin_commissions_bulk(rows)
+            
+            # Base à jour : distribuer les commissions dans les statistiques
+            commission_date = datetime.now()
+            for admin_id, amount in commissions.items():
+                record = self.admins[admin_id]
+                record.monthly_commissions = amount
+                record.total_commissions += amount
+                record.last_commission_date = commission_date
+            self._dashboard_cache.clear()
             
             logger.info(f"🇬🇳 Commissions mensuelles calculées : {commission_pool:.2f}$ pour {active_admins} admins")
             
@@ -479,109 +713,188 @@ class AdminSystem:
             logger.error(f"🇬🇳 Erreur calcul commissions: {e}")
             return {"error": str(e)}
     
-    async def get_admin_dashboard(self, admin_id: int) -> Dict[str, Any]:
-        """Génère le dashboard admin."""
+    async def get_admin_dashboard(self, admin_id: int) -> Optional[DashboardView]:
+        """Génère le dashboard admin (None si non autorisé ou en erreur)."""
         try:
-            if admin_id not in self.current_admin_sessions:
-                return {"error": "Non autorisé"}
+            record = self.admins.get(admin_id)
+            if record is None:
+                logger.warning(f"🇬🇳 Dashboard refusé pour {admin_id} : non admin")
+                return None
             
-            admin_stats = self.admin_stats.get(admin_id, {})
             all_admins = await self.get_all_admins()
             
-            # Statistiques générales
-            total_users = await database.get_total_users_count()
-            active_users = await database.get_active_users_count()
-            total_earnings = await database.get_total_earnings()
-            monthly_earnings = await database.get_current_month_earnings()
-            
-            dashboard = {
-                "admin_info": {
-                    "user_id": admin_id,
-                    "username": self.current_admin_sessions[admin_id]["username"],
-                    "joined_at": self.current_admin_sessions[admin_id]["joined_at"],
-                    "total_commissions": admin_stats.get("total_commissions", 0),
-                    "monthly_commissions": admin_stats.get("monthly_commissions", 0),
-                    "last_commission": admin_stats.get("last_commission_date")
-                },
-                "system_stats": {
-                    "total_users": total_users,
-                    "active_users": active_users,
-                    "total_earnings": total_earnings,
-                    "monthly_earnings": monthly_earnings,
-                    "admin_count": len(all_admins)
-                },
-                "all_admins": all_admins,
-                "commission_rate": ADMIN_COMMISSION_RATE * 100
-            }
-            
-            return dashboard
+            # Statistiques générales : requêtes indépendantes lancées en parallèle
+            # (latence = la plus lente, pas la somme)
+            async with asyncio.TaskGroup() as group:
+                total_users_task = group.create_task(database.get_total_users_count())
+                active_users_task = group.create_task(database.get_active_users_count())
+                total_earnings_task = group.create_task(database.get_total_earnings())
+                monthly_earnings_task = group.create_task(database.get_current_month_earnings())
+            
+            total_users = total_users_task.result()
+            active_users = active_users_task.result()
+            total_earnings = total_earnings_task.result()
+            monthly_earnings = monthly_earnings_task.result()
+            
+            return DashboardView(
+                user_id=admin_id,
+                username=record.username,
+                joined_at_str=record.joined_at_str,
+                total_commissions=record.total_commissions,
+                monthly_commissions=record.monthly_commissions,
+                last_commission_date=record.last_commission_date,
+                total_users=total_users,
+                active_users=active_users,
+                total_earnings=total_earnings,
+                monthly_earnings=monthly_earnings,
+                admin_count=len(all_admins),
+                commission_rate=ADMIN_COMMISSION_RATE * 100,
+                all_admins=all_admins
+            )
             
         except Exception as e:
             logger.error(f"🇬🇳 Erreur dashboard admin: {e}")
-            return {"error": str(e)}
+            return None
     
-    async def _admin_monitoring(self):
-        """Surveillance des sessions admin."""
-        logger.info("🇬🇳 Démarrage monitoring admin...")
+    async def get_dashboard_message(self, admin_id: int) -> Optional[str]:
+        """Message /dashboard rendu, mis en cache DASHBOARD_CACHE_TTL secondes (None si erreur)."""
+        cached = self._dashboard_cache.get(admin_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
         
-        while True:
-            try:
-                current_time = datetime.now()
-                expired_sessions = []
-                
-                # Vérifier les sessions expirées
-                for admin_id, session_data in self.current_admin_sessions.items():
-                    if session_data.get("session_active", False):
-                        last_activity = session_data["last_activity"]
-                        if current_time - last_activity > timedelta(seconds=ADMIN_SESSION_TIMEOUT):
-                            session_data["session_active"] = False
-                            expired_sessions.append(admin_id)
-                
-                # Nettoyer les quiz expirés
-                expired_quizzes = []
-                for user_id, quiz_data in self.pending_quizzes.items():
-                    if current_time > quiz_data["expires_at"]:
-                        expired_quizzes.append(user_id)
-                
-                for user_id in expired_quizzes:
-                    del self.pending_quizzes[user_id]
-                    logger.info(f"🇬🇳 Quiz expiré pour utilisateur {user_id}")
-                
-                # Pause de monitoring
-                await asyncio.sleep(60)  # Vérifier toutes les minutes
-                
-            except Exception as e:
-                logger.error(f"🇬🇳 Erreur monitoring admin: {e}")
-                await asyncio.sleep(60)
+        view = await self.get_admin_dashboard(admin_id)
+        if view is None:
+            return None
+        
+        dashboard_message = DASHBOARD_TEMPLATE.format_map(ChainMap(
+            {"username": mde(view.username), "max_admins": MAX_ADMINS},
+            _AttrView(view)
+        ))
+        
+        self._dashboard_cache[admin_id] = (time.monotonic() + DASHBOARD_CACHE_TTL, dashboard_message)
+        return dashboard_message
     
-    async def _commission_calculator(self):
-        """Calculateur de commissions automatique."""
-        logger.info("🇬🇳 Démarrage calculateur commissions...")
+    def _schedule_expiry(self, heap: List[Tuple[float, int]], deadline: float, entry_id: int):
+        """Ajoute une échéance au tas et réveille la surveillance."""
+        heapq.heappush(heap, (deadline, entry_id))
+        self._expiry_wakeup.set()
+    
+    def _schedule_session_expiry(self, admin_id: int):
+        """Programme la fin de session d'un admin depuis sa dernière activité."""
+        last_activity = self.admins[admin_id].last_activity
+        self._schedule_expiry(self._session_expiry, last_activity + ADMIN_SESSION_TIMEOUT, admin_id)
+    
+    def _expire_due(self, current_time: float):
+        """Traite les échéances atteintes des quiz et des sessions admin."""
+        quiz_expiry = self._quiz_expiry
+        while quiz_expiry and quiz_expiry[0][0] <= current_time:
+            _, user_id = heapq.heappop(quiz_expiry)
+            quiz_data = self.pending_quizzes.get(user_id)
+            
+            # Quiz déjà terminé ou relancé : entrée périmée
+            if quiz_data is not None and current_time >= quiz_data.expires_at:
+                del self.pending_quizzes[user_id]
+                logger.info(f"🇬🇳 Quiz expiré pour utilisateur {user_id}")
+        
+        session_expiry = self._session_expiry
+        while session_expiry and session_expiry[0][0] <= current_time:
+            _, admin_id = heapq.heappop(session_expiry)
+            record = self.admins.get(admin_id)
+            
+            # Admin supprimé ou activité plus récente : entrée périmée
+            if (
+                record is not None
+                and record.session_active
+                and current_time - record.last_activity >= ADMIN_SESSION_TIMEOUT
+            ):
+                record.session_active = False
+    
+    def _next_expiry_delay(self) -> Optional[float]:
+        """Secondes avant la prochaine échéance, None si aucune."""
+        deadlines = [heap[0][0] for heap in (self._quiz_expiry, self._session_expiry) if heap]
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+    
+    async def _expiry_job(self) -> float:
+        """Expire les quiz et sessions dus ; renvoie la prochaine exécution (monotonic)."""
+        self._expire_due(time.monotonic())
+        delay = self._next_expiry_delay()
+        return time.monotonic() + (EXPIRY_IDLE_INTERVAL if delay is None else delay)
+    
+    async def _commission_job(self) -> float:
+        """Calcule les commissions du mois écoulé ; renvoie le 1er du mois suivant (monotonic)."""
+        await self.calculate_monthly_commissions()
+        return time.monotonic() + _seconds_until_next_month(datetime.now())
+    
+    async def _scheduler(self):
+        """Tâche de fond unique : jobs exécutés par (échéance, priorité) dans un tas."""
+        logger.info("🇬🇳 Démarrage planificateur admin...")
+        
+        now = time.monotonic()
+        schedule = [
+            (now, PRIORITY_HIGH, self._expiry_job),
+            (now + _seconds_until_next_month(datetime.now()), PRIORITY_NORMAL, self._commission_job)
+        ]
+        heapq.heapify(schedule)
         
         while True:
+            # Effacé avant les jobs : un ajout pendant leur exécution n'est pas perdu
+            self._expiry_wakeup.clear()
+            
+            # Exécuter les jobs dus, les plus prioritaires d'abord
+            while schedule[0][0] <= time.monotonic():
+                _, priority, job = heapq.heappop(schedule)
+                try:
+                    next_run = await job()
+                except Exception as e:
+                    logger.error(f"🇬🇳 Erreur job admin {job.__name__}: {e}")
+                    next_run = time.monotonic() + SCHEDULER_RETRY_DELAY
+                heapq.heappush(schedule, (next_run, priority, job))
+            
+            # Dormir jusqu'au prochain job ou jusqu'à l'ajout d'une échéance
             try:
-                # Calculer les commissions au début de chaque mois
-                current_time = datetime.now()
-                
-                # Exécuter le 1er de chaque mois à minuit
-                if current_time.day == 1 and current_time.hour == 0:
-                    await self.calculate_monthly_commissions()
-                
-                # Pause d'une heure
-                await asyncio.sleep(3600)
-                
-            except Exception as e:
-                logger.error(f"🇬🇳 Erreur calculateur commissions: {e}")
-                await asyncio.sleep(3600)
+                async with asyncio.timeout(schedule[0][0] - time.monotonic()):
+                    await self._expiry_wakeup.wait()
+            except TimeoutError:
+                continue
+            
+            # Nouvelle échéance : l'expiration repasse en tête
+            schedule = [
+                (time.monotonic() if job == self._expiry_job else next_run, priority, job)
+                for next_run, priority, job in schedule
+            ]
+            heapq.heapify(schedule)
+    
+    def _on_scheduler_done(self, task: asyncio.Task):
+        """Journalise un arrêt anormal du planificateur."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"🇬🇳 Planificateur admin arrêté sur erreur: {task.exception()}")
+    
+    async def shutdown(self):
+        """Arrête proprement la tâche de fond."""
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            try:
+                await self._scheduler_task
+            except asyncio.CancelledError:
+                pass
+            self._scheduler_task = None
+        await reply_batcher.close()
+        logger.info("🇬🇳 Système admin arrêté")
     
     async def cleanup_expired_quizzes(self):
-        """Nettoie les quiz expirés."""
+        """
+        Balayage complet à la demande des quiz expirés.
+        L'expiration courante passe par le tas _quiz_expiry du planificateur ;
+        ce parcours rattrape les échéances modifiées hors du tas.
+        """
         try:
-            current_time = datetime.now()
+            current_time = time.monotonic()
             expired_quizzes = []
             
             for user_id, quiz_data in self.pending_quizzes.items():
-                if current_time > quiz_data["expires_at"]:
+                if current_time > quiz_data.expires_at:
                     expired_quizzes.append(user_id)
             
             for user_id in expired_quizzes:
@@ -595,22 +908,25 @@ class AdminSystem:
             return 0
     
     async def get_system_status(self) -> Dict[str, Any]:
-        """Récupère le statut du système admin."""
+        """
+        Récupère le statut du système admin, entièrement depuis la mémoire :
+        les admins et leurs statistiques sont chargés en une requête jointe à l'initialisation.
+        """
         try:
             return {
                 "initialized": self.is_initialized,
-                "total_admins": len(self.current_admin_sessions),
+                "total_admins": len(self.admins),
                 "max_admins": MAX_ADMINS,
                 "active_quizzes": len(self.pending_quizzes),
                 "commission_rate": ADMIN_COMMISSION_RATE * 100,
                 "admin_list": [
                     {
-                        "user_id": admin_id,
-                        "username": data["username"],
-                        "joined_at": data["joined_at"],
-                        "session_active": data.get("session_active", False)
+                        "user_id": record.user_id,
+                        "username": record.username,
+                        "joined_at": record.joined_at,
+                        "session_active": record.session_active
                     }
-                    for admin_id, data in self.current_admin_sessions.items()
+                    for record in self.admins.values()
                 ]
             }
             
@@ -621,6 +937,9 @@ class AdminSystem:
 # Instance globale du système admin
 admin_system = AdminSystem()
 
+# File d'envoi groupé des réponses /dashboard, /admins et /system
+reply_batcher = TelegramBatcher()
+
 # Handlers de commandes admin
 @admin_router.message(Command("admin"))
 async def handle_admin_command(message: Message, state: FSMContext) -> None:
@@ -631,273 +950,157 @@ async def handle_admin_command(message: Message, state: FSMContext) -> None:
     logger.info(f"🇬🇳 Commande /admin reçue de {username} ({user_id})")
     
     # Vérifier si déjà admin
-    if await admin_system.is_admin(user_id):
-        await message.answer(
-            "🇬🇳 *Tu es déjà administrateur !* 🇬🇳\n\n"
-            "Utilise /dashboard pour voir ton tableau de bord admin.",
-            parse_mode=ParseMode.MARKDOWN
-        )
+    if admin_system.is_admin(user_id):
+        await message.answer(ALREADY_ADMIN_MESSAGE, parse_mode=_PARSE_MD)
         return
     
     # Démarrer le quiz
     quiz_result = await admin_system.start_admin_quiz(user_id, username)
     
     if not quiz_result["success"]:
-        await message.answer(
-            f"🇬🇳 *Erreur :* {quiz_result['message']} 🇬🇳",
-            parse_mode=ParseMode.MARKDOWN
-        )
+        await message.answer(ERROR_TEMPLATE.format(quiz_result['message']), parse_mode=_PARSE_MD)
         return
     
     # Envoyer la première question
     await message.answer(
         quiz_result["first_question"],
-        parse_mode=ParseMode.MARKDOWN
+        parse_mode=_PARSE_MD
     )
     
     # Mettre à jour l'état FSM
     await state.set_state(AdminQuizStates.answering_question_1)
 
-@admin_router.message(AdminQuizStates.answering_question_1)
-async def handle_quiz_answer_1(message: Message, state: FSMContext) -> None:
-    """Gère la réponse à la question 1."""
-    user_id = message.from_user.id
-    answer = message.text.strip()
-    
-    # Soumettre la réponse
-    result = await admin_system.submit_quiz_answer(user_id, 1, answer)
-    
-    if result["success"]:
-        if result.get("quiz_completed"):
-            # Quiz terminé avec succès
-            await message.answer(
-                "🎉 **ADMIN CONFIRMÉ – BIENVENUE DANS LA FAMILLE DE CHICO** 🎉\n\n"
-                "🇬🇳 *Félicitations !* Tu es maintenant administrateur ChicoBot ! 🇬🇳\n\n"
-                "🔑 *Tes nouveaux pouvoirs :*\n"
-                "• Accès au dashboard admin\n"
-                "• Gestion des utilisateurs\n"
-                "• 2% des gains mensuels de tous les utilisateurs\n\n"
-                "🚀 *Utilise /dashboard pour commencer !*\n\n"
-                "🇬🇳 *Bienvenue dans la famille !* 🇬🇳",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            await state.clear()
-        else:
-            # Passer à la question 2
-            await message.answer(
-                result["next_question"],
-                parse_mode=ParseMode.MARKDOWN
-            )
-            await state.set_state(AdminQuizStates.answering_question_2)
-    else:
-        await message.answer(
-            f"🇬🇳 *Erreur :* {result['message']} 🇬🇳",
-            parse_mode=ParseMode.MARKDOWN
-        )
-        await state.clear()
-
-@admin_router.message(AdminQuizStates.answering_question_2)
-async def handle_quiz_answer_2(message: Message, state: FSMContext) -> None:
-    """Gère la réponse à la question 2."""
-    user_id = message.from_user.id
-    answer = message.text.strip()
-    
-    # Soumettre la réponse
-    result = await admin_system.submit_quiz_answer(user_id, 2, answer)
-    
-    if result["success"]:
-        if result.get("quiz_completed"):
-            # Quiz terminé avec succès
-            await message.answer(
-                "🎉 **ADMIN CONFIRMÉ – BIENVENUE DANS LA FAMILLE DE CHICO** 🎉\n\n"
-                "🇬🇳 *Félicitations !* Tu es maintenant administrateur ChicoBot ! 🇬🇳\n\n"
-                "🔑 *Tes nouveaux pouvoirs :*\n"
-                "• Accès au dashboard admin\n"
-                "• Gestion des utilisateurs\n"
-                "• 2% des gains mensuels de tous les utilisateurs\n\n"
-                "🚀 *Utilise /dashboard pour commencer !*\n\n"
-                "🇬🇳 *Bienvenue dans la famille !* 🇬🇳",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            await state.clear()
-        else:
-            # Passer à la question 3
-            await message.answer(
-                result["next_question"],
-                parse_mode=ParseMode.MARKDOWN
-            )
-            await state.set_state(AdminQuizStates.answering_question_3)
-    else:
-        await message.answer(
-            f"🇬🇳 *Erreur :* {result['message']} 🇬🇳",
-            parse_mode=ParseMode.MARKDOWN
-        )
-        await state.clear()
-
-@admin_router.message(AdminQuizStates.answering_question_3)
-async def handle_quiz_answer_3(message: Message, state: FSMContext) -> None:
-    """Gère la réponse à la question 3."""
+async def _handle_quiz_answer(question_id: int, next_state: Optional[State], message: Message, state: FSMContext) -> None:
+    """Gère la réponse à une question du quiz (commun aux 3 questions)."""
     user_id = message.from_user.id
     answer = message.text.strip()
     
     # Soumettre la réponse
-    result = await admin_system.submit_quiz_answer(user_id, 3, answer)
+    result = await admin_system.submit_quiz_answer(user_id, question_id, answer)
     
     if result["success"] and result.get("quiz_completed"):
         # Quiz terminé avec succès
-        await message.answer(
-            "🎉 **ADMIN CONFIRMÉ – BIENVENUE DANS LA FAMILLE DE CHICO** 🎉\n\n"
-            "🇬🇳 *Félicitations !* Tu es maintenant administrateur ChicoBot ! 🇬🇳\n\n"
-            "🔑 *Tes nouveaux pouvoirs :*\n"
-            "• Accès au dashboard admin\n"
-            "• Gestion des utilisateurs\n"
-            "• 2% des gains mensuels de tous les utilisateurs\n\n"
-            "🚀 *Utilise /dashboard pour commencer !*\n\n"
-            "🇬🇳 *Bienvenue dans la famille !* 🇬🇳",
-            parse_mode=ParseMode.MARKDOWN
-        )
+        await message.answer(ADMIN_CONFIRMED_MESSAGE, parse_mode=_PARSE_MD)
         await state.clear()
-    else:
+    elif result["success"] and next_state is not None:
+        # Passer à la question suivante
         await message.answer(
-            f"🇬🇳 *Erreur :* {result['message']} 🇬🇳",
-            parse_mode=ParseMode.MARKDOWN
+            result["next_question"],
+            parse_mode=_PARSE_MD
         )
+        await state.set_state(next_state)
+    else:
+        await message.answer(ERROR_TEMPLATE.format(result['message']), parse_mode=_PARSE_MD)
         await state.clear()
 
+def _make_quiz_handler(question_id: int, next_state: Optional[State]):
+    """Handler aiogram d'une question, lié à son numéro et à l'état suivant."""
+    async def handle_quiz_answer(message: Message, state: FSMContext) -> None:
+        await _handle_quiz_answer(question_id, next_state, message, state)
+    handle_quiz_answer.__name__ = f"handle_quiz_answer_{question_id}"
+    return handle_quiz_answer
+
+# Une question par état FSM : (question_id, état suivant)
+for _quiz_state, (_question_id, _next_state) in QUIZ_TRANSITIONS.items():
+    admin_router.message(_quiz_state)(_make_quiz_handler(_question_id, _next_state))
+
 @admin_router.message(Command("dashboard"))
 async def handle_dashboard_command(message: Message) -> None:
     """Gère la commande /dashboard."""
     user_id = message.from_user.id
     
-    # Vérifier si admin
-    if not await admin_system.is_admin(user_id):
-        await message.answer(
-            "🇬🇳 *Commande réservée aux administrateurs !* 🇬🇳\n\n"
-            "Utilise /admin pour devenir administrateur.",
-            parse_mode=ParseMode.MARKDOWN
-        )
+    # Vérifier si admin (synchrone : le cas courant, non admin, ne passe par aucun await)
+    if not admin_system.is_admin(user_id):
+        await reply_batcher.enqueue(message.bot, message.chat.id, ADMIN_ONLY_WITH_HINT_MESSAGE)
         return
     
-    # Récupérer le dashboard
-    dashboard = await admin_system.get_admin_dashboard(user_id)
+    # Récupérer le dashboard rendu (cache de courte durée)
+    dashboard_message = await admin_system.get_dashboard_message(user_id)
     
-    if "error" in dashboard:
-        await message.answer(
-            "🇬🇳 *Erreur lors du chargement du dashboard* 🇬🇳",
-            parse_mode=ParseMode.MARKDOWN
+    if dashboard_message is None:
+        await reply_batcher.enqueue(
+            message.bot, message.chat.id,
+            "🇬🇳 *Erreur lors du chargement du dashboard* 🇬🇳"
         )
         return
     
-    # Formater le dashboard
-    admin_info = dashboard["admin_info"]
-    system_stats = dashboard["system_stats"]
-    
-    dashboard_message = (
-        f"📊 **DASHBOARD ADMIN** 📊\n\n"
-        f"🇬🇳 *Informations Admin* 🇬🇳\n"
-        f"👤 *Nom :* {admin_info['username']}\n"
-        f"📅 *Admin depuis :* {admin_info['joined_at'].strftime('%d/%m/%Y')}\n"
-        f"💰 *Commissions totales :* {admin_info['total_commissions']:.2f}$\n"
-        f"📈 *Commissions mois :* {admin_info['monthly_commissions']:.2f}$\n\n"
-        f"📊 *Statistiques Système* 📊\n"
-        f"👥 *Total utilisateurs :* {system_stats['total_users']}\n"
-        f"🔥 *Utilisateurs actifs :* {system_stats['active_users']}\n"
-        f"💵 *Gains totaux :* {system_stats['total_earnings']:.2f}$\n"
-        f"📅 *Gains mois :* {system_stats['monthly_earnings']:.2f}$\n"
-        f"👑 *Nombre d'admins :* {system_stats['admin_count']}/{MAX_ADMINS}\n"
-        f"💸 *Taux commission :* {dashboard['commission_rate']:.1f}%\n\n"
-        f"🇬🇳 *ChicoBot Admin System* 🇬🇳"
-    )
-    
-    await message.answer(dashboard_message, parse_mode=ParseMode.MARKDOWN)
+    await reply_batcher.enqueue(message.bot, message.chat.id, dashboard_message)
 
 @admin_router.message(Command("admins"))
 async def handle_admins_command(message: Message) -> None:
     """Gère la commande /admins."""
     user_id = message.from_user.id
     
-    # Vérifier si admin
-    if not await admin_system.is_admin(user_id):
-        await message.answer(
-            "🇬🇳 *Commande réservée aux administrateurs !* 🇬🇳",
-            parse_mode=ParseMode.MARKDOWN
-        )
+    # Vérifier si admin (synchrone : le cas courant, non admin, ne passe par aucun await)
+    if not admin_system.is_admin(user_id):
+        await reply_batcher.enqueue(message.bot, message.chat.id, ADMIN_ONLY_MESSAGE)
         return
     
-    # Récupérer tous les admins
+    # Liste tenue en mémoire (chargée à l'initialisation, mise à jour à chaque écriture)
     admins = await admin_system.get_all_admins()
     
     if not admins:
-        await message.answer(
-            "🇬🇳 *Aucun administrateur trouvé* 🇬🇳",
-            parse_mode=ParseMode.MARKDOWN
-        )
+        await reply_batcher.enqueue(message.bot, message.chat.id, NO_ADMINS_MESSAGE)
         return
     
-    # Formater la liste des admins
-    admins_message = "👑 **LISTE DES ADMINISTRATEURS** 👑\n\n"
-    
-    for i, admin in enumerate(admins, 1):
-        joined_date = admin['joined_at'].strftime('%d/%m/%Y')
-        commissions = admin.get('total_commissions', 0)
-        
-        admins_message += (
-            f"🇬🇳 *Admin {i}* 🇬🇳\n"
-            f"👤 *Nom :* {admin['username']}\n"
-            f"📅 *Admin depuis :* {joined_date}\n"
-            f"💰 *Commissions :* {commissions:.2f}$\n\n"
+    # Formater la liste des admins en une seule concaténation
+    body = "".join(
+        ADMIN_ROW_TEMPLATE.format(
+            i=i,
+            username=mde(admin.username),
+            joined_at_str=admin.joined_at_str,
+            total_commissions=admin.total_commissions
         )
+        for i, admin in enumerate(admins, 1)
+    )
+    footer = ADMINS_FOOTER_TEMPLATE.format(count=len(admins), max_admins=MAX_ADMINS)
+    admins_message = ADMINS_HEADER + body + footer
     
-    admins_message += f"🇬🇳 *Total :* {len(admins)}/{MAX_ADMINS} admins\n"
-    
-    await message.answer(admins_message, parse_mode=ParseMode.MARKDOWN)
+    await reply_batcher.enqueue(message.bot, message.chat.id, admins_message)
 
 @admin_router.message(Command("system"))
 async def handle_system_command(message: Message) -> None:
     """Gère la commande /system."""
     user_id = message.from_user.id
     
-    # Vérifier si admin
-    if not await admin_system.is_admin(user_id):
-        await message.answer(
-            "🇬🇳 *Commande réservée aux administrateurs !* 🇬🇳",
-            parse_mode=ParseMode.MARKDOWN
-        )
+    # Vérifier si admin (synchrone : le cas courant, non admin, ne passe par aucun await)
+    if not admin_system.is_admin(user_id):
+        await reply_batcher.enqueue(message.bot, message.chat.id, ADMIN_ONLY_MESSAGE)
         return
     
     # Récupérer le statut du système
     status = await admin_system.get_system_status()
     
     if "error" in status:
-        await message.answer(
-            "🇬🇳 *Erreur lors du chargement du statut* 🇬🇳",
-            parse_mode=ParseMode.MARKDOWN
-        )
+        await reply_batcher.enqueue(message.bot, message.chat.id, SYSTEM_STATUS_ERROR_MESSAGE)
         return
     
     # Formater le statut
-    system_message = (
-        f"🖥️ **STATUT SYSTÈME ADMIN** 🖥️\n\n"
-        f"🇬🇳 *État du système* 🇬🇳\n"
-        f"🟢 *Initialisé :* {'Oui' if status['initialized'] else 'Non'}\n"
-        f"👑 *Admins actifs :* {status['total_admins']}/{status['max_admins']}\n"
-        f"📝 *Quiz en cours :* {status['active_quizzes']}\n"
-        f"💸 *Taux commission :* {status['commission_rate']:.1f}%\n\n"
-        f"👥 *Liste des admins* 👥\n"
+    header = SYSTEM_HEADER_TEMPLATE.format(
+        initialized='Oui' if status['initialized'] else 'Non',
+        total_admins=status['total_admins'],
+        max_admins=status['max_admins'],
+        active_quizzes=status['active_quizzes'],
+        commission_rate=status['commission_rate']
     )
     
-    for admin in status['admin_list']:
-        status_icon = "🟢" if admin['session_active'] else "🔴"
-        system_message += (
-            f"{status_icon} *{admin['username']}* (ID: {admin['user_id']})\n"
+    # Une ligne par admin, assemblées en une seule concaténation
+    parts: List[str] = [header]
+    parts.extend(
+        SYSTEM_ROW_TEMPLATE.format(
+            icon="🟢" if admin['session_active'] else "🔴",
+            username=admin['username'],
+            user_id=admin['user_id']
         )
+        for admin in status['admin_list']
+    )
+    parts.append(SYSTEM_FOOTER)
+    system_message = "".join(parts)
     
-    system_message += f"\n🇬🇳 *Système admin ChicoBot opérationnel* 🇬🇳"
-    
-    await message.answer(system_message, parse_mode=ParseMode.MARKDOWN)
+    await reply_batcher.enqueue(message.bot, message.chat.id, system_message)
 
-# Tests d'intégration
-if __name__ == "__main__":
+# Tests d'intégration (ignorés sous python -O : simple vérification d'import)
+if __name__ == "__main__" and not sys.flags.optimize:
     import unittest
     from unittest import IsolatedAsyncioTestCase
     
@@ -954,7 +1157,7 @@ if __name__ == "__main__":
             self.assertTrue(result3.get("quiz_completed", False))
             
             # Vérifier que l'utilisateur est maintenant admin
-            self.assertTrue(await self.admin_system.is_admin(user_id))
+            self.assertTrue(self.admin_system.is_admin(user_id))
             
             print("\n✅ Quiz complété avec succès")
         
@@ -972,7 +1175,7 @@ if __name__ == "__main__":
             self.assertTrue(result.get("quiz_failed", False))
             
             # Vérifier que l'utilisateur n'est pas admin
-            self.assertFalse(await self.admin_system.is_admin(user_id))
+            self.assertFalse(self.admin_system.is_admin(user_id))
             
             print("\n❌ Quiz échoué (réponse incorrecte)")
         
@@ -1013,7 +1216,7 @@ if __name__ == "__main__":
                 await self.admin_system.submit_quiz_answer(user_id, 2, "Ibrahime sorry sow")
                 await self.admin_system.submit_quiz_answer(user_id, 3, "rendre fière la famille")
                 
-                self.assertTrue(await self.admin_system.is_admin(user_id))
+                self.assertTrue(self.admin_system.is_admin(user_id))
             
             # Tenter d'ajouter un 4ème admin
             user_id = 12352
@@ -1039,9 +1242,9 @@ if __name__ == "__main__":
             admin_info = await self.admin_system.get_admin_info(user_id)
             
             self.assertIsNotNone(admin_info)
-            self.assertEqual(admin_info["username"], username)
-            self.assertIn("joined_at", admin_info)
-            self.assertIn("total_commissions", admin_info)
+            self.assertEqual(admin_info.username, username)
+            self.assertIsNotNone(admin_info.joined_at)
+            self.assertEqual(admin_info.total_commissions, 0.0)
             
             print("\n📊 Informations admin récupérées")
         
@@ -1082,7 +1285,7 @@ if __name__ == "__main__":
             
             # Simuler l'expiration (modifier la date d'expiration)
             if user_id in self.admin_system.pending_quizzes:
-                self.admin_system.pending_quizzes[user_id]["expires_at"] = datetime.now() - timedelta(seconds=1)
+                self.admin_system.pending_quizzes[user_id].expires_at = time.monotonic() - 1
             
             # Tenter de répondre après expiration
             result = await self.admin_system.submit_quiz_answer(user_id, 1, "Laouratou sow")
@@ -1122,17 +1325,39 @@ if __name__ == "__main__":
             # Récupérer le dashboard
             dashboard = await self.admin_system.get_admin_dashboard(user_id)
             
-            self.assertNotIn("error", dashboard)
-            self.assertIn("admin_info", dashboard)
-            self.assertIn("system_stats", dashboard)
-            self.assertIn("all_admins", dashboard)
-            
-            admin_info = dashboard["admin_info"]
-            self.assertEqual(admin_info["username"], username)
-            self.assertIn("total_commissions", admin_info)
+            self.assertIsNotNone(dashboard)
+            self.assertEqual(dashboard.user_id, user_id)
+            self.assertEqual(dashboard.username, username)
+            self.assertEqual(dashboard.total_commissions, 0.0)
+            self.assertEqual(dashboard.admin_count, len(dashboard.all_admins))
             
             print("\n📊 Dashboard admin testé")
         
+        async def test_load_admin_written_by_add_admin(self):
+            """Teste le rechargement d'un admin écrit par database.add_admin."""
+            user_id = 12361
+            joined_at = datetime(2025, 1, 15, 10, 30)
+            
+            await database.add_admin({
+                "user_id": user_id,
+                "username": "reload_test",
+                "joined_at": joined_at,
+                "is_active": True
+            })
+            
+            # Repartir d'un système vide pour forcer le rechargement depuis la base
+            fresh_system = AdminSystem()
+            await fresh_system._load_existing_admins()
+            
+            record = fresh_system.admins.get(user_id)
+            self.assertIsNotNone(record)
+            self.assertIsInstance(record.joined_at, datetime)
+            self.assertEqual(record.joined_at_str, "15/01/2025")
+            self.assertIsNone(record.last_commission_date)
+            self.assertIn(user_id, fresh_system._admin_id_snapshot)
+            
+            print("\n💾 Rechargement admin testé")
+        
         async def test_cleanup_expired_quizzes(self):
             """Teste le nettoyage des quiz expirés."""
             # Créer quelques quiz
@@ -1144,7 +1369,7 @@ if __name__ == "__main__":
             # Simuler l'expiration de certains quiz
             for user_id in user_ids[:2]:
                 if user_id in self.admin_system.pending_quizzes:
-                    self.admin_system.pending_quizzes[user_id]["expires_at"] = datetime.now() - timedelta(seconds=1)
+                    self.admin_system.pending_quizzes[user_id].expires_at = time.monotonic() - 1
             
             # Nettoyer
             cleaned_count = await self.admin_system.cleanup_expired_quizzes()
@@ -1154,5 +1379,131 @@ if __name__ == "__main__":
             
             print("\n🧹 Nettoyage quiz testé")
     
+    class TestAdminExpiry(IsolatedAsyncioTestCase):
+        """Tests du tas d'échéances et du planificateur, sans base de données."""
+        
+        def setUp(self):
+            self.system = AdminSystem()
+        
+        def _add_quiz(self, user_id: int, expires_at: float):
+            self.system.pending_quizzes[user_id] = QuizState(user_id, f"quiz_{user_id}", expires_at)
+            self.system._schedule_expiry(self.system._quiz_expiry, expires_at, user_id)
+        
+        async def test_due_quizzes_expire(self):
+            """Seuls les quiz dont l'échéance est atteinte sont retirés."""
+            self._add_quiz(1, 100.0)
+            self._add_quiz(2, 200.0)
+            
+            self.system._expire_due(150.0)
+            
+            self.assertNotIn(1, self.system.pending_quizzes)
+            self.assertIn(2, self.system.pending_quizzes)
+        
+        async def test_stale_quiz_entry_ignored(self):
+            """Un quiz relancé avec une nouvelle échéance survit à son ancienne entrée."""
+            self._add_quiz(1, 100.0)
+            self._add_quiz(1, 300.0)
+            
+            self.system._expire_due(150.0)
+            self.assertIn(1, self.system.pending_quizzes)
+            
+            self.system._expire_due(300.0)
+            self.assertNotIn(1, self.system.pending_quizzes)
+        
+        async def test_session_expiry_respects_activity(self):
+            """Une session n'expire que sans activité depuis ADMIN_SESSION_TIMEOUT."""
+            self.system.admins[7] = AdminRecord(7, "admin", datetime.now(), last_activity=0.0, session_active=True)
+            self.system._schedule_session_expiry(7)
+            
+            # Activité récente : l'entrée du tas est périmée
+            self.system.admins[7].last_activity = 10.0
+            self.system._expire_due(ADMIN_SESSION_TIMEOUT)
+            self.assertTrue(self.system.admins[7].session_active)
+            
+            self.system._schedule_session_expiry(7)
+            self.system._expire_due(10.0 + ADMIN_SESSION_TIMEOUT)
+            self.assertFalse(self.system.admins[7].session_active)
+        
+        async def test_next_expiry_delay(self):
+            """Le délai suit la plus proche échéance des deux tas."""
+            self.assertIsNone(self.system._next_expiry_delay())
+            
+            now = time.monotonic()
+            self._add_quiz(1, now + 50)
+            self.system.admins[7] = AdminRecord(7, "admin", datetime.now(), last_activity=now - ADMIN_SESSION_TIMEOUT + 20)
+            self.system._schedule_session_expiry(7)
+            
+            self.assertAlmostEqual(self.system._next_expiry_delay(), 20, delta=1)
+        
+        async def test_scheduler_wakes_for_new_deadline(self):
+            """Une échéance ajoutée pendant le sommeil du planificateur est traitée à temps."""
+            task = asyncio.create_task(self.system._scheduler())
+            try:
+                await asyncio.sleep(0.01)  # Planificateur endormi (aucune échéance)
+                self._add_quiz(1, time.monotonic() + 0.05)
+                await asyncio.sleep(0.2)
+                self.assertNotIn(1, self.system.pending_quizzes)
+            finally:
+                task.cancel()
+    
+    class _FakeBot:
+        """Bot factice : enregistre les envois, chaque envoi prend un peu de temps."""
+        
+        def __init__(self, delay: float = 0.05):
+            self.delay = delay
+            self.sent: List[Tuple[int, str]] = []
+        
+        async def send_message(self, chat_id: int, text: str, **kwargs):
+            await asyncio.sleep(self.delay)
+            self.sent.append((chat_id, text))
+    
+    class TestTelegramBatcher(IsolatedAsyncioTestCase):
+        """Tests unitaires de la file d'envoi groupé."""
+        
+        async def test_window_concatenates_replies(self):
+            """Les réponses d'une même fenêtre partent en un seul message."""
+            bot = _FakeBot()
+            batcher = TelegramBatcher(flush_interval=0.01)
+            
+            await batcher.enqueue(bot, 1, "a")
+            await batcher.enqueue(bot, 1, "b")
+            await batcher.close()
+            
+            self.assertEqual(bot.sent, [(1, "a" + BATCH_SEPARATOR + "b")])
+        
+        async def test_enqueue_during_flush_is_sent(self):
+            """Une réponse ajoutée pendant un envoi part à la fenêtre suivante."""
+            bot = _FakeBot(delay=0.05)
+            batcher = TelegramBatcher(flush_interval=0.01)
+            
+            await batcher.enqueue(bot, 1, "first")
+            await asyncio.sleep(0.03)  # Fenêtre écoulée, envoi en cours
+            await batcher.enqueue(bot, 1, "second")
+            await asyncio.sleep(0.2)
+            
+            self.assertEqual(bot.sent, [(1, "first"), (1, "second")])
+        
+        async def test_close_keeps_in_flight_texts(self):
+            """close() attend l'envoi en cours au lieu de l'annuler."""
+            bot = _FakeBot(delay=0.05)
+            batcher = TelegramBatcher(flush_interval=0.01)
+            
+            await batcher.enqueue(bot, 1, "in flight")
+            await asyncio.sleep(0.03)
+            await batcher.close()
+            
+            self.assertEqual(bot.sent, [(1, "in flight")])
+        
+        async def test_long_replies_are_split(self):
+            """Un lot dépassant max_length est découpé en plusieurs messages."""
+            bot = _FakeBot(delay=0)
+            batcher = TelegramBatcher(flush_interval=0.01, max_length=10)
+            
+            await batcher.enqueue(bot, 1, "x" * 8)
+            await batcher.enqueue(bot, 1, "y" * 8)
+            await batcher.close()
+            
+            self.assertEqual(bot.sent, [(1, "x" * 8), (1, "y" * 8)])
+    
     # Exécuter les tests
     unittest.main()
@@ -11,6 +11,7 @@ Fonctionnalités principales :
 
 import asyncio
 import base64
+import functools
 import hashlib
 import json
 import logging
@@ -20,15 +21,44 @@ import time
 from abc import ABC, abstractmethod
 from collections import deque
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple, Union
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlsplit
 
 import aiohttp
 import backoff
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from cachetools import TTLCache
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson absent : module json standard
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+try:
+    # Décodeur Brotli utilisé par aiohttp : sans lui, "br" ne doit pas être annoncé
+    import brotlicffi  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotli  # noqa: F401
+        _ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+try:
+    import lxml  # noqa: F401  (parseur C de BeautifulSoup)
+    _HTML_PARSER = "lxml"
+except ImportError:
+    # lxml absent : parseur Python intégré
+    _HTML_PARSER = "html.parser"
+
 from config.settings import settings
 from core.ai_service import ai_service
 from core.database import database
@@ -43,16 +73,36 @@ logger = get_logger(__name__)
 # Constantes
 SERPAPI_URL = "https://serpapi.com/search"
 CACHE_TTL = 6 * 60 * 60  # 6 heures pour les bounties
+SEARCH_CACHE_TTL = 15 * 60  # 15 minutes pour les résultats SerpAPI
+CONTENT_CACHE_TTL = 24 * 60 * 60  # 24 heures pour le contenu généré
 MAX_BOUNTIES_PER_SEARCH = 50
 MIN_BOUNTY_REWARD = 100  # USD minimum
 MAX_BOUNTY_REWARD = 5000  # USD maximum
 APPLICATION_COOLDOWN = 300  # 5 minutes entre applications
 
+# Session HTTP partagée par plateforme
+HTTP_POOL_LIMIT = 32  # Connexions simultanées max
+HTTP_LIMIT_PER_HOST = 8  # Connexions simultanées max par plateforme
+BOUNTY_FETCH_CONCURRENCY = 10  # Pages de bounty extraites en parallèle
+MAX_BOUNTY_PAGE_BYTES = 2 * 1024 * 1024  # Taille max lue d'une page de bounty
+HTTP_CHUNK_SIZE = 64 * 1024  # Lecture de la page par blocs
+SUBMISSION_FLUSH_INTERVAL = 2  # Écriture groupée des soumissions (secondes)
+SUBMISSION_BATCH_SIZE = 50  # Écriture immédiate dès ce nombre de soumissions
+PENDING_PAYMENTS_MAX = 256  # Soumissions non payées suivies par plateforme
+PENDING_PAYMENTS_TTL = 30 * 24 * 60 * 60  # Abandon du suivi après 30 jours
+HTTP_DNS_CACHE_TTL = 300  # Cache DNS (secondes)
+HTTP_KEEPALIVE_TIMEOUT = 60  # Connexions inactives conservées (secondes)
+SERPAPI_POOL_LIMIT = 20  # Connexions simultanées max vers SerpAPI
+SERPAPI_TIMEOUT = 30  # Délai max d'une recherche SerpAPI (secondes)
+
 # Cache pour les bounties
 bounty_cache = TTLCache(maxsize=500, ttl=CACHE_TTL)
 
-# Suivi des applications
-application_timestamps = deque(maxlen=100)
+# Cache des recherches SerpAPI : au plus une requête par (catégorie, max_results) toutes les 15 minutes
+search_cache = TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL)
+
+# Contenu IA brut (avant post-traitement) par empreinte des champs du prompt
+content_cache = TTLCache(maxsize=128, ttl=CONTENT_CACHE_TTL)
 
 # Templates de recherche optimisés
 SEARCH_QUERIES = {
@@ -62,19 +112,161 @@ SEARCH_QUERIES = {
     "research": "research bounty OR analysis bounty 400..3000 USD site:earn.superteam.fun OR gitcoin.co OR dework.xyz after:2025-11-01"
 }
 
-# Headers pour les requêtes web
-DEFAULT_HEADERS = {
+# Headers pour les requêtes web (figés : posés une fois sur la session partagée)
+DEFAULT_HEADERS = MappingProxyType({
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.5",
-    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Encoding": _ACCEPT_ENCODING,
     "Connection": "keep-alive",
     "Upgrade-Insecure-Requests": "1",
     "Sec-Fetch-Dest": "document",
     "Sec-Fetch-Mode": "navigate",
     "Sec-Fetch-Site": "none",
     "Cache-Control": "max-age=0"
-}
+})
+
+# Expressions d'extraction, compilées une seule fois (première correspondance uniquement : search)
+def _reward_regex(*currencies: str) -> re.Pattern:
+    """
+    Une seule alternative pour toutes les formes de récompense : un seul passage sur le texte.
+    Chiffres ASCII explicites ; \\s reste Unicode pour les espaces insécables (&nbsp;).
+    """
+    return re.compile(
+        r'\$(?P<usd>[0-9]+(?:,[0-9]+)*)|(?P<num>[0-9]+(?:,[0-9]+)*)\s*(?:' + '|'.join(currencies) + ')',
+        re.IGNORECASE
+    )
+
+# Devises reconnues par plateforme (la plus longue d'abord : USDC avant USD)
+_REWARD_RE_SUPERTEAM = _reward_regex("USD", "SOL", "ETH")
+_REWARD_RE_GITCOIN = _reward_regex("USDC", "USD", "DAI")
+_REWARD_RE_DEWORK = _reward_regex("USD", "MATIC", "ETH")
+# Résultats SerpAPI (titre + extrait) : mêmes devises que SuperTeam
+_REWARD_RE_SEARCH = _REWARD_RE_SUPERTEAM
+
+# En-tête d'un paragraphe d'exigences, ancré en début de bloc : pas de .*? à backtracking
+_REQ_HEADER = re.compile(r'\s*(?:Requirements?|What you\'ll do|Tasks)\s*:\s*(.*)', re.IGNORECASE | re.DOTALL)
+# Date limite : les trois libellés en une seule alternative (un seul passage)
+_DEADLINE_RE = re.compile(r'(?:Deadline|Ends?|Due):\s*([0-9]{4}-[0-9]{2}-[0-9]{2})', re.IGNORECASE)
+
+# En-tête des corps JSON sérialisés par _json_dumps
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# title et body : tout le texte visible reste extrait (récompense, exigences, date limite,
+# description de repli), seul le reste de <head> (meta, link, script, style) est ignoré
+_BOUNTY_STRAINER = SoupStrainer(['title', 'body'])
+
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+# Paliers de récompense (USD, borne exclue) -> difficulté / temps estimés
+_DIFFICULTY_BY_REWARD = ((300, "easy"), (1000, "medium"), (float("inf"), "hard"))
+_TIME_BY_REWARD = ((300, "1-2 hours"), (1000, "3-6 hours"), (float("inf"), "1-2 days"))
+
+def _estimate_difficulty(reward: float) -> str:
+    """Estime la difficulté d'un bounty d'après sa récompense."""
+    return next(label for limit, label in _DIFFICULTY_BY_REWARD if reward < limit)
+
+def _estimate_time(reward: float) -> str:
+    """Estime le temps de complétion d'un bounty d'après sa récompense."""
+    return next(label for limit, label in _TIME_BY_REWARD if reward < limit)
+
+# Pondération de la récompense selon la difficulté (0.7 si inconnue)
+_DIFFICULTY_MULTIPLIER = {"easy": 1.0, "medium": 0.8, "hard": 0.6}
+
+def _priority_score(bounty: Dict[str, Any]) -> float:
+    """Ratio gain/temps estimé d'un bounty."""
+    return bounty.get("reward_usd", 0) * _DIFFICULTY_MULTIPLIER.get(bounty.get("difficulty", "medium"), 0.7)
+
+@functools.lru_cache(maxsize=4)
+def _wallet_address(private_key: str) -> str:
+    """Adresse dérivée de la clé (constante du processus : calculée une seule fois)."""
+    return "0x" + hashlib.sha256(private_key.encode()).hexdigest()[:40]
+
+@functools.lru_cache(maxsize=8)
+def _wallet_signature(private_key: str, suffix: str) -> str:
+    """Signature WalletConnect d'une plateforme, calculée une fois par (clé, plateforme)."""
+    return "0x" + hashlib.sha256((private_key + suffix).encode()).hexdigest()
+
+def _content_cache_key(bounty_details: Dict[str, Any]) -> bytes:
+    """
+    Empreinte blake2b des champs du prompt, casse et espaces normalisés :
+    un même bounty republié à l'identique ne relance pas l'IA.
+    """
+    fields = (
+        bounty_details.get("title", ""),
+        bounty_details.get("description", ""),
+        *bounty_details.get("requirements", []),
+        str(bounty_details.get("reward_usd", 0)),
+        bounty_details.get("platform", "")
+    )
+    normalized = "\x1f".join(" ".join(field.split()).casefold() for field in fields)
+    return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+def _extract_reward(text_content: str, reward_re: re.Pattern) -> float:
+    """Montant de la première récompense trouvée dans le texte (0 sinon)."""
+    match = reward_re.search(text_content)
+    if match:
+        return float((match.group('usd') or match.group('num')).replace(',', ''))
+    return 0
+
+class SubmissionLogBuffer:
+    """
+    Tampon des soumissions de bounty : écrites en base par lots (executemany)
+    toutes les SUBMISSION_FLUSH_INTERVAL secondes ou dès SUBMISSION_BATCH_SIZE lignes.
+    """
+    
+    def __init__(self, flush_interval: float = SUBMISSION_FLUSH_INTERVAL, batch_size: int = SUBMISSION_BATCH_SIZE):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._rows: deque = deque()
+        self._full = asyncio.Event()
+        self._closing = False
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    def append(self, url: str, content: str, status: str, amount: Optional[float], timestamp: float):
+        """Ajoute une soumission ; l'écriture a lieu au prochain lot."""
+        self._rows.append((url, content, status, amount, timestamp))
+        
+        # Une seule tâche d'écriture, créée seulement quand il y a des lignes en attente
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        if len(self._rows) >= self.batch_size:
+            self._full.set()
+    
+    async def _flush_loop(self):
+        """Écrit les lots tant qu'il reste des lignes, au plus tard après flush_interval."""
+        while self._rows:
+            try:
+                async with asyncio.timeout(self.flush_interval):
+                    await self._full.wait()
+            except TimeoutError:
+                pass
+            if not self._closing:
+                self._full.clear()
+            await self.flush()
+    
+    async def flush(self):
+        """Écrit immédiatement les soumissions en attente."""
+        rows = list(self._rows)
+        self._rows.clear()
+        if not rows:
+            return
+        
+        try:
+            await database.log_bounty_submissions_bulk(rows)
+        except Exception as e:
+            logger.error(f"Erreur enregistrement de {len(rows)} soumissions: {e}")
+    
+    async def close(self):
+        """Vide le tampon avant l'arrêt : l'écriture en cours est attendue, pas annulée."""
+        self._closing = True
+        self._full.set()
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        await self.flush()
+
+# Tampon global des soumissions, partagé par toutes les plateformes
+submission_log = SubmissionLogBuffer()
 
 class BountyPlatform(ABC):
     """Interface pour les plateformes de bounty."""
@@ -93,93 +285,174 @@ class BountyPlatform(ABC):
     def get_platform_name(self) -> str:
         """Retourne le nom de la plateforme."""
         pass
+    
+    async def poll_pending_payments(self) -> int:
+        """Revérifie les soumissions non payées ; renvoie le nombre de paiements reçus."""
+        return 0
+    
+    async def close(self):
+        """Libère les ressources de la plateforme."""
+        pass
 
-class SuperTeamPlatform(BountyPlatform):
-    """Implémentation pour SuperTeam Earn."""
+class _BaseBountyPlatform(BountyPlatform):
+    """
+    Flux commun aux plateformes (extraction, soumission, paiement).
+    Les sous-classes ne déclarent que leurs attributs de classe.
+    """
+    
+    base_url: str
+    platform_name: str
+    label: str  # Nom affiché dans les logs
+    reward_re: re.Pattern
+    submit_path: str  # Endpoint de soumission
+    status_path: str  # Endpoint de statut, avec {id}
+    id_field: str  # Clé de l'identifiant dans la réponse de soumission
+    signature_suffix: str  # Suffixe de signature WalletConnect
+    payment_label: str  # Type de paiement affiché dans les logs
+    
+    # Session unique pour toutes les plateformes : un seul pool de connexions
+    _session: Optional[aiohttp.ClientSession] = None
     
     def __init__(self):
-        self.base_url = "https://earn.superteam.fun"
+        # Extractions en cours par URL : les appels simultanés partagent la même tâche
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
+        # Soumissions non payées, revérifiées par poll_pending_payments :
+        # id -> (URL du bounty, dernier ETag, dernier statut) ; retirées une fois payées
+        self._pending_payments: TTLCache = TTLCache(maxsize=PENDING_PAYMENTS_MAX, ttl=PENDING_PAYMENTS_TTL)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Session HTTP partagée : connexions TCP/TLS et DNS réutilisés."""
+        session = _BaseBountyPlatform._session
+        if session is None or session.closed:
+            session = _BaseBountyPlatform._session = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_POOL_LIMIT,
+                    limit_per_host=HTTP_LIMIT_PER_HOST,
+                    ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+                )
+            )
+        return session
+    
+    async def close(self):
+        """Ferme la session HTTP partagée."""
+        session = _BaseBountyPlatform._session
+        if session is not None and not session.closed:
+            await session.close()
+        _BaseBountyPlatform._session = None
+    
+    def get_platform_name(self) -> str:
+        return self.platform_name
+    
+    def _extract_extra(self, text_content: str, reward: float, description: str) -> Dict[str, Any]:
+        """Champs propres à la plateforme (exigences, date limite, estimations)."""
+        return {
+            "requirements": [],
+            "deadline": None,
+            "difficulty": "medium",
+            "estimated_time": "2-4 hours"
+        }
     
     async def extract_bounty_details(self, url: str) -> Dict[str, Any]:
-        """Extrait les détails d'un bounty SuperTeam."""
+        """Extrait les détails d'un bounty (cache TTL, une seule requête par URL en cours)."""
+        cache_key = f"details_{url}"
+        cached = bounty_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._fetch_bounty_details(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        
+        # shield : l'annulation d'un appelant n'interrompt pas les autres
+        details = await asyncio.shield(task)
+        bounty_cache[cache_key] = details
+        return details
+    
+    async def _fetch_bounty_details(self, url: str) -> Dict[str, Any]:
+        """Télécharge et analyse la page d'un bounty."""
         try:
-            async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status}")
-                    
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extraction du titre
-                    title_elem = soup.find('h1') or soup.find('title')
-                    title = title_elem.get_text().strip() if title_elem else "Titre inconnu"
-                    
-                    # Extraction de la récompense
-                    reward = 0
-                    reward_patterns = [
-                        r'\$(\d+(?:,\d+)*)',
-                        r'(\d+(?:,\d+)*)\s*USD',
-                        r'(\d+(?:,\d+)*)\s*SOL',
-                        r'(\d+(?:,\d+)*)\s*ETH'
-                    ]
-                    
-                    text_content = soup.get_text()
-                    for pattern in reward_patterns:
-                        matches = re.findall(pattern, text_content, re.IGNORECASE)
-                        if matches:
-                            reward = float(matches[0].replace(',', ''))
-                            break
-                    
-                    # Extraction de la description
-                    desc_elem = soup.find('div', class_='description') or soup.find('div', class_='content')
-                    description = desc_elem.get_text().strip() if desc_elem else text_content[:500]
-                    
-                    # Extraction des exigences
-                    requirements = []
-                    req_patterns = [
-                        r'Requirements?:\s*(.*?)(?=\n\n|\n[A-Z]|\Z)',
-                        r'What you\'ll do:\s*(.*?)(?=\n\n|\n[A-Z]|\Z)',
-                        r'Tasks:\s*(.*?)(?=\n\n|\n[A-Z]|\Z)'
-                    ]
-                    
-                    for pattern in req_patterns:
-                        matches = re.findall(pattern, text_content, re.IGNORECASE | re.DOTALL)
-                        if matches:
-                            requirements.extend([req.strip() for req in matches[0].split('\n') if req.strip()])
-                    
-                    # Extraction de la date limite
-                    deadline = None
-                    deadline_patterns = [
-                        r'Deadline:\s*(\d{4}-\d{2}-\d{2})',
-                        r'Ends?:\s*(\d{4}-\d{2}-\d{2})',
-                        r'Due:\s*(\d{4}-\d{2}-\d{2})'
-                    ]
-                    
-                    for pattern in deadline_patterns:
-                        match = re.search(pattern, text_content, re.IGNORECASE)
-                        if match:
-                            deadline = match.group(1)
-                            break
-                    
-                    return {
-                        "title": title,
-                        "description": description,
-                        "reward_usd": reward,
-                        "requirements": requirements,
-                        "deadline": deadline,
-                        "platform": self.get_platform_name(),
-                        "url": url,
-                        "difficulty": self._estimate_difficulty(reward, description),
-                        "estimated_time": self._estimate_time(reward, description)
-                    }
-                    
+            session = await self._get_session()
+            async with session.get(url) as response:
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}")
+                
+                # Lecture par blocs, arrêtée à MAX_BOUNTY_PAGE_BYTES : mémoire bornée
+                chunks = []
+                size = 0
+                async for chunk in response.content.iter_chunked(HTTP_CHUNK_SIZE):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= MAX_BOUNTY_PAGE_BYTES:
+                        logger.warning(f"Page {self.label} tronquée à {size} octets: {url}")
+                        break
+                html_bytes = b"".join(chunks)
+                
+                soup = BeautifulSoup(
+                    html_bytes, _HTML_PARSER,
+                    parse_only=_BOUNTY_STRAINER,
+                    from_encoding=response.charset
+                )
+                
+                # Extraction du titre
+                title_elem = soup.find('h1') or soup.find('title')
+                title = title_elem.get_text().strip() if title_elem else "Titre inconnu"
+                
+                # Extraction de la récompense (texte décodé : &#36; et &dollar; deviennent $)
+                text_content = soup.get_text()
+                reward = _extract_reward(text_content, self.reward_re)
+                
+                # Extraction de la description
+                desc_elem = soup.find('div', class_='description') or soup.find('div', class_='content')
+                description = desc_elem.get_text().strip() if desc_elem else text_content[:500]
+                
+                return {
+                    "title": title,
+                    "description": description,
+                    "reward_usd": reward,
+                    "platform": self.platform_name,
+                    "url": url,
+                    **self._extract_extra(text_content, reward, description)
+                }
+                
         except Exception as e:
-            logger.error(f"Erreur extraction bounty SuperTeam {url}: {e}")
+            logger.error(f"Erreur extraction bounty {self.label} {url}: {e}")
             raise
     
+    async def extract_many(
+        self,
+        urls: List[str],
+        concurrency: int = BOUNTY_FETCH_CONCURRENCY
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Extrait plusieurs bounties en parallèle, au plus `concurrency` à la fois.
+        
+        Returns:
+            Un résultat par URL, dans l'ordre : détails ou exception levée
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        results: List[Union[Dict[str, Any], Exception]] = [None] * len(urls)
+        
+        async def _extract_one(index: int, url: str):
+            async with semaphore:
+                try:
+                    results[index] = await self.extract_bounty_details(url)
+                except Exception as e:
+                    # Une page en erreur n'annule pas les autres
+                    results[index] = e
+        
+        async with asyncio.TaskGroup() as group:
+            for index, url in enumerate(urls):
+                group.create_task(_extract_one(index, url))
+        
+        return results
+    
     async def submit_application(self, bounty_url: str, content: str) -> bool:
-        """Soumet une candidature à un bounty SuperTeam VIA API."""
+        """Soumet une candidature VIA API."""
         try:
             # CONNEXION WALLETCONNECT VIA CLÉ PRIVÉE UTILISATEUR
             user_wallet_private_key = os.getenv("WALLET_PRIVATE_KEY")
@@ -201,51 +474,41 @@ class SuperTeamPlatform(BountyPlatform):
             }
             
             # 3. Soumission API réelle
-            async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-                submit_url = f"{self.base_url}/api/bounties/submit"
+            session = await self._get_session()
+            submit_url = f"{self.base_url}{self.submit_path}"
+            
+            async with session.post(submit_url, data=_json_dumps(form_data), headers=_JSON_HEADERS) as response:
+                if response.status != 200:
+                    logger.error(f"HTTP {response.status} lors soumission {self.label}")
+                    return False
                 
-                async with session.post(submit_url, json=form_data) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        if result.get("success"):
-                            bounty_id = result.get("bounty_id")
-                            
-                            # 4. Vérification automatique du statut
-                            payment_result = await self._check_bounty_payment(bounty_id)
-                            
-                            if payment_result["paid"]:
-                                # 5. Réception automatique des fonds
-                                await self._receive_bounty_payment(payment_result["amount"])
-                                
-                                # 6. Enregistrement dans base de données
-                                await database.log_bounty_submission(
-                                    url=bounty_url,
-                                    content=content,
-                                    status="paid",
-                                    amount=payment_result["amount"],
-                                    timestamp=datetime.now()
-                                )
-                                
-                                logger.info(f"💰 Bounty payé: ${payment_result['amount']}")
-                                return True
-                            else:
-                                await database.log_bounty_submission(
-                                    url=bounty_url,
-                                    content=content,
-                                    status="submitted",
-                                    timestamp=datetime.now()
-                                )
-                                return True
-                        else:
-                            logger.error(f"Erreur soumission: {result.get('error')}")
-                            return False
-                    else:
-                        logger.error(f"HTTP {response.status} lors soumission")
-                        return False
+                result = _json_loads(await response.read())
+            
+            if not result.get("success"):
+                logger.error(f"Erreur soumission {self.label}: {result.get('error')}")
+                return False
+            
+            # 4. Vérification automatique du statut (suivie jusqu'au paiement)
+            submission_id = result.get(self.id_field)
+            self._pending_payments[submission_id] = (bounty_url, None, None)
+            payment_result = await self._check_payment(submission_id)
+            
+            if payment_result["paid"]:
+                self._pending_payments.pop(submission_id, None)
+                
+                # 5. Réception automatique des fonds
+                await self._receive_payment(payment_result["amount"])
+                
+                # 6. Enregistrement dans base de données (par lot)
+                submission_log.append(bounty_url, content, "paid", payment_result["amount"], time.time())
+                
+                logger.info(f"💰 {self.payment_label} payé: ${payment_result['amount']}")
+            else:
+                submission_log.append(bounty_url, content, "submitted", None, time.time())
+            return True
                         
         except Exception as e:
-            logger.error(f"Erreur soumission bounty {bounty_url}: {e}")
+            logger.error(f"Erreur soumission {self.label} {bounty_url}: {e}")
             return False
     
     async def _connect_walletconnect(self, private_key: str) -> Dict[str, str]:
@@ -254,8 +517,8 @@ class SuperTeamPlatform(BountyPlatform):
             # Simulation de connexion WalletConnect
             # En pratique: utiliser web3.py + walletconnect protocol
             
-            wallet_address = "0x" + hashlib.sha256(private_key.encode()).hexdigest()[:40]
-            signature = "0x" + hashlib.sha256((private_key + "walletconnect").encode()).hexdigest()
+            wallet_address = _wallet_address(private_key)
+            signature = _wallet_signature(private_key, self.signature_suffix)
             
             return {
                 "address": wallet_address,
@@ -263,403 +526,130 @@ class SuperTeamPlatform(BountyPlatform):
                 "connected": True
             }
         except Exception as e:
-            logger.error(f"Erreur WalletConnect: {e}")
+            logger.error(f"Erreur WalletConnect {self.label}: {e}")
             return {"connected": False}
     
-    async def _check_bounty_payment(self, bounty_id: str) -> Dict[str, Any]:
-        """Vérifie si un bounty a été payé."""
+    async def _check_payment(self, submission_id: str) -> Dict[str, Any]:
+        """Vérifie si une soumission a été payée."""
         try:
             # Vérification automatique du statut de paiement
-            async with aiohttp.ClientSession() as session:
-                check_url = f"{self.base_url}/api/bounties/{bounty_id}/status"
+            session = await self._get_session()
+            check_url = f"{self.base_url}{self.status_path.format(id=submission_id)}"
+            
+            # GET conditionnel : 304 si le statut n'a pas changé depuis le dernier poll
+            pending = self._pending_payments.get(submission_id)
+            etag = pending[1] if pending else None
+            headers = {"If-None-Match": etag} if etag else None
+            
+            async with session.get(check_url, headers=headers) as response:
+                if response.status == 304 and pending and pending[2] is not None:
+                    return pending[2]
                 
-                async with session.get(check_url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        return {
-                            "paid": data.get("status") == "paid",
-                            "amount": data.get("amount", 0),
-                            "transaction_hash": data.get("tx_hash")
-                        }
+                if response.status == 200:
+                    data = _json_loads(await response.read())
+                    
+                    status = {
+                        "paid": data.get("status") == "paid",
+                        "amount": data.get("amount", 0),
+                        "transaction_hash": data.get("tx_hash")
+                    }
+                    
+                    if pending is not None and not status["paid"]:
+                        self._pending_payments[submission_id] = (pending[0], response.headers.get("ETag"), status)
+                    return status
             return {"paid": False, "amount": 0}
         except Exception as e:
-            logger.error(f"Erreur vérification paiement: {e}")
+            logger.error(f"Erreur vérification paiement {self.label}: {e}")
             return {"paid": False, "amount": 0}
     
-    async def _receive_bounty_payment(self, amount: float):
-        """Reçoit automatiquement le paiement de bounty."""
-        try:
-            user_wallet = os.getenv("WALLET_PRIVATE_KEY")
+    async def poll_pending_payments(self) -> int:
+        """Revérifie les soumissions non payées ; renvoie le nombre de paiements reçus."""
+        paid_count = 0
+        for submission_id, (bounty_url, _, _) in list(self._pending_payments.items()):
+            payment_result = await self._check_payment(submission_id)
+            if not payment_result["paid"]:
+                continue
             
+            self._pending_payments.pop(submission_id, None)
+            await self._receive_payment(payment_result["amount"])
+            submission_log.append(bounty_url, "", "paid", payment_result["amount"], time.time())
+            logger.info(f"💰 {self.payment_label} payé: ${payment_result['amount']}")
+            paid_count += 1
+        
+        return paid_count
+    
+    async def _receive_payment(self, amount: float):
+        """Reçoit automatiquement le paiement."""
+        try:
             # Simulation de réception de fonds
             # En pratique: vérifier transaction blockchain + créditer compte
             
             await database.add_user_balance(1, amount)  # user_id=1 pour l'exemple
             
-            logger.info(f"💸 Paiution bounty reçu: ${amount}")
+            logger.info(f"💸 Paiement {self.label} reçu: ${amount}")
             
         except Exception as e:
-            logger.error(f"Erreur réception paiement: {e}")
-    
-    def get_platform_name(self) -> str:
-        return "superteam"
-    
-    def _estimate_difficulty(self, reward: float, description: str) -> str:
-        """Estime la difficulté du bounty."""
-        if reward < 300:
-            return "easy"
-        elif reward < 1000:
-            return "medium"
-        else:
-            return "hard"
-    
-    def _estimate_time(self, reward: float, description: str) -> str:
-        """Estime le temps de completion."""
-        if reward < 300:
-            return "1-2 hours"
-        elif reward < 1000:
-            return "3-6 hours"
-        else:
-            return "1-2 days"
+            logger.error(f"Erreur réception paiement {self.label}: {e}")
 
-class GitcoinPlatform(BountyPlatform):
-    """Implémentation pour Gitcoin."""
-    
-    def __init__(self):
-        self.base_url = "https://gitcoin.co"
-    
-    async def extract_bounty_details(self, url: str) -> Dict[str, Any]:
-        """Extrait les détails d'un bounty Gitcoin."""
-        try:
-            async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status}")
-                    
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extraction similaire à SuperTeam mais adaptée à Gitcoin
-                    title_elem = soup.find('h1') or soup.find('title')
-                    title = title_elem.get_text().strip() if title_elem else "Titre inconnu"
-                    
-                    # Extraction de la récompense (Gitcoin utilise souvent des tokens)
-                    reward = 0
-                    reward_patterns = [
-                        r'\$(\d+(?:,\d+)*)',
-                        r'(\d+(?:,\d+)*)\s*USD',
-                        r'(\d+(?:,\d+)*)\s*DAI',
-                        r'(\d+(?:,\d+)*)\s*USDC'
-                    ]
-                    
-                    text_content = soup.get_text()
-                    for pattern in reward_patterns:
-                        matches = re.findall(pattern, text_content, re.IGNORECASE)
-                        if matches:
-                            reward = float(matches[0].replace(',', ''))
-                            break
-                    
-                    desc_elem = soup.find('div', class_='description') or soup.find('div', class_='content')
-                    description = desc_elem.get_text().strip() if desc_elem else text_content[:500]
-                    
-                    return {
-                        "title": title,
-                        "description": description,
-                        "reward_usd": reward,
-                        "requirements": [],
-                        "deadline": None,
-                        "platform": self.get_platform_name(),
-                        "url": url,
-                        "difficulty": "medium",
-                        "estimated_time": "2-4 hours"
-                    }
-                    
-        except Exception as e:
-            logger.error(f"Erreur extraction bounty Gitcoin {url}: {e}")
-            raise
-    
-    async def submit_application(self, bounty_url: str, content: str) -> bool:
-        """Soumet une candidature à un bounty Gitcoin VIA API."""
-        try:
-            # CONNEXION WALLETCONNECT VIA CLÉ PRIVÉE UTILISATEUR
-            user_wallet_private_key = os.getenv("WALLET_PRIVATE_KEY")
-            if not user_wallet_private_key:
-                logger.error("Clé wallet utilisateur non trouvée")
-                return False
-                
-            # 1. Connexion WalletConnect automatique
-            wallet_connect_result = await self._connect_walletconnect(user_wallet_private_key)
-            if not wallet_connect_result:
-                logger.error("Échec connexion WalletConnect")
-                return False
-                
-            # 2. Soumission API Gitcoin
-            form_data = {
-                "content": content,
-                "wallet_address": wallet_connect_result["address"],
-                "signature": wallet_connect_result["signature"]
-            }
-            
-            async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-                submit_url = f"{self.base_url}/api/grants/submit"
-                
-                async with session.post(submit_url, json=form_data) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        if result.get("success"):
-                            grant_id = result.get("grant_id")
-                            
-                            # 3. Vérification automatique du statut
-                            payment_result = await self._check_grant_payment(grant_id)
-                            
-                            if payment_result["paid"]:
-                                # 4. Réception automatique des fonds
-                                await self._receive_grant_payment(payment_result["amount"])
-                                
-                                await database.log_bounty_submission(
-                                    url=bounty_url,
-                                    content=content,
-                                    status="paid",
-                                    amount=payment_result["amount"],
-                                    timestamp=datetime.now()
-                                )
-                                
-                                logger.info(f"💰 Grant Gitcoin payé: ${payment_result['amount']}")
-                                return True
-                            else:
-                                await database.log_bounty_submission(
-                                    url=bounty_url,
-                                    content=content,
-                                    status="submitted",
-                                    timestamp=datetime.now()
-                                )
-                                return True
-                        else:
-                            logger.error(f"Erreur soumission Gitcoin: {result.get('error')}")
-                            return False
-                    else:
-                        logger.error(f"HTTP {response.status} lors soumission Gitcoin")
-                        return False
-                        
-        except Exception as e:
-            logger.error(f"Erreur soumission Gitcoin {bounty_url}: {e}")
-            return False
-    
-    async def _connect_walletconnect(self, private_key: str) -> Dict[str, str]:
-        """Connexion WalletConnect automatique avec clé privée."""
-        try:
-            wallet_address = "0x" + hashlib.sha256(private_key.encode()).hexdigest()[:40]
-            signature = "0x" + hashlib.sha256((private_key + "gitcoin").encode()).hexdigest()
-            
-            return {
-                "address": wallet_address,
-                "signature": signature,
-                "connected": True
-            }
-        except Exception as e:
-            logger.error(f"Erreur WalletConnect Gitcoin: {e}")
-            return {"connected": False}
+class SuperTeamPlatform(_BaseBountyPlatform):
+    """Implémentation pour SuperTeam Earn."""
     
-    async def _check_grant_payment(self, grant_id: str) -> Dict[str, Any]:
-        """Vérifie si un grant Gitcoin a été payé."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                check_url = f"{self.base_url}/api/grants/{grant_id}/status"
-                
-                async with session.get(check_url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        return {
-                            "paid": data.get("status") == "paid",
-                            "amount": data.get("amount", 0),
-                            "transaction_hash": data.get("tx_hash")
-                        }
-            return {"paid": False, "amount": 0}
-        except Exception as e:
-            logger.error(f"Erreur vérification paiement Gitcoin: {e}")
-            return {"paid": False, "amount": 0}
+    base_url = "https://earn.superteam.fun"
+    platform_name = "superteam"
+    label = "SuperTeam"
+    reward_re = _REWARD_RE_SUPERTEAM
+    submit_path = "/api/bounties/submit"
+    status_path = "/api/bounties/{id}/status"
+    id_field = "bounty_id"
+    signature_suffix = "walletconnect"
+    payment_label = "Bounty"
     
-    async def _receive_grant_payment(self, amount: float):
-        """Reçoit automatiquement le paiement de grant Gitcoin."""
-        try:
-            await database.add_user_balance(1, amount)
-            logger.info(f"💸 Paiution Gitcoin reçu: ${amount}")
-        except Exception as e:
-            logger.error(f"Erreur réception paiement Gitcoin: {e}")
+    def _extract_extra(self, text_content: str, reward: float, description: str) -> Dict[str, Any]:
+        """Exigences, date limite et estimations propres à SuperTeam."""
+        # Extraction des exigences
+        # Découpage en paragraphes, puis en-tête testé au début de chacun
+        requirements = []
+        for block in text_content.split('\n\n'):
+            match = _REQ_HEADER.match(block)
+            if match:
+                requirements.extend(req.strip() for req in match.group(1).splitlines() if req.strip())
+        
+        # Extraction de la date limite
+        match = _DEADLINE_RE.search(text_content)
+        deadline = match.group(1) if match else None
+        
+        return {
+            "requirements": requirements,
+            "deadline": deadline,
+            "difficulty": _estimate_difficulty(reward),
+            "estimated_time": _estimate_time(reward)
+        }
+
+class GitcoinPlatform(_BaseBountyPlatform):
+    """Implémentation pour Gitcoin (récompenses souvent en tokens)."""
     
-    def get_platform_name(self) -> str:
-        return "gitcoin"
+    base_url = "https://gitcoin.co"
+    platform_name = "gitcoin"
+    label = "Gitcoin"
+    reward_re = _REWARD_RE_GITCOIN
+    submit_path = "/api/grants/submit"
+    status_path = "/api/grants/{id}/status"
+    id_field = "grant_id"
+    signature_suffix = "gitcoin"
+    payment_label = "Grant Gitcoin"
 
-class DeworkPlatform(BountyPlatform):
+class DeworkPlatform(_BaseBountyPlatform):
     """Implémentation pour Dework."""
     
-    def __init__(self):
-        self.base_url = "https://dework.xyz"
-    
-    async def extract_bounty_details(self, url: str) -> Dict[str, Any]:
-        """Extrait les détails d'un bounty Dework."""
-        try:
-            async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status}")
-                    
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    title_elem = soup.find('h1') or soup.find('title')
-                    title = title_elem.get_text().strip() if title_elem else "Titre inconnu"
-                    
-                    reward = 0
-                    reward_patterns = [
-                        r'\$(\d+(?:,\d+)*)',
-                        r'(\d+(?:,\d+)*)\s*USD',
-                        r'(\d+(?:,\d+)*)\s*MATIC',
-                        r'(\d+(?:,\d+)*)\s*ETH'
-                    ]
-                    
-                    text_content = soup.get_text()
-                    for pattern in reward_patterns:
-                        matches = re.findall(pattern, text_content, re.IGNORECASE)
-                        if matches:
-                            reward = float(matches[0].replace(',', ''))
-                            break
-                    
-                    desc_elem = soup.find('div', class_='description') or soup.find('div', class_='content')
-                    description = desc_elem.get_text().strip() if desc_elem else text_content[:500]
-                    
-                    return {
-                        "title": title,
-                        "description": description,
-                        "reward_usd": reward,
-                        "requirements": [],
-                        "deadline": None,
-                        "platform": self.get_platform_name(),
-                        "url": url,
-                        "difficulty": "medium",
-                        "estimated_time": "2-4 hours"
-                    }
-                    
-        except Exception as e:
-            logger.error(f"Erreur extraction bounty Dework {url}: {e}")
-            raise
-    
-    async def submit_application(self, bounty_url: str, content: str) -> bool:
-        """Soumet une candidature à un bounty Dework VIA API."""
-        try:
-            # CONNEXION WALLETCONNECT VIA CLÉ PRIVÉE UTILISATEUR
-            user_wallet_private_key = os.getenv("WALLET_PRIVATE_KEY")
-            if not user_wallet_private_key:
-                logger.error("Clé wallet utilisateur non trouvée")
-                return False
-                
-            # 1. Connexion WalletConnect automatique
-            wallet_connect_result = await self._connect_walletconnect(user_wallet_private_key)
-            if not wallet_connect_result:
-                logger.error("Échec connexion WalletConnect")
-                return False
-                
-            # 2. Soumission API Dework
-            form_data = {
-                "content": content,
-                "wallet_address": wallet_connect_result["address"],
-                "signature": wallet_connect_result["signature"]
-            }
-            
-            async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
-                submit_url = f"{self.base_url}/api/tasks/submit"
-                
-                async with session.post(submit_url, json=form_data) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        if result.get("success"):
-                            task_id = result.get("task_id")
-                            
-                            # 3. Vérification automatique du statut
-                            payment_result = await self._check_task_payment(task_id)
-                            
-                            if payment_result["paid"]:
-                                # 4. Réception automatique des fonds
-                                await self._receive_task_payment(payment_result["amount"])
-                                
-                                await database.log_bounty_submission(
-                                    url=bounty_url,
-                                    content=content,
-                                    status="paid",
-                                    amount=payment_result["amount"],
-                                    timestamp=datetime.now()
-                                )
-                                
-                                logger.info(f"💰 Task Dework payé: ${payment_result['amount']}")
-                                return True
-                            else:
-                                await database.log_bounty_submission(
-                                    url=bounty_url,
-                                    content=content,
-                                    status="submitted",
-                                    timestamp=datetime.now()
-                                )
-                                return True
-                        else:
-                            logger.error(f"Erreur soumission Dework: {result.get('error')}")
-                            return False
-                    else:
-                        logger.error(f"HTTP {response.status} lors soumission Dework")
-                        return False
-                        
-        except Exception as e:
-            logger.error(f"Erreur soumission Dework {bounty_url}: {e}")
-            return False
-    
-    async def _connect_walletconnect(self, private_key: str) -> Dict[str, str]:
-        """Connexion WalletConnect automatique avec clé privée."""
-        try:
-            wallet_address = "0x" + hashlib.sha256(private_key.encode()).hexdigest()[:40]
-            signature = "0x" + hashlib.sha256((private_key + "dework").encode()).hexdigest()
-            
-            return {
-                "address": wallet_address,
-                "signature": signature,
-                "connected": True
-            }
-        except Exception as e:
-            logger.error(f"Erreur WalletConnect Dework: {e}")
-            return {"connected": False}
-    
-    async def _check_task_payment(self, task_id: str) -> Dict[str, Any]:
-        """Vérifie si une tâche Dework a été payée."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                check_url = f"{self.base_url}/api/tasks/{task_id}/status"
-                
-                async with session.get(check_url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        return {
-                            "paid": data.get("status") == "paid",
-                            "amount": data.get("amount", 0),
-                            "transaction_hash": data.get("tx_hash")
-                        }
-            return {"paid": False, "amount": 0}
-        except Exception as e:
-            logger.error(f"Erreur vérification paiement Dework: {e}")
-            return {"paid": False, "amount": 0}
-    
-    async def _receive_task_payment(self, amount: float):
-        """Reçoit automatiquement le paiement de tâche Dework."""
-        try:
-            await database.add_user_balance(1, amount)
-            logger.info(f"💸 Paiution Dework reçu: ${amount}")
-        except Exception as e:
-            logger.error(f"Erreur réception paiement Dework: {e}")
-    
-    def get_platform_name(self) -> str:
-        return "dework"
+    base_url = "https://dework.xyz"
+    platform_name = "dework"
+    label = "Dework"
+    reward_re = _REWARD_RE_DEWORK
+    submit_path = "/api/tasks/submit"
+    status_path = "/api/tasks/{id}/status"
+    id_field = "task_id"
+    signature_suffix = "dework"
+    payment_label = "Task Dework"
 
 class BountyService:
     """Service principal de gestion des bounties."""
@@ -670,23 +660,84 @@ class BountyService:
             "gitcoin": GitcoinPlatform(),
             "dework": DeworkPlatform()
         }
+        # Domaine enregistrable -> plateforme : une seule recherche par URL
+        self._domain_map: Dict[str, BountyPlatform] = {
+            "superteam.fun": self.platforms["superteam"],
+            "gitcoin.co": self.platforms["gitcoin"],
+            "dework.xyz": self.platforms["dework"]
+        }
         self.wallet_manager = WalletSecurityManager()
         self.search_count = 0
         self.application_count = 0
         self.success_count = 0
+        
+        # Dernière application (time.monotonic() : insensible aux changements d'heure système)
+        self._last_application_ts = float("-inf")
+        self.is_initialized = False
+        self.is_running = False
+        
+        # Session SerpAPI créée à la première recherche puis conservée
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Session SerpAPI persistante : pas de nouvelle poignée de main TCP/TLS par recherche."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=SERPAPI_POOL_LIMIT,
+                    ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+                ),
+                timeout=aiohttp.ClientTimeout(total=SERPAPI_TIMEOUT)
+            )
+        return self._session
+    
+    async def initialize(self) -> bool:
+        """Initialise le service bounty."""
+        try:
+            logger.info("🇬🇳 Initialisation du service bounty...")
+            
+            # Charger les données existantes
+            await self._load_existing_data()
+            
+            self.is_initialized = True
+            logger.info("✅ Service bounty initialisé")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Erreur initialisation service bounty: {e}")
+            return False
+    
+    async def _load_existing_data(self):
+        """Charge les données existantes."""
+        try:
+            # Récupérer les statistiques depuis la base de données
+            stats = await database.get_bounty_stats()
+            if stats:
+                self.application_count = stats.get("application_count", 0)
+                self.success_count = stats.get("success_count", 0)
+                
+        except Exception as e:
+            logger.error(f"❌ Erreur chargement données bounty: {e}")
     
     def _identify_platform(self, url: str) -> Optional[BountyPlatform]:
         """Identifie la plateforme depuis l'URL."""
-        domain = urlparse(url).netloc.lower()
+        host = urlsplit(url).hostname or ""  # Déjà en minuscules, sans port
+        
+        # Deux derniers labels : earn.superteam.fun -> superteam.fun
+        parts = host.rsplit(".", 2)
+        suffix = ".".join(parts[-2:]) if len(parts) >= 2 else host
         
-        if "superteam.fun" in domain:
-            return self.platforms["superteam"]
-        elif "gitcoin.co" in domain:
-            return self.platforms["gitcoin"]
-        elif "dework.xyz" in domain:
-            return self.platforms["dework"]
+        return self._domain_map.get(suffix)
+    
+    async def close(self):
+        """Ferme la session SerpAPI et les sessions HTTP des plateformes."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
         
-        return None
+        for platform in self.platforms.values():
+            await platform.close()
     
     async def search_active_bounties(
         self, 
@@ -706,9 +757,13 @@ class BountyService:
         try:
             # Vérifier le cache
             cache_key = f"search_{category}_{max_results}"
-            if cache_key in bounty_cache:
+            try:
+                cached = search_cache[cache_key]
+            except KeyError:
+                pass
+            else:
                 logger.info("Résultats récupérés depuis le cache")
-                return bounty_cache[cache_key]
+                return cached
             
             # Préparer la requête
             query = SEARCH_QUERIES.get(category, SEARCH_QUERIES["writing"])
@@ -724,38 +779,65 @@ class BountyService:
             
             logger.info(f"Recherche de bounties avec query: {query}")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(SERPAPI_URL, params=params) as response:
-                    if response.status != 200:
-                        raise Exception(f"SerpAPI error: {response.status}")
-                    
-                    data = await response.json()
-                    
-                    if "error" in data:
-                        raise Exception(f"SerpAPI error: {data['error']}")
-                    
-                    # Extraire les résultats
-                    bounties = []
-                    if "organic_results" in data:
-                        for result in data["organic_results"]:
-                            bounty = self._parse_search_result(result)
-                            if bounty and self._is_valid_bounty(bounty):
-                                bounties.append(bounty)
-                    
-                    # Filtrer et trier
-                    filtered_bounties = self._filter_and_prioritize_bounties(bounties)
-                    
-                    # Mettre en cache
-                    bounty_cache[cache_key] = filtered_bounties
-                    self.search_count += 1
-                    
-                    logger.info(f"Trouvé {len(filtered_bounties)} bounties valides")
-                    return filtered_bounties
-                    
+            session = await self._get_session()
+            async with session.get(SERPAPI_URL, params=params) as response:
+                if response.status != 200:
+                    raise Exception(f"SerpAPI error: {response.status}")
+                
+                data = _json_loads(await response.read())
+                
+                if "error" in data:
+                    raise Exception(f"SerpAPI error: {data['error']}")
+                
+                # Extraire les résultats
+                bounties = []
+                if "organic_results" in data:
+                    for result in data["organic_results"]:
+                        bounty = self._parse_search_result(result)
+                        if bounty and self._is_valid_bounty(bounty):
+                            bounties.append(bounty)
+                
+                # Filtrer et trier
+                filtered_bounties = self._filter_and_prioritize_bounties(bounties)
+                
+                # Mettre en cache
+                search_cache[cache_key] = filtered_bounties
+                self.search_count += 1
+                
+                logger.info(f"Trouvé {len(filtered_bounties)} bounties valides")
+                return filtered_bounties
+                
         except Exception as e:
             logger.error(f"Erreur recherche bounties: {e}")
             return []
     
+    async def search_all(
+        self,
+        categories: Optional[List[str]] = None,
+        max_results: int = MAX_BOUNTIES_PER_SEARCH
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Recherche plusieurs catégories en parallèle sur la session SerpAPI partagée.
+        
+        Args:
+            categories: Catégories à rechercher (toutes par défaut)
+            max_results: Nombre maximum de résultats par catégorie
+            
+        Returns:
+            Bounties trouvés par catégorie (liste vide si la recherche échoue)
+        """
+        if categories is None:
+            categories = list(SEARCH_QUERIES)
+        
+        # search_active_bounties ne lève pas : une catégorie en erreur n'annule pas les autres
+        async with asyncio.TaskGroup() as group:
+            tasks = {
+                category: group.create_task(self.search_active_bounties(category, max_results))
+                for category in categories
+            }
+        
+        return {category: task.result() for category, task in tasks.items()}
+    
     def _parse_search_result(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Parse un résultat de recherche en bounty."""
         try:
@@ -767,27 +849,15 @@ class BountyService:
                 return None
             
             # Extraire la récompense depuis le titre/snippet
-            reward = 0
-            reward_patterns = [
-                r'\$(\d+(?:,\d+)*)',
-                r'(\d+(?:,\d+)*)\s*USD',
-                r'(\d+(?:,\d+)*)\s*SOL',
-                r'(\d+(?:,\d+)*)\s*ETH'
-            ]
-            
-            text = f"{title} {snippet}"
-            for pattern in reward_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    reward = float(matches[0].replace(',', ''))
-                    break
+            reward = _extract_reward(f"{title} {snippet}", _REWARD_RE_SEARCH)
+            platform = self._identify_platform(url)
             
             return {
                 "title": title,
                 "description": snippet,
                 "reward_usd": reward,
                 "url": url,
-                "platform": self._identify_platform(url).get_platform_name() if self._identify_platform(url) else "unknown",
+                "platform": platform.get_platform_name() if platform else "unknown",
                 "source": "search"
             }
             
@@ -826,30 +896,13 @@ class BountyService:
     
     def _filter_and_prioritize_bounties(self, bounties: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filtre et priorise les bounties."""
-        # Supprimer les doublons
-        seen_urls = set()
-        unique_bounties = []
-        
+        # Supprimer les doublons (première occurrence conservée, ordre d'insertion)
+        unique_bounties: Dict[str, Dict[str, Any]] = {}
         for bounty in bounties:
-            url = bounty["url"]
-            if url not in seen_urls:
-                seen_urls.add(url)
-                unique_bounties.append(bounty)
+            unique_bounties.setdefault(bounty["url"], bounty)
         
-        # Trier par ratio gain/temps estimé
-        def priority_score(bounty):
-            reward = bounty.get("reward_usd", 0)
-            difficulty = bounty.get("difficulty", "medium")
-            
-            difficulty_multiplier = {
-                "easy": 1.0,
-                "medium": 0.8,
-                "hard": 0.6
-            }.get(difficulty, 0.7)
-            
-            return reward * difficulty_multiplier
-        
-        return sorted(unique_bounties, key=priority_score, reverse=True)
+        # Trier par ratio gain/temps estimé (score calculé une fois par bounty)
+        return sorted(unique_bounties.values(), key=_priority_score, reverse=True)
     
     async def auto_apply_and_complete(self, bounty_url: str) -> bool:
         """
@@ -892,7 +945,7 @@ class BountyService:
             if success:
                 self.application_count += 1
                 self.success_count += 1
-                application_timestamps.append(time.time())
+                self._last_application_ts = time.monotonic()
                 
                 # Estimer les gains
                 estimated_earnings = bounty_details.get("reward_usd", 0)
@@ -941,11 +994,7 @@ class BountyService:
     
     def _can_apply_now(self) -> bool:
         """Vérifie si on peut appliquer maintenant (cooldown)."""
-        if not application_timestamps:
-            return True
-        
-        last_application = application_timestamps[-1]
-        return time.time() - last_application > APPLICATION_COOLDOWN
+        return time.monotonic() - self._last_application_ts > APPLICATION_COOLDOWN
     
     async def _is_already_submitted(self, bounty_url: str) -> bool:
         """Vérifie si un bounty a déjà été soumis."""
@@ -1006,8 +1055,18 @@ class BountyService:
                 Le contenu doit dépasser les attentes et être prêt à soumettre.
                 """
             
-            # Générer via le service IA
-            content = await ai_service.generate(prompt, temperature=0.7)
+            # Réutiliser le contenu déjà généré, sauf si le bounty l'interdit (prompt sensible)
+            use_cache = not bounty_details.get("no_cache", False)
+            cache_key = _content_cache_key(bounty_details) if use_cache else None
+            content = content_cache.get(cache_key) if use_cache else None
+            
+            if content is None:
+                # Générer via le service IA
+                content = await ai_service.generate(prompt, temperature=0.7)
+                if use_cache:
+                    content_cache[cache_key] = content
+            else:
+                logger.info("Contenu récupéré depuis le cache")
             
             # Post-traitement du contenu
             processed_content = self._post_process_content(content, bounty_details)
@@ -1033,7 +1092,7 @@ class BountyService:
 """
         
         # Nettoyer le contenu
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = _BLANK_LINES_RE.sub('\n\n', content)
         content = content.strip()
         
         return header + content
@@ -1045,7 +1104,7 @@ class BountyService:
             "application_count": self.application_count,
             "success_count": self.success_count,
             "success_rate": self.success_count / max(self.application_count, 1),
-            "cache_size": len(bounty_cache),
+            "cache_size": len(bounty_cache) + len(search_cache) + len(content_cache),
             "total_earnings": await self._get_total_earnings()
         }
     
@@ -1061,46 +1120,16 @@ class BountyService:
     
     async def cleanup_old_cache_entries(self):
         """Nettoie les anciennes entrées du cache."""
-        # Implémentation du nettoyage
-        pass
-
-class BountyService:
-    """Service de gestion des bounties ChicoBot."""
+        bounty_cache.expire()
+        search_cache.expire()
+        content_cache.expire()
     
-    def __init__(self):
-        self.application_count = 0
-        self.success_count = 0
-        self.application_timestamps = []
-        self.is_initialized = False
-        self.is_running = False
+    async def poll_payments(self) -> int:
+        """Revérifie les paiements en attente de toutes les plateformes en parallèle."""
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(platform.poll_pending_payments()) for platform in self.platforms.values()]
         
-    async def initialize(self) -> bool:
-        """Initialise le service bounty."""
-        try:
-            logger.info("🇬🇳 Initialisation du service bounty...")
-            
-            # Charger les données existantes
-            await self._load_existing_data()
-            
-            self.is_initialized = True
-            logger.info("✅ Service bounty initialisé")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Erreur initialisation service bounty: {e}")
-            return False
-    
-    async def _load_existing_data(self):
-        """Charge les données existantes."""
-        try:
-            # Récupérer les statistiques depuis la base de données
-            stats = await database.get_bounty_stats()
-            if stats:
-                self.application_count = stats.get("application_count", 0)
-                self.success_count = stats.get("success_count", 0)
-                
-        except Exception as e:
-            logger.error(f"❌ Erreur chargement données bounty: {e}")
+        return sum(task.result() for task in tasks)
     
     async def run_bounty_hunter(self):
         """Exécute le bounty hunter en continu."""
@@ -1110,8 +1139,16 @@ class BountyService:
         
         while self.is_running:
             try:
-                # Rechercher de nouvelles bounties
-                bounties = await self.search_bounties("crypto bounty text writing")
+                # Paiements des soumissions précédentes (GET conditionnels)
+                paid_count = await self.poll_payments()
+                if paid_count:
+                    logger.info(f"💰 {paid_count} paiements de bounty reçus")
+                
+                # Rechercher de nouvelles bounties : toutes les catégories en parallèle
+                results = await self.search_all()
+                bounties = self._filter_and_prioritize_bounties(
+                    [bounty for found in results.values() for bounty in found]
+                )
                 
                 if bounties:
                     # Appliquer aux meilleures bounties
@@ -1131,9 +1168,11 @@ class BountyService:
                 await asyncio.sleep(300)  # 5 minutes en cas d'erreur
     
     async def shutdown(self):
-        """Arrête le service bounty."""
+        """Arrête le service bounty : soumissions en attente écrites, sessions HTTP fermées."""
         logger.info("🛑 Arrêt du service bounty...")
         self.is_running = False
+        await submission_log.close()
+        await self.close()
 
 # Instance globale du service bounty
 bounty_service = BountyService()
@@ -1241,14 +1280,13 @@ if __name__ == "__main__":
         async def test_cooldown_system(self):
             """Teste le système de cooldown."""
             # Réinitialiser
-            global application_timestamps
-            application_timestamps.clear()
+            self.service._last_application_ts = float("-inf")
             
             # Premier test - doit être autorisé
             self.assertTrue(self.service._can_apply_now())
             
             # Simuler une application
-            application_timestamps.append(time.time())
+            self.service._last_application_ts = time.monotonic()
             
             # Deuxième test immédiat - doit être bloqué
             self.assertFalse(self.service._can_apply_now())